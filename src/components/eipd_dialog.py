@@ -12,6 +12,7 @@ from PySide6.QtCore import Qt, QTimer
 
 from src.components.generic_form_dialog import GenericFormDialog
 from src.components.custom_inputs import CheckableComboBox
+from src.services.catalog_lookup_service import CatalogLookupService
 from src.workers.api_worker import ApiWorker
 
 
@@ -29,9 +30,10 @@ class EipdDialog(GenericFormDialog):
         client = ApiClient()
         self.eipd_estado = "BORRADOR"
         self._is_admin_user = client.is_admin
+        # Ámbitos con su etiqueta de nivel ya conectada (las secciones se construyen por paso)
+        self._niveles_bound = set()
 
         super().__init__(str(config_path), parent=parent, record_id=target_id)
-        self._catalog_label_cache = {}
 
         # Nivel en tiempo real (Section 1 labels)
         QTimer.singleShot(100, self._bind_niveles_en_tiempo_real)
@@ -51,6 +53,12 @@ class EipdDialog(GenericFormDialog):
         last_idx = self.stack.count() - 1
         self._rebuild_footer(last_idx, is_last=True)
 
+    def _on_section_built(self, index, keys):
+        super()._on_section_built(index, keys)
+        self._bind_niveles_en_tiempo_real()
+        if self.eipd_estado in ["ENVIADO", "APROBADO", "RECHAZADO"]:
+            self._lock_form()
+
     def _lock_form(self):
         for w in self.inputs.values():
             if hasattr(w, "set_read_only"):
@@ -254,8 +262,9 @@ class EipdDialog(GenericFormDialog):
             prob = self.inputs.get(prob_key)
             impact = self.inputs.get(impact_key)
 
-            if not prob or not impact:
+            if not prob or not impact or prefix in self._niveles_bound:
                 continue
+            self._niveles_bound.add(prefix)
 
             nivel_label = QLabel("Nivel: -", self)
             nivel_label.setStyleSheet("""
@@ -293,23 +302,10 @@ class EipdDialog(GenericFormDialog):
     # Apply RAT data (SIN ROMPER NADA)
     # ------------------------------------------------------------------
     def _get_catalog_labels(self, endpoint: str, cache_key: str) -> dict[str, str]:
-        cache_id = f"{endpoint}::{cache_key}"
-        if cache_id in self._catalog_label_cache:
-            return self._catalog_label_cache[cache_id]
-
-        labels = {}
         try:
-            rows = self.catalogo_service.get_catalogo(endpoint, cache_key) or []
-            labels = {
-                str(item.get("id")): item.get("nombre", "")
-                for item in rows
-                if item.get("id") is not None
-            }
+            return CatalogLookupService().lookup(endpoint, cache_key).labels
         except Exception:
-            labels = {}
-
-        self._catalog_label_cache[cache_id] = labels
-        return labels
+            return {}
 
     def _map_catalog_values(self, values, endpoint: str, cache_key: str):
         labels = self._get_catalog_labels(endpoint, cache_key)
@@ -443,6 +439,9 @@ class EipdDialog(GenericFormDialog):
         return rat.get(rat_key)
 
     def _apply_rat_data(self, rat: dict):
+        # Los campos del RAT se escriben en los widgets de todas las secciones
+        self._build_all_sections()
+
         readonly_keys = {
             "marco_normativo_rat",
             "descripcion_general",
@@ -1,5 +1,6 @@
 import json
 import os
+from collections.abc import Mapping
 from functools import partial
 
 from PySide6.QtWidgets import (
@@ -16,7 +17,9 @@ from src.core.api_client import ApiClient
 from src.components.alert_dialog import AlertDialog
 from src.components.wizard_sidebar import WizardSidebar
 from src.components.loading_overlay import LoadingOverlay
-from src.services.catalogo_service import CatalogoService
+from src.services.catalogo_service import CatalogoService, CatalogoEvents
+from src.services.catalog_lookup_service import CatalogLookup
+from src.services.config_registry import ConfigRegistry
 from src.workers.combo_loader import ComboLoaderRunnable
 from src.workers.api_worker import ApiWorker
 from src.services.logger_service import LoggerService
@@ -393,12 +396,15 @@ class EditableTableWidget(QWidget):
                     inp.setReadOnly(read_only)
 
 class GenericFormDialog(QDialog):
+    # Pausa entre secciones construidas en segundo plano (deja pasar eventos de UI)
+    LAZY_BUILD_INTERVAL_MS = 30
+
     def __init__(self, config_path, parent=None, record_id=None):
         super().__init__(parent)
         
-        # Load Config
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # Load Config (compilada una vez por proceso y compartida, de solo lectura)
+        self.config_path = config_path
+        self._set_compiled_config(ConfigRegistry().form(config_path))
 
         self.record_id = record_id
         self.is_edit = record_id is not None
@@ -413,6 +419,9 @@ class GenericFormDialog(QDialog):
         self._allow_asset_reapply = self.is_edit
         self.is_setting_values = False
         self._raw_asset_data = None # Store virgin API response
+        # cache_key -> [(combo, handler)] para refrescar combos si el catálogo se revalida
+        self._catalog_combos = {}
+        CatalogoEvents().catalogo_updated.connect(self._on_catalog_refreshed)
 
         # UI Setup
         self.setObjectName("genericFormDialog")
@@ -442,16 +451,24 @@ class GenericFormDialog(QDialog):
         
         # Inputs Registry: key -> widget
         self.inputs = {}
-        # Dependency Map: trigger_key -> [dependent_keys]
-        self.dependencies = {}
-        # Dependency Config: key -> config
-        # ... dependency map initialization ...
-        self.visibility_map = {} # source_key -> list of {target_block, rule, key}
-        self.dependency_configs = {}
         self.labels = {}  # Registry for field labels
         self.blocks = {}  # Registry for field block containers (QFrame)
         self.footer_layouts = {} # index -> QHBoxLayout
 
+        # Construcción diferida: solo el primer paso se arma al abrir; el resto
+        # al mostrarse su paso o en tiempo ocioso. índice -> (página provisoria, título)
+        self._lazy_sections = {}
+        self._lazy_build_timer = QTimer(self)
+        self._lazy_build_timer.setSingleShot(True)
+        self._lazy_build_timer.setInterval(self.LAZY_BUILD_INTERVAL_MS)
+        self._lazy_build_timer.timeout.connect(self._build_next_lazy_section)
+        # Valores conocidos de los campos (registro cargado): fuente para las
+        # secciones que todavía no tienen widgets
+        self.value_store = {}
+        self._catalog_data = {}   # key -> ítems del catálogo del combo (construido o no)
+        self._catalog_keys = {}   # key -> cache_key del catálogo
+        self._visibility_connected = {}  # source_key -> widget ya conectado
+
         self._init_ui()
         
         # Async Load
@@ -461,6 +478,20 @@ class GenericFormDialog(QDialog):
         title_log = self.config.get("title_edit", "Editar") if self.is_edit else self.config.get("title_new", "Nuevo")
         LoggerService().log_event(f"Abriendo formulario genérico: {title_log}")
 
+    def _set_compiled_config(self, compiled):
+        """
+        Config compilada en uso. Los grafos de dependencias y de visibilidad
+        vienen precalculados de ConfigRegistry; el diálogo solo los lee.
+        """
+        self.compiled_config = compiled
+        self.config = compiled.data
+        # Dependency Map: trigger_key -> (dependent_keys)
+        self.dependencies = compiled.triggers
+        # Dependency Config: key -> config del campo con depends_on
+        self.dependency_configs = compiled.dependency_configs
+        # Visibility Map: source_key -> (keys con visible_when sobre ese origen)
+        self.visibility_map = compiled.visibility_graph
+
     def _init_ui(self):
         # Layout principal (Vertical: Top Header + Body)
         # Body (Horizontal: Sidebar | Content)
@@ -567,27 +598,100 @@ class GenericFormDialog(QDialog):
         # The Stack
         self.stack = QStackedWidget()
         
+        # Solo el primer paso se construye ahora; los demás quedan diferidos
         for i, section in enumerate(sections_config):
-            content_widget = self._build_section_form(section)
-            
-            page = self._wrap_step_content(
-                content_widget,
-                section["title"],
-                section.get("description", ""),
-                i,
-                len(sections_config)
-            )
-            self.stack.addWidget(page)
-            
+            self._add_section_page(i, section, section["title"], lazy=i > 0)
+
         content_layout.addWidget(self.stack)
         
-        # Setup visibility connections after all fields are created
+        # Setup visibility connections after the first step fields are created
         self._setup_visibility_connections()
         
         body_layout.addWidget(content_frame, 1) # Stretch Content
         
         main_layout.addLayout(body_layout, 1)
 
+    # ===============================
+    # Construcción diferida de secciones
+    # ===============================
+    def _add_section_page(self, index, section, title, lazy=True):
+        """Agrega la página del paso al final del stack; si es diferida, con un widget provisorio."""
+        if not lazy:
+            self.stack.addWidget(self._build_section_page(index, section, title))
+            return
+        placeholder = QWidget()
+        self._lazy_sections[index] = (placeholder, title)
+        # Un footer previo en este índice (secciones ya quitadas) quedó huérfano
+        self.footer_layouts.pop(index, None)
+        self.stack.addWidget(placeholder)
+
+    def _build_section_page(self, index, section, title):
+        content_widget = self._build_section_form(section)
+        return self._wrap_step_content(
+            content_widget,
+            title,
+            section.get("description", ""),
+            index,
+            len(self.config.get("sections", []))
+        )
+
+    def _ensure_section_built(self, index):
+        """Construye la sección del paso index si aún está diferida."""
+        entry = self._lazy_sections.pop(index, None)
+        if entry is None:
+            return
+        placeholder, title = entry
+        section = self.config["sections"][index]
+
+        keys_before = set(self.inputs)
+        current = self.stack.currentIndex()
+        page = self._build_section_page(index, section, title)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.setCurrentIndex(current)
+
+        new_keys = [key for key in self.inputs if key not in keys_before]
+        self._on_section_built(index, new_keys)
+
+    def _on_section_built(self, index, keys):
+        """
+        Deja una sección recién construida como si hubiese existido desde el
+        inicio: catálogos ya descargados, valores del registro, combos
+        dependientes y reglas de visibilidad.
+        """
+        for key in keys:
+            self._populate_field_catalog(key)
+
+        self._try_set_values(keys)
+
+        # Combos dependientes cuyo disparador está en una sección ya construida
+        for trigger_key, dependents in list(self.dependencies.items()):
+            trigger_widget = self.inputs.get(trigger_key)
+            if trigger_key in keys or not isinstance(trigger_widget, QComboBox):
+                continue
+            if any(dep_key in keys for dep_key in dependents):
+                self._on_trigger_changed(trigger_key, trigger_widget.currentIndex())
+
+        self._setup_visibility_connections()
+        self._validate_steps_progress()
+
+    def _build_all_sections(self):
+        """Construye las secciones pendientes (antes de leer todo el formulario desde los widgets)."""
+        self._lazy_build_timer.stop()
+        for index in sorted(self._lazy_sections):
+            self._ensure_section_built(index)
+
+    def _schedule_lazy_build(self):
+        if self._lazy_sections and not self._lazy_build_timer.isActive():
+            self._lazy_build_timer.start()
+
+    def _build_next_lazy_section(self):
+        # Una sección por vez para no bloquear la interfaz
+        if self._lazy_sections:
+            self._ensure_section_built(min(self._lazy_sections))
+        self._schedule_lazy_build()
+
     def _build_section_form(self, section_config):
         w = QWidget()
         layout = QVBoxLayout(w)
@@ -712,8 +816,7 @@ class GenericFormDialog(QDialog):
             self.inputs[key] = widget
 
             # Dependency & Signals
-            if "triggers_reload" in field:
-                self.dependencies[key] = field["triggers_reload"]
+            if key in self.dependencies:
                 if isinstance(widget, QComboBox):
                     # For CheckableComboBox, use selectionChanged
                     if hasattr(widget, "selectionChanged"):
@@ -725,9 +828,6 @@ class GenericFormDialog(QDialog):
                             partial(self._on_trigger_changed, key)
                         )
 
-            if "depends_on" in field:
-                self.dependency_configs[key] = field
-
             # Navigation & Validation
             if isinstance(widget, QLineEdit):
                 widget.textChanged.connect(self._validate_steps_progress)
@@ -772,19 +872,9 @@ class GenericFormDialog(QDialog):
 
             block_layout.addWidget(widget)
 
-            # visible_when: conditional visibility from JSON config
-            vis_rule = field.get("visible_when")
-            if vis_rule:
-                source_key = vis_rule.get("field")
-                if source_key:
-                    field_block.setVisible(False)  # hidden by default — shown by visibility engine
-                    if source_key not in self.visibility_map:
-                        self.visibility_map[source_key] = []
-                    self.visibility_map[source_key].append({
-                        "target_block": field_block,
-                        "rule": vis_rule,
-                        "key": key
-                    })
+            # visible_when: conditional visibility from JSON config (ver visibility_map)
+            if key in self.compiled_config.visibility_rules:
+                field_block.setVisible(False)  # hidden by default — shown by visibility engine
 
             layout.addWidget(field_block)
 
@@ -796,10 +886,13 @@ class GenericFormDialog(QDialog):
     
 
     def _setup_visibility_connections(self):
-        for source_key in self.visibility_map.keys():
-            if source_key in self.inputs:
-                self._connect_visibility_trigger(source_key, self.inputs[source_key])
-                self._check_visibility(source_key)
+        # Se llama de nuevo al construir cada sección: conecta cada origen una sola vez
+        for source_key in list(self.visibility_map.keys()):
+            widget = self.inputs.get(source_key)
+            if widget is not None and self._visibility_connected.get(source_key) is not widget:
+                self._visibility_connected[source_key] = widget
+                self._connect_visibility_trigger(source_key, widget)
+            self._check_visibility(source_key)
         
         # DIRECT CONNECTIONS: For CheckableComboBox sources, add an additional
         # direct handler that bypasses _check_visibility entirely. This guarantees
@@ -811,25 +904,25 @@ class GenericFormDialog(QDialog):
         For every CheckableComboBox that is a source of a visibility rule
         ('contains' match), create a DIRECT signal → setVisible() connection.
         This is a fail-safe that works independently of _check_visibility.
+        The rules are read from visibility_map on every call, so targets built
+        later (deferred sections) are covered by the same handler.
         """
-        for source_key, deps_list in self.visibility_map.items():
+        if not hasattr(self, '_direct_visibility_handlers'):
+            self._direct_visibility_handlers = {}
+            self._direct_visibility_widgets = {}
+
+        for source_key in list(self.visibility_map.keys()):
             widget = self.inputs.get(source_key)
             # Only for CheckableComboBox (not RadioComboBox)
             if not isinstance(widget, CheckableComboBox) or isinstance(widget, RadioComboBox):
                 continue
-
-            # Collect (target_block, rule_text) pairs that use 'contains'
-            block_rules = []
-            for dep in deps_list:
-                contains_val = dep["rule"].get("contains", "")
-                if contains_val and dep.get("target_block"):
-                    block_rules.append((dep["target_block"], contains_val.strip().lower()))
-
-            if not block_rules:
+            if self._direct_visibility_widgets.get(source_key) is widget:
+                continue
+            if not self._contains_block_rules(source_key):
                 continue
 
-            # Create a closure that captures the widget and block_rules
-            def make_direct_handler(combo_widget, rules, src_key):
+            # Create a closure that captures the widget
+            def make_direct_handler(combo_widget, src_key):
                 def _direct_handler():
                     texts = []
                     try:
@@ -839,7 +932,7 @@ class GenericFormDialog(QDialog):
                         return
                     LoggerService().log_event(f"[DIRECT VIS] '{src_key}' fired texts={texts}")
                     changed = False
-                    for target_blk, rule_text in rules:
+                    for target_blk, rule_text in self._contains_block_rules(src_key):
                         try:
                             matched = any(rule_text in t for t in texts)
                             LoggerService().log_event(f"[DIRECT VIS] rule='{rule_text}' match={matched}")
@@ -853,12 +946,28 @@ class GenericFormDialog(QDialog):
                         self._force_layout_update()
                 return _direct_handler
 
-            handler = make_direct_handler(widget, block_rules, source_key)
+            handler = make_direct_handler(widget, source_key)
             LoggerService().log_event(f"[DIRECT VIS] Registered handler for '{source_key}'")
             widget.selectionChanged.connect(handler)
-            if not hasattr(self, '_direct_visibility_handlers'):
-                self._direct_visibility_handlers = {}
             self._direct_visibility_handlers[source_key] = handler
+            self._direct_visibility_widgets[source_key] = widget
+
+    def _visibility_targets(self, source_key):
+        """(key, bloque) de los campos con visible_when sobre source_key que ya tienen bloque construido."""
+        return [
+            (key, self.blocks[key])
+            for key in self.visibility_map.get(source_key, ())
+            if key in self.blocks
+        ]
+
+    def _contains_block_rules(self, source_key):
+        """(target_block, texto) de las reglas 'contains' de un origen con bloque construido."""
+        block_rules = []
+        for key, target_block in self._visibility_targets(source_key):
+            contains_val = self.compiled_config.visibility_rules[key].get("contains", "")
+            if contains_val:
+                block_rules.append((target_block, contains_val.strip().lower()))
+        return block_rules
 
     def _apply_all_direct_visibility(self):
         """
@@ -921,83 +1030,34 @@ class GenericFormDialog(QDialog):
 
     def _check_visibility(self, source_key):
         LoggerService().log_event(f"EVENT: Checking visibility triggered by {source_key}")
-        if source_key not in self.visibility_map: return
-        
-        # Verify inputs integrity
-        if source_key not in self.inputs: return
+        targets = self._visibility_targets(source_key)
+        if not targets: return
 
         source_widget = self.inputs.get(source_key)
-        if not source_widget: return
-        
+        if not source_widget:
+            # Origen en una sección aún no construida: se evalúa con value_store
+            self._check_stored_visibility(source_key)
+            return
+
         try:
-            # Get value
-            val = None
-            is_checkable = isinstance(source_widget, CheckableComboBox) or source_widget.__class__.__name__ == "CheckableComboBox"
+            val, display_texts = self._widget_rule_inputs(source_widget)
 
-            if is_checkable:
-                 val = source_widget.currentData()
-            elif isinstance(source_widget, QComboBox):
-                 val = source_widget.currentData()
-            elif isinstance(source_widget, QLineEdit):
-                 val = source_widget.text()
-
-            deps = self.visibility_map[source_key]
-            for dep in deps:
-                rule = dep["rule"]
-                target_block = dep["target_block"]
-                
-                # Check target block existence
-                if not target_block: continue
+            for target_key, target_block in targets:
+                rule = self.compiled_config.visibility_rules[target_key]
 
                 # Check condition
-                match = False
-                req_val = rule.get("value")
-                contains_val = rule.get("contains")
+                match = self._visibility_rule_matches(rule, val, display_texts)
+                LoggerService().log_event(f"VISIBILITY DEBUG: Field '{source_key}' rule {rule} Text:{display_texts} Val:{val} -> MATCH={match}")
                 
-                if contains_val:
-                    # Universal "contains" check
-                    rule_text = str(contains_val).strip().lower()
-                    
-                    # 1. Check texts (display labels)
-                    display_texts = []
-                    if hasattr(source_widget, "get_selected_texts"):
-                        display_texts = [t.strip().lower() for t in source_widget.get_selected_texts()]
-                    elif hasattr(source_widget, "currentText"):
-                        display_texts = [source_widget.currentText().strip().lower()]
-                    
-                    found_in_text = any(rule_text in t for t in display_texts)
-                    LoggerService().log_event(f"VISIBILITY MATCH for '{source_key}': Rule '{rule_text}' vs '{display_texts}' -> {found_in_text}")
-                    
-                    # 2. Check value (IDs)
-                    val_str = str(val).lower()
-                    found_in_val = rule_text in val_str
-                    
-                    match = found_in_text or found_in_val
-                    LoggerService().log_event(f"VISIBILITY DEBUG: Field '{source_key}' contains '{rule_text}'? Text:{display_texts} Val:{val} -> MATCH={match}")
+                was_visible = target_block.isVisible()
+                target_block.setVisible(match)
+                if match != was_visible:
+                    self._force_layout_update()
                 
-                elif req_val is not None:
-                    if isinstance(val, list): # Checkable returns list
-                         if str(req_val) in [str(v) for v in val]: match = True
-                    else:
-                         if str(val) == str(req_val): match = True
-                
-                if target_block:
-                    was_visible = target_block.isVisible()
-                    target_block.setVisible(match)
-                    if match != was_visible:
-                        self._force_layout_update()
-                    
-                    # CASCADE: If visibility changed, anything depending on THIS field must be re-checked
-                    # Find the key for the widget in this block
-                    target_key = None
-                    for k, b in self.blocks.items():
-                        if b == target_block:
-                            target_key = k
-                            break
-                    
-                    if target_key and target_key in self.visibility_map:
-                         LoggerService().log_event(f"CASCADE TRIGGER: Re-checking {target_key}")
-                         self._check_visibility(target_key)
+                # CASCADE: If visibility changed, anything depending on THIS field must be re-checked
+                if target_key in self.visibility_map:
+                     LoggerService().log_event(f"CASCADE TRIGGER: Re-checking {target_key}")
+                     self._check_visibility(target_key)
                 
             # Retrigger validation because required fields might have appeared/disappeared
             self._validate_steps_progress()
@@ -1005,6 +1065,79 @@ class GenericFormDialog(QDialog):
         except RuntimeError:
             return  # Object deleted
 
+    def _check_stored_visibility(self, source_key):
+        val, display_texts = self._stored_rule_inputs(source_key)
+        for target_key, target_block in self._visibility_targets(source_key):
+            rule = self.compiled_config.visibility_rules[target_key]
+            try:
+                target_block.setVisible(self._visibility_rule_matches(rule, val, display_texts))
+            except RuntimeError:
+                continue
+            if target_key in self.visibility_map:
+                self._check_visibility(target_key)
+        self._validate_steps_progress()
+
+    def _visibility_rule_matches(self, rule, val, display_texts):
+        """Evalúa una regla visible_when contra el valor (ids) y los textos visibles del origen."""
+        contains_val = rule.get("contains")
+        req_val = rule.get("value")
+
+        if contains_val:
+            # Universal "contains" check: display labels or value (IDs)
+            rule_text = str(contains_val).strip().lower()
+            found_in_text = any(rule_text in t for t in display_texts)
+            return found_in_text or rule_text in str(val).lower()
+
+        if req_val is not None:
+            if isinstance(val, list): # Checkable returns list
+                return str(req_val) in [str(v) for v in val]
+            return str(val) == str(req_val)
+        return False
+
+    def _widget_rule_inputs(self, widget):
+        """(valor, textos visibles en minúsculas) de un widget origen de visibilidad."""
+        val = None
+        if isinstance(widget, QComboBox):
+            val = widget.currentData()
+        elif isinstance(widget, QLineEdit):
+            val = widget.text()
+
+        display_texts = []
+        if hasattr(widget, "get_selected_texts"):
+            display_texts = [t.strip().lower() for t in widget.get_selected_texts()]
+        elif hasattr(widget, "currentText"):
+            display_texts = [widget.currentText().strip().lower()]
+        return val, display_texts
+
+    def _stored_rule_inputs(self, key):
+        """Igual que _widget_rule_inputs para un campo sin widget: value_store y catálogo/opciones."""
+        values = self._as_value_list(self.value_store.get(key))
+        labels = self._field_option_labels(key)
+        display_texts = [str(labels[str(v)]).strip().lower() for v in values if str(v) in labels]
+        return values, display_texts
+
+    def _as_value_list(self, value):
+        # Los multiselección pueden venir como lista o como JSON en texto
+        if value is None:
+            return []
+        if isinstance(value, str) and value.strip().startswith("["):
+            try:
+                value = json.loads(value)
+            except Exception:
+                pass
+        return value if isinstance(value, list) else [value]
+
+    def _field_option_labels(self, key):
+        """id (texto) -> nombre de las opciones de un combo, estáticas o de su catálogo."""
+        field = self.compiled_config.field_map.get(key) or {}
+        rows = field.get("options") or self._catalog_data.get(key) or []
+        if isinstance(rows, Mapping):
+            rows = rows.get("items", [])
+        return {
+            str(row.get("id")): row.get("nombre") or row.get("descripcion") or row.get("label") or ""
+            for row in rows if isinstance(row, Mapping)
+        }
+
     def _recheck_all_visibility(self):
         """
         Fire _check_visibility for every field that is registered as a visibility
@@ -1141,43 +1274,11 @@ class GenericFormDialog(QDialog):
         global_filled = 0
         global_total = 0
         
-        for i, section in enumerate(sections):
-            total_req = 0
-            filled_req = 0
-            
-            # Identify the page widget for this section to check relative visibility
-            page_widget = self.stack.widget(i)
-            
-            def process_fields(field_list):
-                nonlocal total_req, filled_req
-                for field in field_list:
-                    if field.get("type") == "group":
-                        process_fields(field.get("fields", []))
-                        continue
-
-                    if field.get("required", False):
-                        key = field["key"]
-                        widget = self.inputs.get(key)
-                        
-                        try:
-                            # Check visibility relative to the page (handling hidden tabs)
-                            not_visible = False
-                            if not widget or not page_widget:
-                                not_visible = True
-                            elif not widget.isVisibleTo(page_widget):
-                                not_visible = True
-                                
-                            if not_visible:
-                                 continue
-        
-                            total_req += 1
-                            if self._is_field_filled(widget, field):
-                                filled_req += 1
-                        except RuntimeError:
-                            continue
-
-            process_fields(section.get("fields", []))
-            
+        for i in range(len(sections)):
+            status = self._section_required_status(i)
+            total_req = len(status)
+            filled_req = sum(1 for _, filled in status if filled)
+
             # Update Sidebar Step
             if i < len(self.sidebar.step_widgets):
                 try:
@@ -1229,34 +1330,60 @@ class GenericFormDialog(QDialog):
         
         for i, section in enumerate(sections):
             section_title = section.get("title", f"Sección {i+1}")
-            page_widget = self.stack.widget(i)
-            
-            def check_fields(field_list):
-                for field in field_list:
-                    if field.get("type") == "group":
-                        check_fields(field.get("fields", []))
-                        continue
-
-                    if field.get("required", False):
-                        key = field["key"]
-                        widget = self.inputs.get(key)
-                        label = field.get("label", key)
-                        
-                        try:
-                            # Only validate if the field is visible (logic-driven visibility)
-                            if not widget or not page_widget:
-                                continue
-                            if not widget.isVisibleTo(page_widget):
-                                continue
-                                
-                            if not self._is_field_filled(widget, field):
-                                missing.append(f"- {label} ({section_title})")
-                        except RuntimeError:
-                            continue
-
-            check_fields(section.get("fields", []))
+            for field, filled in self._section_required_status(i):
+                if not filled:
+                    label = field.get("label", field["key"])
+                    missing.append(f"- {label} ({section_title})")
         return missing
 
+    def _required_fields(self, index):
+        """Configs de los campos requeridos de una sección (según required_by_section)."""
+        compiled = self.compiled_config
+        return [compiled.field_map[key] for key in compiled.required_by_section[index]]
+
+    def _section_required_status(self, index):
+        """
+        [(field, lleno)] de los campos requeridos visibles de una sección. Las
+        secciones construidas se leen de sus widgets; las diferidas, de las
+        reglas compiladas (visibility_rules) y de value_store.
+        """
+        status = []
+        if index in self._lazy_sections:
+            for field in self._required_fields(index):
+                if self._stored_field_visible(field["key"]):
+                    value = self.value_store.get(field["key"])
+                    filled = any(not self._is_missing_value(v) for v in self._as_value_list(value))
+                    status.append((field, filled))
+            return status
+
+        # Check visibility relative to the page (handling hidden tabs)
+        page_widget = self.stack.widget(index)
+        for field in self._required_fields(index):
+            widget = self.inputs.get(field["key"])
+            try:
+                if not widget or not page_widget or not widget.isVisibleTo(page_widget):
+                    continue
+                status.append((field, self._is_field_filled(widget, field)))
+            except RuntimeError:
+                continue
+        return status
+
+    def _stored_field_visible(self, key):
+        """visible_when de un campo sin widget, evaluado contra su origen (widget o value_store)."""
+        rule = self.compiled_config.visibility_rules.get(key)
+        if rule is None:
+            return True
+        source_key = rule["field"]
+        source_widget = self.inputs.get(source_key)
+        try:
+            if source_widget is not None:
+                val, display_texts = self._widget_rule_inputs(source_widget)
+            else:
+                val, display_texts = self._stored_rule_inputs(source_key)
+        except RuntimeError:
+            return False
+        return self._visibility_rule_matches(rule, val, display_texts)
+
     def _is_field_filled(self, widget, field):
         if not widget: return False
         
@@ -1472,7 +1599,7 @@ class GenericFormDialog(QDialog):
             # stored as a single UUID string → json.loads() failed → setCurrentData([])
             # → nothing checked → selectionChanged not triggered → textbox stayed hidden.
             field_cfg = sub_widget.property("field_config") if sub_widget else None
-            is_multiple = field_cfg.get("multiple", False) if isinstance(field_cfg, dict) else False
+            is_multiple = field_cfg.get("multiple", False) if isinstance(field_cfg, Mapping) else False
             # Also treat any CheckableComboBox as multiple by definition
             if sub_widget and isinstance(sub_widget, CheckableComboBox) and not isinstance(sub_widget, RadioComboBox):
                 is_multiple = True
@@ -1495,15 +1622,29 @@ class GenericFormDialog(QDialog):
             self.loading_overlay.hide_loading()
             # Initial validation for "New" mode (might be 0/X)
             self._validate_steps_progress()
+            # Con la carga inicial terminada, las demás secciones se arman en segundo plano
+            self._schedule_lazy_build()
 
-    def _try_set_values(self):
-        if not self.asset_data or self.is_setting_values:
+    def _try_set_values(self, keys=None):
+        """
+        Aplica los valores del registro a los widgets. Sin keys recorre todo lo
+        construido y deja los valores en value_store; con keys solo aplica esos
+        campos (sección recién construida).
+        """
+        if self.is_setting_values:
+            return
+        if keys is None and not self.asset_data:
+            return
+        if keys is not None and not self.value_store:
             return
             
         self.is_setting_values = True
         try:
-            # --- Hierarchical Categories Unflattening (Activos & RAT) ---
-            self._unflatten_hierarchical_categories()
+            if keys is None:
+                # --- Hierarchical Categories Unflattening (Activos & RAT) ---
+                self._unflatten_hierarchical_categories()
+                # Las secciones que se construyan después toman sus valores de aquí
+                self.value_store.update(self.asset_data)
 
             # Special first pass: Trigger fields
             # If we have dependencies, we might need to load them first.
@@ -1513,7 +1654,8 @@ class GenericFormDialog(QDialog):
             # Use a snapshot to avoid "dictionary changed size during iteration"
             # when signal handlers trigger re-entrant updates.
             for key, widget in list(self.inputs.items()):
-                value = self.asset_data.get(key)
+                if keys is not None and key not in keys: continue
+                value = self.value_store.get(key)
                 if value is None: continue
                 
                 if isinstance(widget, QLineEdit):
@@ -1596,13 +1738,16 @@ class GenericFormDialog(QDialog):
         index = combo.findData(value)
         if index != -1:
             combo.setCurrentIndex(index)
-        else:
-             # Fallback string match
-             val_str = str(value)
-             for i in range(combo.count()):
-                 if str(combo.itemData(i)) == val_str:
-                     combo.setCurrentIndex(i)
-                     return
+            return
+        # Fallback: comparación como texto contra la tabla compilada del combo
+        lookup = getattr(combo, "value_lookup", None)
+        index = lookup.position(value) if lookup else -1
+        if index == -1 or index >= combo.count() or str(combo.itemData(index)) != str(value):
+            # Tabla ausente o desactualizada (ítems agregados fuera de _on_combo_data)
+            combo.value_lookup = lookup = CatalogLookup.from_combo(combo)
+            index = lookup.position(value)
+        if index != -1:
+            combo.setCurrentIndex(index)
 
 
 
@@ -1611,6 +1756,7 @@ class GenericFormDialog(QDialog):
         self._check_finished()
 
     def _on_step_changed(self, index):
+        self._ensure_section_built(index)
         self.stack.setCurrentIndex(index)
 
     # ===============================
@@ -1623,32 +1769,25 @@ class GenericFormDialog(QDialog):
         
         self.loading_overlay.show_loading()
         
-        # Identify combos to load from config
+        # Identify combos to load from config (también los de secciones diferidas:
+        # el catálogo queda guardado y se aplica al construir la sección)
         combos_to_load = []
         for section in self.config.get("sections", []):
             for field in self._iter_fields(section.get("fields", [])):
                 ftype = field.get("type", "")
+                key = field["key"]
                 if ftype == "combo_text" and field.get("source") and not field.get("depends_on"):
-                    key = field["key"]
-                    ct_widget = self.inputs.get(key)
-                    if isinstance(ct_widget, ComboTextWidget):
-                        endpoint = field["source"]
-                        cache_key = field.get("cache_key", f"cache_{key}")
-                        combos_to_load.append((ct_widget.combo, endpoint, cache_key))
+                    combos_to_load.append((key, field["source"], field.get("cache_key", f"cache_{key}")))
                 elif ftype in ["combo", "radio_combo"] and (field.get("source") or field.get("cache_key")) and not field.get("depends_on"):
-                    key = field["key"]
-                    widget = self.inputs.get(key)
-                    endpoint = field.get("source", "")
-                    cache_key = field.get("cache_key", f"cache_{key}")
-                    combos_to_load.append((widget, endpoint, cache_key))
+                    combos_to_load.append((key, field.get("source", ""), field.get("cache_key", f"cache_{key}")))
 
         self.pending_loads = len(combos_to_load)
         if self.is_edit:
             self.pending_loads += 1
             
         # Launch Combo Loaders
-        for combo, endpoint, cache_key in combos_to_load:
-            self._start_combo_loader(combo, endpoint, cache_key)
+        for key, endpoint, cache_key in combos_to_load:
+            self._start_field_catalog_loader(key, endpoint, cache_key)
             
         # Launch Record Loader
         if self.is_edit:
@@ -1656,18 +1795,33 @@ class GenericFormDialog(QDialog):
             
         if self.pending_loads == 0:
              self.loading_overlay.hide_loading()
+             self._schedule_lazy_build()
 
-    def _start_combo_loader(self, combo, endpoint, cache_key, track_pending=True):
+    def _start_field_catalog_loader(self, key, endpoint, cache_key, track_pending=True):
+        """Descarga el catálogo del combo key, exista o no su widget todavía."""
+        self._catalog_keys[key] = cache_key
         worker = ComboLoaderRunnable(self.catalogo_service.get_catalogo, endpoint, cache_key)
         self._active_runnables.append(worker)
         
-        worker.signals.result.connect(partial(self._on_combo_data, combo))
+        worker.signals.result.connect(partial(self._on_field_catalog, key))
         worker.signals.error.connect(self._on_load_error)
         if track_pending:
             worker.signals.finished.connect(self._check_finished)
         
         self.thread_pool.start(worker)
 
+    def _on_field_catalog(self, key, data):
+        self._catalog_data[key] = data
+        self._populate_field_catalog(key)
+
+    def _populate_field_catalog(self, key):
+        widget = self.inputs.get(key)
+        combo = widget.combo if isinstance(widget, ComboTextWidget) else widget
+        if combo is None or key not in self._catalog_data:
+            return
+        self._register_catalog_combo(combo, self._catalog_keys.get(key), self._on_combo_data)
+        self._on_combo_data(combo, self._catalog_data[key])
+
     def _start_record_loader(self):
         endpoint_base = self.config.get("endpoint")
         # 🔑 Soporte opcional para endpoint /full en edición
@@ -1735,6 +1889,9 @@ class GenericFormDialog(QDialog):
                 if not found:
                     combo.addItem(label, value)
                  
+        # Tabla valor -> índice para restaurar valores sin recorrer los ítems
+        combo.value_lookup = CatalogLookup.from_combo(combo)
+
         # Ensure no default selection
         combo.setCurrentIndex(-1)
         if hasattr(combo, 'lineEdit') and combo.lineEdit():
@@ -1874,6 +2031,7 @@ class GenericFormDialog(QDialog):
     def _load_dependent_combo(self, combo, url, cache_key=None):
         # Create a worker just for this
         combo.clear()
+        self._register_catalog_combo(combo, cache_key, self._on_dependent_data)
         
         # Use CatalogoService to leverage cache if available
         worker = ComboLoaderRunnable(self.catalogo_service.get_catalogo, url, cache_key)
@@ -1910,6 +2068,43 @@ class GenericFormDialog(QDialog):
                  self._set_combo_value(combo, val)
                  
     
+    def _register_catalog_combo(self, combo, cache_key, handler):
+        # Un combo dependiente cambia de cache_key al cambiar su padre: solo vale la última
+        for entries in self._catalog_combos.values():
+            entries[:] = [e for e in entries if e[0] is not combo]
+        if cache_key:
+            self._catalog_combos.setdefault(cache_key, []).append((combo, handler))
+
+    def _on_catalog_refreshed(self, cache_key, data):
+        """Actualiza en su lugar los combos abiertos cuyo catálogo se revalidó con cambios."""
+        if not self.isVisible():
+            return
+        # Los combos de secciones diferidas se construirán con la versión nueva
+        for key, key_cache in self._catalog_keys.items():
+            if key_cache == cache_key:
+                self._catalog_data[key] = data
+        for combo, handler in list(self._catalog_combos.get(cache_key, [])):
+            was_setting_values = self.is_setting_values
+            try:
+                previous = combo.currentData()
+                combo.blockSignals(True)
+                self.is_setting_values = True
+                handler(combo, data)
+                # Conservamos lo que el usuario ya había seleccionado
+                if isinstance(combo, CheckableComboBox):
+                    combo.setCurrentData(previous or [])
+                elif previous is not None:
+                    self._set_combo_value(combo, previous)
+            except RuntimeError:
+                # El widget ya fue destruido
+                continue
+            finally:
+                self.is_setting_values = was_setting_values
+                try:
+                    combo.blockSignals(False)
+                except RuntimeError:
+                    pass
+
     def _clear_layout(self, layout):
         if not layout:
             return
@@ -1998,6 +2193,9 @@ class GenericFormDialog(QDialog):
     # Submit
     # ===============================
     def _submit(self):
+        # El payload y la validación leen los widgets: se construye lo pendiente
+        self._build_all_sections()
+
         # Determine payload based on form type
         if self.config.get("endpoint") == "/eipd":
              payload = self._build_eipd_payload()
@@ -2447,6 +2645,14 @@ class GenericFormDialog(QDialog):
     # Close Prevention
     # ======================================================
 
+    def done(self, result):
+        self._lazy_build_timer.stop()
+        try:
+            CatalogoEvents().catalogo_updated.disconnect(self._on_catalog_refreshed)
+        except (RuntimeError, TypeError):
+            pass
+        super().done(result)
+
     def reject(self):
         """Override Esc key and reject() behavior to ask for confirmation."""
         self._confirm_close_dialog()
@@ -1,10 +1,12 @@
 import json
+import os
+from collections.abc import Mapping
 from functools import partial
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QLineEdit, QComboBox,
+    QLabel, QPushButton, QTableView,
+    QLineEdit, QComboBox,
     QFrame, QHeaderView, QMenu, QFileDialog,
     QAbstractScrollArea, QAbstractItemView
 )
@@ -16,13 +18,24 @@ from PySide6.QtCore import Qt, QTimer, QDateTime, QLocale, QThreadPool, QPoint,
 
 from src.core.api_client import ApiClient
 from src.services.catalogo_service import CatalogoService
+from src.services.catalog_lookup_service import CatalogLookupService
+from src.services.config_registry import ConfigRegistry
+from src.services.page_cache import PageCache
 from src.services.logger_service import LoggerService
 from src.workers.api_worker import ApiWorker
 from src.workers.combo_loader import ComboLoaderRunnable
+from src.workers.download_worker import DownloadWorker
+from src.workers.local_csv_export_worker import LocalCsvExportWorker
+from src.workers.local_pdf_export_worker import LocalPdfExportWorker
+from src.workers.grid_reload_scheduler import GridReloadScheduler
 from src.components.alert_dialog import AlertDialog
 from src.components.loading_overlay import LoadingOverlay
 from src.components.module_info_dialog import ModuleInfoDialog
 from src.components.dialog_registry import get_dialog_class
+from src.components.grid_table_model import GridTableModel, VirtualGridTableModel
+from src.config.settings import GRID_VIRTUAL_MAX_PAGES, GRID_INDICATORS_CACHE_TTL
+from src.components.grid_actions_delegate import GridActionsDelegate
+from src.components.grid_search_index import GridSearchIndex, item_matches
 from src.services.user_service import UserService
 from src.services.permission_service import PermissionService
 
@@ -50,12 +63,44 @@ class GenericGridView(QWidget):
         self.row_height = 44
         self.column_filters = {}
         self._raw_items = []
+        self._search_index = None
+        # Páginas recientes del listado y última consulta mostrada (para precargar vecinas)
+        self.page_cache = PageCache()
+        self._list_request = None
+        # Indicadores: se piden en paralelo al listado y cambian menos, así que viven más
+        self.indicators_cache = PageCache(ttl=GRID_INDICATORS_CACHE_TTL, max_pages=1)
+        self._indicators_generation = 0
+        self._indicators_worker = None
+
+        # Scroll virtual (opt-in en la config): "paginacion": {"modo": "virtual", "tamano_bloque": 50}
+        pagination_config = self.config.get("paginacion", {})
+        self.virtual_mode = pagination_config.get("modo") == "virtual"
+        self.virtual_block_size = pagination_config.get("tamano_bloque", 50)
+        self._virtual_query = 0
+        self._virtual_workers = {}
+        self._download_worker = None
+        self._export_worker = None
 
         # UI Elements Storage (for later access)
         self.filters_ui = {} # Map filter_id -> QComboBox
         self.indicators_ui = {} # Map indicator field -> QLabel value
-        self.columns = sorted(self.config["columnas"], key=lambda x: x.get("orden", 0))
-        
+        self.columns = list(self.compiled_config.columns)
+        
+        # Recargas agrupadas: solo se aplica la más reciente
+        self.reload_scheduler = GridReloadScheduler(parent=self)
+        self.reload_scheduler.result_ready.connect(self._on_reload_finished)
+        self.reload_scheduler.error.connect(self._on_reload_error)
+
+        # Sincronización incremental (opt-in en la config), ej.:
+        # "sincronizacion": {"param_desde": "actualizado_desde", "campo_marca": "sincronizado_en",
+        #                    "campo_version": "updated_at", "campo_eliminados": "eliminados"}
+        self.sync_config = self.config.get("sincronizacion")
+        self._sync_point = None
+        self._sync_request = None
+        self.sync_scheduler = GridReloadScheduler(delay_ms=0, parent=self)
+        self.sync_scheduler.result_ready.connect(self._on_delta_finished)
+        self.sync_scheduler.error.connect(self._on_delta_error)
+
         # Security Service
         self.permission_service = PermissionService()
         self.perm_module = self.config.get("modulo_api", "").upper()
@@ -65,6 +110,9 @@ class GenericGridView(QWidget):
         
         # Overlay
         self.loading_overlay = LoadingOverlay(self)
+        # Descargas/exportaciones usan su propio overlay: una recarga que termina
+        # no debe ocultar el avance ni el botón Cancelar de una transferencia
+        self.transfer_overlay = LoadingOverlay(self)
         
         # Initial Load
         QTimer.singleShot(0, self._init_async_filters)
@@ -99,13 +147,15 @@ class GenericGridView(QWidget):
 
 
 
-    def _load_config(self, path: str) -> dict:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _load_config(self, path: str) -> Mapping:
+        self.compiled_config = ConfigRegistry().grid(path)
+        return self.compiled_config.data
 
     def resizeEvent(self, event):
         if hasattr(self, 'loading_overlay') and self.loading_overlay:
             self.loading_overlay.resize(event.size())
+        if hasattr(self, 'transfer_overlay') and self.transfer_overlay:
+            self.transfer_overlay.resize(event.size())
         if hasattr(self, 'table_overlay') and self.table_overlay:
             self.table_overlay.setGeometry(self.table.rect())
         super().resizeEvent(event)
@@ -148,7 +198,7 @@ class GenericGridView(QWidget):
             stats_layout.setSpacing(16)
             
             # Sort indicators by orden
-            indicators = sorted(self.config["indicadores"], key=lambda x: x.get("orden", 0))
+            indicators = self.compiled_config.indicators
             
             for ind in indicators:
                 card = self._create_stat_card(
@@ -212,7 +262,7 @@ class GenericGridView(QWidget):
         # Refresh
         self.refresh_btn = QPushButton("Actualizar")
         self.refresh_btn.setObjectName("gridToolbarActionButton")
-        self.refresh_btn.clicked.connect(self._reload_all)
+        self.refresh_btn.clicked.connect(self._on_refresh_clicked)
         self.filters_layout.addWidget(self.refresh_btn)
             
         # Clear Filters Button
@@ -294,23 +344,47 @@ class GenericGridView(QWidget):
         columns = self.columns
         # Add actions column if needed
         has_actions = bool(self.config.get("acciones"))
-        col_count = len(columns) + (1 if has_actions else 0)
         
-        self.table = QTableWidget(0, col_count)
+        # Modelo: las filas se guardan una vez y las celdas se formatean al pintarse
+        if self.virtual_mode:
+            self.table_model = VirtualGridTableModel(
+                columns,
+                self._format_cell_value,
+                block_size=self.virtual_block_size,
+                max_pages=GRID_VIRTUAL_MAX_PAGES,
+                null_value=self.config.get("valor_nulo", "—"),
+                has_actions=has_actions,
+                parent=self,
+            )
+            self.table_model.page_requested.connect(self._fetch_virtual_page)
+        else:
+            self.table_model = GridTableModel(
+                columns,
+                self._format_cell_value,
+                null_value=self.config.get("valor_nulo", "—"),
+                has_actions=has_actions,
+                parent=self,
+            )
+
+        self.table = QTableView()
+        self.table.setObjectName("gridTable")
+        self.table.setModel(self.table_model)
+
+        # Botones de acción pintados por un delegate (sin widgets por fila)
+        if has_actions:
+            self.sorted_actions = list(self.compiled_config.actions)
+            self.table_model.set_action_resolver(self._resolve_row_actions)
+            self.actions_delegate = GridActionsDelegate(self.table, parent=self)
+            self.actions_delegate.action_clicked.connect(self._on_row_action_clicked)
+            self.table.setItemDelegateForColumn(len(columns), self.actions_delegate)
         self.table.setSizeAdjustPolicy(QAbstractScrollArea.AdjustIgnored)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         
-        # Headers
-        headers = [c["etiqueta"] for c in columns]
-        if has_actions:
-            headers.append("Acciones")
-        
-        self.table.setHorizontalHeaderLabels(headers)
         self.table.setShowGrid(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         self.table.verticalHeader().setDefaultSectionSize(self.row_height)
         
@@ -338,7 +412,7 @@ class GenericGridView(QWidget):
         layout.addWidget(self.table)
         
         # 5. Pagination
-        if self.config.get("paginacion", {}).get("habilitado"):
+        if self.config.get("paginacion", {}).get("habilitado") and not self.virtual_mode:
             self.prev_btn = QPushButton(self.config["paginacion"].get("texto_anterior", "<"))
             self.prev_btn.clicked.connect(self._prev_page)
             
@@ -534,19 +608,19 @@ class GenericGridView(QWidget):
 
     def _reload_all(self):
         self.loading_overlay.show_loading()
+        if self.transfer_overlay.isVisible():
+            # Mantener visible el avance de la transferencia en curso
+            self.transfer_overlay.raise_()
         
         # State capture
-        page = self.current_page
-        size = self.page_size
-        
-        # Build Filters Dict
-        filters = {}
-        search_param = self.config.get("buscador", {}).get("param_api")
-        selected_column = self.column_filter_combo.currentData()
-        if search_param:
-            # If user filters by a specific column, apply search locally to avoid backend/global mismatch.
-            if selected_column == "__all__":
-                filters[search_param] = self.search_input.text()
+        main_url = self.config["endpoints"]["listado"]
+        if self.virtual_mode:
+            # En scroll virtual se pide el primer bloque; el resto se carga al desplazarse
+            params = self._build_list_params(1)
+            params["size"] = self.virtual_block_size
+        else:
+            params = self._build_list_params(self.current_page)
+        self._list_request = (main_url, params)
             
         # Task closure
         def fetch_task():
@@ -554,47 +628,113 @@ class GenericGridView(QWidget):
             if not self.permission_service.has_module_access(self.perm_module):
                 return {"listado": [], "indicadores": None, "blocked": True}
 
-            # Build URL
-            # Construccion robusta con params
-            params = {
-                "page": page,
-                "size": size
-            }
-            
-            search_param = self.config.get("buscador", {}).get("param_api")
-            if search_param:
-                search_text = self.search_input.text().strip()
-                if search_text:
-                    params[search_param] = search_text
-
-            if selected_column and selected_column != "__all__":
-                for col in self.columns:
-                    if col.get("campo_api") == selected_column and col.get("filtrar_en"):
-                        params["filtrar_en"] = col["filtrar_en"]
-                        break
-
-            main_url = self.config["endpoints"]["listado"]
-            main_data = self.api.get(main_url, params=params)
-            
-            indicadores_data = None
-            if self.config.get("endpoints", {}).get("indicadores"):
-                indicadores_data = self.api.get(self.config["endpoints"]["indicadores"])
-                
+            main_data = self.page_cache.fetch(main_url, params)
+
             return {
                 "listado": main_data,
-                "indicadores": indicadores_data
+                "indicadores": None
             }
 
-        self.worker = ApiWorker(fetch_task, parent=self)
-        self.worker.finished.connect(self._on_reload_finished)
-        self.worker.error.connect(self._on_reload_error)
-        self.worker.start()
+        self._start_reload(fetch_task)
+        # Las tarjetas se cargan en paralelo y se pintan cuando llegan
+        self._reload_indicators()
+
+    def _reload_indicators(self):
+        endpoint = self.config.get("endpoints", {}).get("indicadores")
+        if not endpoint:
+            return
+
+        self._indicators_generation += 1
+        generation = self._indicators_generation
+
+        cached = self.indicators_cache.get(endpoint, None)
+        if cached is not None:
+            self._on_indicators_finished(cached)
+            return
+
+        def fetch_indicators():
+            if not self.permission_service.has_module_access(self.perm_module):
+                return None
+            return self.indicators_cache.fetch(endpoint, None)
+
+        worker = ComboLoaderRunnable(fetch_indicators)
+        worker.signals.result.connect(partial(self._on_indicators_result, generation))
+        worker.signals.error.connect(
+            lambda e: LoggerService().log_error(f"Error cargando indicadores de {self.config['id']}", e)
+        )
+        self._indicators_worker = worker
+        self.thread_pool.start(worker)
+
+    def _on_indicators_result(self, generation, data):
+        # Una respuesta de una recarga anterior no pisa a la más reciente
+        if generation != self._indicators_generation or not data:
+            return
+        self._on_indicators_finished(data)
+
+    def _on_indicators_finished(self, data):
+        self._populate_indicators(data)
+
+    def _build_list_params(self, page):
+        # Construccion robusta con params
+        params = {
+            "page": page,
+            "size": self.page_size
+        }
+        
+        search_param = self.config.get("buscador", {}).get("param_api")
+        if search_param:
+            search_text = self.search_input.text().strip()
+            if search_text:
+                params[search_param] = search_text
+
+        selected_column = self.column_filter_combo.currentData()
+        if selected_column and selected_column != "__all__":
+            for col in self.columns:
+                if col.get("campo_api") == selected_column and col.get("filtrar_en"):
+                    params["filtrar_en"] = col["filtrar_en"]
+                    break
+        return params
+
+    def _prefetch_adjacent_pages(self):
+        """Precarga en segundo plano las páginas N-1 y N+1 de la última consulta."""
+        if not self._list_request or self.virtual_mode:
+            return
+        url, params = self._list_request
+        page = params.get("page")
+        if not page:
+            return
+        for neighbour in (page + 1, page - 1):
+            if neighbour < 1 or neighbour > self.total_pages:
+                continue
+            neighbour_params = dict(params, page=neighbour)
+            if self.page_cache.contains(url, neighbour_params):
+                continue
+            worker = ComboLoaderRunnable(self.page_cache.fetch, url, neighbour_params)
+            self.thread_pool.start(worker)
+
+    def _reload_after_mutation(self):
+        # Alta, edición, eliminación o duplicado: las páginas guardadas quedan obsoletas
+        self.page_cache.invalidate()
+        self.indicators_cache.invalidate()
+        self._invalidate_rat_catalog_cache_if_needed()
+        self._reload_all()
+
+    def _on_refresh_clicked(self):
+        self.page_cache.invalidate()
+        self.indicators_cache.invalidate()
+        self._reload_all()
+
+    def _start_reload(self, fetch_task):
+        # Solo se aplica la respuesta de la recarga más reciente
+        self.reload_scheduler.submit(fetch_task)
 
     def _on_reload_finished(self, data):
+        self._record_sync_point(data["listado"])
         self._populate_table(data["listado"])
         if data.get("indicadores"):
             self._populate_indicators(data["indicadores"])
         self.loading_overlay.hide_loading()
+        self._prefetch_adjacent_pages()
 
     def _on_reload_error(self, error):
         self.loading_overlay.hide_loading()
@@ -602,7 +742,115 @@ class GenericGridView(QWidget):
         # TODO: Show alert? Original view just logged and printed
         print(f"Error reloading: {error}")
 
+    # ======================================================
+    # Sincronización incremental (delta)
+    # ======================================================
+
+    def _sync_or_reload(self):
+        """Al volver a la vista: pide solo los cambios si la grilla lo soporta, si no recarga."""
+        if (
+            self.sync_config is not None
+            and not self.virtual_mode
+            and self._sync_point is not None
+            and self._sync_request is not None
+            and self._sync_request == self._list_request
+            and not self.reload_scheduler.is_pending()
+        ):
+            self._start_delta_sync()
+        else:
+            self._reload_all()
+
+    def _record_sync_point(self, response):
+        """Guarda la marca del servidor (o la mayor versión de fila) de la consulta mostrada."""
+        self._sync_point = None
+        self._sync_request = None
+        if self.sync_config is None or self.virtual_mode:
+            return
+        sync_point = None
+        if isinstance(response, dict):
+            sync_point = response.get(self.sync_config.get("campo_marca", "sincronizado_en"))
+            items = response.get("items", [])
+        else:
+            items = response or []
+        if sync_point is None:
+            version_field = self.sync_config.get("campo_version", "updated_at")
+            versions = [item.get(version_field) for item in items if item.get(version_field) is not None]
+            sync_point = max(versions) if versions else None
+        self._sync_point = sync_point
+        self._sync_request = self._list_request
+
+    def _start_delta_sync(self):
+        url, params = self._sync_request
+        delta_params = dict(params)
+        delta_params[self.sync_config.get("param_desde", "actualizado_desde")] = self._sync_point
+
+        def fetch_delta():
+            if not self.permission_service.has_module_access(self.perm_module):
+                return None
+            return self.api.get(url, params=delta_params)
+
+        self.sync_scheduler.submit(fetch_delta, immediate=True)
+
+    def _on_delta_finished(self, response):
+        if not isinstance(response, dict) or self._sync_request != self._list_request:
+            # Respuesta inesperada o la consulta cambió entretanto: recarga completa
+            self._reload_all()
+            return
+
+        key_field = self.config.get("campo_id", "id")
+        changed = {str(item.get(key_field)): item for item in response.get("items", [])}
+        deleted = {str(i) for i in response.get(self.sync_config.get("campo_eliminados", "eliminados"), [])}
+        new_point = response.get(self.sync_config.get("campo_marca", "sincronizado_en"))
+
+        if not changed and not deleted:
+            if new_point is not None:
+                self._sync_point = new_point
+            print(f"[GridSync] {self.config['id']}: sin cambios")
+            return
+
+        loaded = {str(item.get(key_field)) for item in self._raw_items}
+        if not set(changed) <= loaded:
+            # Filas nuevas o de otras páginas: el orden y la paginación dependen del servidor
+            self.page_cache.invalidate()
+            self.indicators_cache.invalidate()
+            self._reload_all()
+            return
+
+        self._raw_items = [
+            changed.get(str(item.get(key_field)), item)
+            for item in self._raw_items
+            if str(item.get(key_field)) not in deleted
+        ]
+        self._search_index = None
+        if self.search_input.text().strip() or self.column_filters:
+            # Con filtros locales activos se vuelve a filtrar la página (pocas filas)
+            rows = self._apply_column_header_filters(self._apply_local_search())
+            self.table_model.update_items(
+                [self._raw_items[row] for row in sorted(rows)], self.config.get("campo_id")
+            )
+        else:
+            self.table_model.patch_rows(changed, deleted, key_field)
+        self._update_table_height()
+
+        # Las páginas guardadas y los indicadores ya no reflejan el servidor
+        self.page_cache.invalidate()
+        self.indicators_cache.invalidate()
+        self._reload_indicators()
+        if new_point is not None:
+            self._sync_point = new_point
+        else:
+            self._record_sync_point(self._raw_items)
+        print(f"[GridSync] {self.config['id']}: {len(changed)} filas actualizadas, {len(deleted)} eliminadas")
+
+    def _on_delta_error(self, error):
+        LoggerService().log_error(f"Error sincronizando grilla {self.config['id']}", error)
+        self._reload_all()
+
     def _populate_table(self, response):
+        if self.virtual_mode and isinstance(response, dict):
+            self._populate_virtual(response)
+            return
+
         if not response:
             items = []
             self.total_pages = 1
@@ -612,41 +860,16 @@ class GenericGridView(QWidget):
         else:
             items = response.get("items", [])
             self.total_pages = response.get("pages", 1)
-        self._raw_items = list(items)
-        items = self._apply_local_search(self._raw_items)
-        items = self._apply_column_header_filters(items)
+        # El índice de búsqueda solo se reconstruye cuando cambian los datos cargados
+        if items is not self._raw_items:
+            self._raw_items = list(items)
+            self._search_index = None
+        rows = self._apply_local_search()
+        rows = self._apply_column_header_filters(rows)
+        items = [self._raw_items[row] for row in sorted(rows)]
         
-        self.table.setRowCount(len(items))
-        
-        columns = self.columns
-        id_field = self.config["campo_id"]
-        null_value = self.config.get("valor_nulo", "—")
-        
-        for row, item in enumerate(items):
-            # Data cells
-            for col_idx, col_config in enumerate(columns):
-                val = item.get(col_config["campo_api"])
-                text = self._format_cell_value(col_config, val, null_value)
-                item_widget = QTableWidgetItem(text)
-                
-                # Check for specific alignment in config later? 
-                # For now, align center-left or center based on type usually looks best.
-                # User asked for "alineada", implying it's misaligned. 
-                # Usually QTableWidget defaults to Left-Center. Titles are usually Center or Left.
-                # If they say "name of field... and info appears misaligned", it might mean headers vs content.
-                # Headers are usually centered. Let's align content to Center-Left (VCenter | Left) 
-                # OR if they want strict column alignment, maybe everything Left?
-                # But headers are centered by default in many themes.
-                # Let's try centering everything vertically, and Left horizontally for text, Center for short IDs.
-                # To be safe and generic: AlignCenter for everything usually solves "misaligned vs header".
-                # Or better: VCenter | HCenter
-                item_widget.setTextAlignment(Qt.AlignCenter)
-                
-                self.table.setItem(row, col_idx, item_widget)
-            
-            # Actions cell
-            if self.config.get("acciones"):
-                self._add_actions_cell(row, len(columns), item)
+        # Diff por campo_id: solo se repintan las filas insertadas, quitadas o cambiadas
+        self.table_model.update_items(items, self.config.get("campo_id"))
 
         if hasattr(self, "page_label"):
             self.page_label.setText(f"Página {self.current_page} de {self.total_pages}")
@@ -655,46 +878,79 @@ class GenericGridView(QWidget):
         self._refresh_header_filter_icons()
 
 
-    def _apply_local_search(self, items):
-        query = self.search_input.text().strip().lower()
+    # ======================================================
+    # Scroll virtual
+    # ======================================================
+
+    def _populate_virtual(self, response):
+        items = response.get("items", [])
+        total = response.get("total")
+        if total is None:
+            total = response.get("pages", 1) * self.virtual_block_size
+        self.total_pages = response.get("pages", 1)
+
+        # Nueva consulta: las respuestas de bloques pedidos antes se ignoran
+        self._virtual_query += 1
+        self._raw_items = list(items)
+        self._search_index = None
+        self.table_model.reset(total, items)
+
+        self._update_table_height()
+        self._refresh_header_filter_icons()
+
+    def _fetch_virtual_page(self, page):
+        if not self._list_request:
+            return
+        url, params = self._list_request
+        query = self._virtual_query
+        worker = ComboLoaderRunnable(self.page_cache.fetch, url, dict(params, page=page))
+        worker.signals.result.connect(partial(self._on_virtual_page, query, page))
+        worker.signals.error.connect(partial(self._on_virtual_page_error, query, page))
+        self._virtual_workers[(query, page)] = worker
+        self.thread_pool.start(worker)
+
+    def _on_virtual_page(self, query, page, data):
+        self._virtual_workers.pop((query, page), None)
+        if query != self._virtual_query:
+            return
+        items = data.get("items", []) if isinstance(data, dict) else (data or [])
+        self.table_model.set_page(page, items)
+
+    def _on_virtual_page_error(self, query, page, error):
+        self._virtual_workers.pop((query, page), None)
+        LoggerService().log_error(f"Error cargando bloque {page} de {self.config['id']}", error)
+        if query == self._virtual_query:
+            self.table_model.page_failed(page)
+
+    def _get_search_index(self):
+        if self._search_index is None:
+            fields = [c["campo_api"] for c in self.columns]
+            self._search_index = GridSearchIndex(self._raw_items, fields)
+        return self._search_index
+
+    def _apply_local_search(self):
+        index = self._get_search_index()
+        query = self.search_input.text().strip()
         if not query:
-            return items
+            return index.all_rows()
 
-        selected_column = self.column_filter_combo.currentData()
-        columns_to_search = (
-            [selected_column]
-            if selected_column and selected_column != "__all__"
-            else [c["campo_api"] for c in self.columns if c.get("visible", True)]
-        )
+        return index.search(query, self._local_search_fields())
 
-        filtered = []
-        for item in items:
-            for field in columns_to_search:
-                value = item.get(field)
-                if query in str(value or "").lower():
-                    filtered.append(item)
-                    break
-        return filtered
+    def _local_search_fields(self):
+        selected_column = self.column_filter_combo.currentData()
+        if selected_column and selected_column != "__all__":
+            return [selected_column]
+        return [c["campo_api"] for c in self.columns if c.get("visible", True)]
 
-    def _apply_column_header_filters(self, items):
+    def _apply_column_header_filters(self, rows):
         if not self.column_filters:
-            return items
-
-        filtered = []
-        for item in items:
-            include = True
-            for field, expected in self.column_filters.items():
-                if expected is None:
-                    continue
-                value = item.get(field)
-                if str(value if value is not None else "—") != str(expected):
-                    include = False
-                    break
-            if include:
-                filtered.append(item)
-        return filtered
+            return rows
+        return self._get_search_index().filter_rows(self.column_filters, rows)
 
     def _on_header_clicked(self, section_index):
+        # En scroll virtual no están todas las filas en memoria para filtrar localmente
+        if self.virtual_mode:
+            return
         if section_index < 0 or section_index >= len(self.columns):
             return
         if self.table.isColumnHidden(section_index):
@@ -713,17 +969,12 @@ class GenericGridView(QWidget):
         all_action.setData(None)
         group.addAction(all_action)
 
-        values = sorted(
-            {
-                str(item.get(field) if item.get(field) is not None else "—")
-                for item in self._raw_items
-            }
-        )
+        values = self._get_search_index().distinct_values(field)
 
         if values:
             menu.addSeparator()
-        for value in values:
-            action = menu.addAction(value)
+        for value, count in values:
+            action = menu.addAction(f"{value} ({count})")
             action.setCheckable(True)
             action.setChecked(str(current_filter) == value if current_filter is not None else False)
             action.setData(value)
@@ -745,14 +996,7 @@ class GenericGridView(QWidget):
         self._populate_table({"items": self._raw_items, "pages": self.total_pages})
 
     def _refresh_header_filter_icons(self):
-        for i, col in enumerate(self.columns):
-            header_item = self.table.horizontalHeaderItem(i)
-            if not header_item:
-                continue
-            base = col["etiqueta"]
-            field = col["campo_api"]
-            suffix = "  ▼" if field not in self.column_filters else "  ●"
-            header_item.setText(f"{base}{suffix}")
+        self.table_model.set_filtered_fields(self.column_filters.keys())
 
     def _toggle_column_visibility(self, col_index, checked):
         self.table.setColumnHidden(col_index, not checked)
@@ -760,7 +1004,7 @@ class GenericGridView(QWidget):
     def _update_table_height(self):
         base_height = 35 # Cabecera más compacta
         # Usamos rowCount real para que si hay menos de 10, se encoja
-        row_count = self.table.rowCount()
+        row_count = self.table_model.rowCount()
         height = base_height + (row_count * self.row_height)
         
         # Pero no más de page_size * row_height para mantener el límite solicitado
@@ -827,19 +1071,19 @@ class GenericGridView(QWidget):
     # Actions
     # ======================================================
 
-    def _add_actions_cell(self, row, col_idx, item):
-        w = QWidget()
-        l = QHBoxLayout(w)
-        l.setContentsMargins(6, 0, 6, 0)
-        l.setSpacing(4)
-        l.setAlignment(Qt.AlignCenter)
-        
-        id_field = self.config["campo_id"]
-        record_id = item.get(id_field)
-        
-        sorted_actions = sorted(self.config["acciones"], key=lambda x: x.get("orden", 0))
-        
-        for action in sorted_actions:
+    def _resolve_row_actions(self, item):
+        """Estado de cada acción para una fila: visible_if y permiso por acción."""
+        # Mapeo de IDs de config a permisos
+        perm_map = {
+            "EDITAR": "EDITAR",
+            "ELIMINAR": "ELIMINAR",
+            "APROBAR": "APROBAR",
+            "EXPORTAR": "EXPORTAR",
+            "DUPLICAR": "EDITAR" # Duplicate usually requires edit permissions
+        }
+
+        states = []
+        for action in self.sorted_actions:
             # Check for conditional visibility
             is_visible = True
             visible_if = action.get("visible_if")
@@ -851,67 +1095,37 @@ class GenericGridView(QWidget):
                     if item_val != str(value).upper():
                         is_visible = False
 
-            if not is_visible:
-                # Add a placeholder to maintain columnar alignment
-                placeholder = QWidget()
-                placeholder.setFixedSize(28, 28)
-                l.addWidget(placeholder)
-                continue
-
-            btn = QPushButton()
-            btn.setFixedSize(28, 28) # Ensure consistent size for alignment
-            btn.setIcon(icon(action["icono"]))
-            btn.setToolTip(action.get("tooltip", ""))
-            
             # 🛡️ Verificación de Permisos por Acción
-            action_id = action.get("id", "").upper()
-            
-            # Mapeo de IDs de config a permisos
-            perm_map = {
-                "EDITAR": "EDITAR",
-                "ELIMINAR": "ELIMINAR",
-                "APROBAR": "APROBAR",
-                "EXPORTAR": "EXPORTAR",
-                "DUPLICAR": "EDITAR" # Duplicate usually requires edit permissions
-            }
-            
-            target_perm = perm_map.get(action_id)
+            enabled = True
+            tooltip = action.get("tooltip", "")
+            target_perm = perm_map.get(action.get("id", "").upper())
             if target_perm and not self.permission_service.has_permission(self.perm_module, target_perm):
-                btn.setEnabled(False)
-                btn.setToolTip(f"Sin permiso para {target_perm.lower()}")
-                # Estética Gris sobre Gris solicitada
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f1f5f9;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 4px;
-                    }
-                    QPushButton:disabled {
-                        background-color: #f1f5f9;
-                        color: #94a3b8;
-                    }
-                """)
-                btn.setGraphicsEffect(None)
-            
-            # Connect action
-            if action.get("tipo") == "export_row":
-                menu = QMenu(btn)
-                csv_act = menu.addAction("Exportar a CSV")
-                pdf_act = menu.addAction("Exportar a PDF")
-                
-                csv_act.triggered.connect(partial(self._export_single_row, record_id))
-                pdf_act.triggered.connect(partial(self._export_single_row_pdf, record_id))
-                
-                btn.setMenu(menu)
-                # Opcional: Hacer que el botón abra el menú al hacer clic normal (no solo en la flecha si la hubiera)
-                # En muchos temas de Qt, setMenu ya lo hace así.
-            else:
-                btn.clicked.connect(partial(self._execute_action, action, record_id))
-                
-            l.addWidget(btn)
-            
-        self.table.setCellWidget(row, col_idx, w)
+                enabled = False
+                tooltip = f"Sin permiso para {target_perm.lower()}"
+
+            states.append({
+                "action": action,
+                "visible": is_visible,
+                "enabled": enabled,
+                "tooltip": tooltip,
+            })
+        return states
+
+    def _on_row_action_clicked(self, action, row, button_rect):
+        item = self.table_model.item_at(row)
+        if item is None:
+            return
+        record_id = item.get(self.config["campo_id"])
+
+        if action.get("tipo") == "export_row":
+            menu = QMenu(self)
+            csv_act = menu.addAction("Exportar a CSV")
+            pdf_act = menu.addAction("Exportar a PDF")
+            csv_act.triggered.connect(partial(self._export_single_row, record_id))
+            pdf_act.triggered.connect(partial(self._export_single_row_pdf, record_id))
+            menu.exec(self.table.viewport().mapToGlobal(button_rect.bottomLeft()))
+        else:
+            self._execute_action(action, record_id)
 
     def _show_permission_block(self):
         """Muestra un mensaje de bloqueo cuando el usuario no tiene permiso VER."""
@@ -980,8 +1194,7 @@ class GenericGridView(QWidget):
                     
                 dialog = DialogClass(self, **kwargs)
                 if dialog.exec():
-                    self._invalidate_rat_catalog_cache_if_needed()
-                    self._reload_all()
+                    self._reload_after_mutation()
             else:
                 print(f"Unknown dialog class: {dialog_class_name}")
 
@@ -1006,22 +1219,11 @@ class GenericGridView(QWidget):
         if not file_path.endswith('.pdf'):
             file_path += '.pdf'
 
-        self.loading_overlay.show_loading()
-        
-        def fetch_pdf():
-            return self.api.get_raw(url)
-
-        def on_finished(content):
-            self.loading_overlay.hide_loading()
-            self._handle_pdf_export_result(content, file_path)
-
-        worker = ApiWorker(fetch_pdf, parent=self)
-        worker.finished.connect(on_finished)
-        worker.error.connect(lambda e: (
-            self.loading_overlay.hide_loading(),
-            self._show_export_error(f"Error en la descarga del PDF: {e}")
-        ))
-        worker.start()
+        self._start_download(
+            url, file_path,
+            on_saved=self._finalize_pdf_download,
+            error_message="Error en la descarga del PDF",
+        )
 
     def _export_single_row(self, record_id):
         csv_endpoint_template = self.config.get("endpoints", {}).get("exportar_detalle_csv")
@@ -1036,27 +1238,7 @@ class GenericGridView(QWidget):
             if not file_path.endswith('.csv'):
                 file_path += '.csv'
 
-            self.loading_overlay.show_loading()
-
-            def fetch_csv_row():
-                return self.api.get_raw(url)
-
-            def on_csv_finished(content):
-                self.loading_overlay.hide_loading()
-                try:
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
-                except Exception as e:
-                    LoggerService().log_error("Error guardando CSV único", e)
-                    self._show_export_error(f"Error al guardar el archivo: {str(e)}")
-
-            worker = ApiWorker(fetch_csv_row, parent=self)
-            worker.finished.connect(on_csv_finished)
-            worker.error.connect(lambda e: (
-                self.loading_overlay.hide_loading(),
-                self._show_export_error(f"Error en la descarga del CSV: {e}")
-            ))
-            worker.start()
+            self._start_download(url, file_path, error_message="Error en la descarga del CSV")
             return
 
         # Fallback: construir CSV desde endpoint de detalle
@@ -1092,78 +1274,8 @@ class GenericGridView(QWidget):
         worker.start()
 
     def _enrich_data(self, data, config_path):
-        # Load Form Config
-        with open(config_path, 'r', encoding='utf-8') as f:
-            form_config = json.load(f)
-            
-        # Build Field Map
-        field_map = {}
-        for section in form_config.get("sections", []):
-            for field in section.get("fields", []):
-                field_map[field["key"]] = field
-                
-        enriched = data.copy()
-        
-        # Process each field
-        for key, value in data.items():
-            if value is None:
-                continue
-                
-            field_cfg = field_map.get(key)
-            if not field_cfg:
-                continue
-                
-            ftype = field_cfg.get("type")
-            
-            # Static Options (e.g. BoolYesNo)
-            if ftype == "combo_static":
-                options = field_cfg.get("options", [])
-                # Handle boolean vs string comparison
-                for opt in options:
-                    # Loose comparison for bools/strings
-                    if str(opt["id"]) == str(value):
-                        enriched[key] = opt["nombre"]
-                        break
-                        
-            # Dynamic Combos
-            elif ftype == "combo":
-                source = field_cfg.get("source")
-                cache_key = field_cfg.get("cache_key")
-                
-                # Handling dependent combos (url params may need values)
-                # For complex dependencies, this simple enricher might fall short
-                # But typically 'source' is static or we can try to fetch generic catalogs
-                # If source has {value}, we might skip or try to resolve.
-                # But for standard catalogs (Estado, Tipo, etc) it works suitable.
-                
-                if source and "{" not in source:     
-                    try:
-                        # Synchronous fetch (ok since we are in worker thread)
-                        options = self.catalogo_service.get_catalogo(source, cache_key)
-                        if options:
-                            # Search for ID
-                            # Handle standard ID format (sometimes UUID string, sometimes int)
-                            found = False
-                            # Support multiple selection (list of IDs)
-                            if isinstance(value, list):
-                                names = []
-                                for v in value:
-                                    for opt in options:
-                                        if str(opt["id"]) == str(v):
-                                            names.append(opt["nombre"])
-                                            break
-                                enriched[key] = ", ".join(names)
-                                found = True
-                            else:
-                                for opt in options:
-                                    if str(opt["id"]) == str(value):
-                                        enriched[key] = opt["nombre"]
-                                        found = True
-                                        break
-                    except Exception as e:
-                        print(f"Error resolving catalog {source}: {e}")
-                        
-        return enriched
+        # Tablas id -> nombre compiladas y compartidas (ver CatalogLookupService)
+        return CatalogLookupService().enrich(data, config_path)
 
     def _save_single_row_csv(self, data, record_id):
         self.loading_overlay.hide_loading()
@@ -1224,8 +1336,7 @@ class GenericGridView(QWidget):
                     raise Exception(response.get("message", "Error desconocido"))
 
                 LoggerService().log_event(f"Usuario eliminó registro ID: {record_id} en {self.config['id']}")
-                self._invalidate_rat_catalog_cache_if_needed()
-                self._reload_all()
+                self._reload_after_mutation()
                 
             except Exception as e:
                 msg = str(e)
@@ -1252,13 +1363,68 @@ class GenericGridView(QWidget):
             # New mode usually implies no ID argument
             dialog = DialogClass(self)
             if dialog.exec():
-                self._invalidate_rat_catalog_cache_if_needed()
-                self._reload_all()
+                self._reload_after_mutation()
 
     # ======================================================
     # Lógica de Exportación
     # ======================================================
 
+    # ======================================================
+    # Descargas del servidor (streaming a disco)
+    # ======================================================
+
+    def _start_download(self, endpoint, file_path, params=None, on_saved=None,
+                        error_message="Error en la descarga"):
+        """Descarga el endpoint directo a file_path mostrando avance y permitiendo cancelar."""
+        worker = DownloadWorker(endpoint, file_path, params=params, parent=self)
+        self._download_worker = worker
+        self.transfer_overlay.cancel_requested.connect(worker.cancel)
+        worker.progress.connect(self.transfer_overlay.set_progress)
+
+        def cleanup():
+            self.transfer_overlay.cancel_requested.disconnect(worker.cancel)
+            self.transfer_overlay.hide_loading()
+            if self._download_worker is worker:
+                self._download_worker = None
+            worker.deleteLater()
+
+        def on_finished(path):
+            cleanup()
+            if on_saved:
+                on_saved(path)
+
+        def on_error(e):
+            cleanup()
+            LoggerService().log_error(f"{error_message}: {endpoint}", e)
+            self._show_export_error(f"{error_message}: {e}")
+
+        def on_cancelled():
+            cleanup()
+            print(f"[Export] Descarga cancelada por el usuario: {endpoint}")
+
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        worker.cancelled.connect(on_cancelled)
+
+        self.transfer_overlay.show_loading("Descargando...", cancellable=True)
+        worker.start()
+
+    def _finalize_pdf_download(self, file_path):
+        # Lo habitual es un PDF binario; si el servidor devolvió HTML, JSON o
+        # base64 (respuestas pequeñas) se reprocesa con el manejador existente.
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read(4) == b'%PDF':
+                    self._show_export_success()
+                    return
+                f.seek(0)
+                content = f.read()
+            os.remove(file_path)
+        except Exception as e:
+            self._show_export_error(f"Error al leer el archivo descargado: {str(e)}")
+            return
+        self._handle_pdf_export_result(content, file_path)
+
     def _show_export_error(self, message="No hay registros para exportar"):
         AlertDialog(
             title="Aviso", 
@@ -1340,7 +1506,7 @@ class GenericGridView(QWidget):
             self._show_export_error("El formato recibido no es un PDF válido ni HTML convertible.")
 
     def _export_csv(self):
-        if self.table.rowCount() == 0:
+        if self.table_model.rowCount() == 0:
             self._show_export_error()
             return
 
@@ -1353,9 +1519,7 @@ class GenericGridView(QWidget):
             if not file_path.endswith('.csv'):
                 file_path += '.csv'
 
-            self.loading_overlay.show_loading()
-
-            def fetch_csv():
+            def build_params():
                 params = {}
                 search_param = self.config.get("buscador", {}).get("param_api")
                 if search_param and self.search_input.text():
@@ -1366,65 +1530,120 @@ class GenericGridView(QWidget):
                         if col.get("campo_api") == selected_column and col.get("filtrar_en"):
                             params["filtrar_en"] = col["filtrar_en"]
                             break
-                return self.api.get_raw(endpoint, params=params)
+                return params
 
-            def on_finished(content):
-                self.loading_overlay.hide_loading()
-                try:
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
-                except Exception as e:
-                    LoggerService().log_error("Error guardando CSV", e)
-                    self._show_export_error(f"Error al guardar el archivo: {str(e)}")
-
-            worker = ApiWorker(fetch_csv, parent=self)
-            worker.finished.connect(on_finished)
-            worker.error.connect(lambda e: (
-                self.loading_overlay.hide_loading(),
-                self._show_export_error(f"Error en la descarga del CSV: {e}")
-            ))
-            worker.start()
+            self._start_download(
+                endpoint, file_path, params=build_params(),
+                error_message="Error en la descarga del CSV",
+            )
 
         else:
-            # Fallback: generación local desde la grilla visible
+            # Fallback: generación local recorriendo el listado completo
             file_path, _ = QFileDialog.getSaveFileName(self, "Exportar CSV", "", "CSV (*.csv)")
             if not file_path:
                 return
             if not file_path.endswith('.csv'):
                 file_path += '.csv'
 
-            try:
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-
-                    headers = []
-                    visible_cols = []
-
-                    for col in range(self.table.columnCount()):
-                        if self.table.isColumnHidden(col):
-                            continue
-                        header_item = self.table.horizontalHeaderItem(col)
-                        label = header_item.text() if header_item else ""
-                        if label == "Acciones":
-                            continue
-                        headers.append(label)
-                        visible_cols.append(col)
-
-                    writer.writerow(headers)
-
-                    for row in range(self.table.rowCount()):
-                        row_data = []
-                        for col in visible_cols:
-                            item = self.table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        writer.writerow(row_data)
+            self._start_local_csv_export(file_path)
+
+    def _local_export_columns(self):
+        """Encabezados visibles y función que formatea una fila cruda como en la grilla."""
+        col_configs = [
+            self.columns[col] for col in range(len(self.columns))
+            if not self.table.isColumnHidden(col)
+        ]
+        headers = [col["etiqueta"] for col in col_configs]
+        formatter = self._format_cell_value
+        null_value = self.table_model.null_value
+
+        def build_row(item):
+            return [formatter(col, item.get(col["campo_api"]), null_value) for col in col_configs]
+
+        return headers, build_row
+
+    def _start_local_csv_export(self, file_path):
+        """Exporta todas las páginas del listado con los filtros activos, en segundo plano."""
+        headers, build_row = self._local_export_columns()
+
+        # Los filtros locales (búsqueda y cabeceras) se aplican igual que en la grilla
+        query = self.search_input.text().strip()
+        search_fields = self._local_search_fields()
+        column_filters = dict(self.column_filters)
+
+        def _matches(item):
+            return item_matches(item, query, search_fields, column_filters)
+
+        row_filter = _matches if query or column_filters else None
+
+        worker = LocalCsvExportWorker(
+            self.config["endpoints"]["listado"],
+            self._build_list_params(1),
+            headers,
+            build_row,
+            row_filter=row_filter,
+            file_path=file_path,
+            parent=self,
+        )
+        self._run_local_export(
+            worker,
+            on_finished=lambda path, rows: self._show_export_success(f"Se exportaron {rows} registros."),
+            error_message="Error al exportar",
+        )
 
-            except Exception as e:
-                LoggerService().log_error("Error exportando a CSV", e)
-                self._show_export_error(f"Error al exportar: {str(e)}")
+    def _start_local_pdf_export(self, file_path):
+        """Genera el reporte PDF de las filas cargadas en la grilla, en segundo plano."""
+        headers, build_row = self._local_export_columns()
+        worker = LocalPdfExportWorker(
+            self.config.get('titulo', 'Reporte'),
+            f"Generado el: {QDateTime.currentDateTime().toString('dd/MM/yyyy HH:mm')}",
+            headers,
+            list(self.table_model.items()),
+            build_row,
+            file_path,
+            parent=self,
+        )
+        self._run_local_export(
+            worker,
+            on_finished=lambda path: self._show_export_success(),
+            error_message="Error al generar PDF local",
+        )
+
+    def _run_local_export(self, worker, on_finished, error_message):
+        """Ejecuta un worker de exportación local con avance y cancelación en el overlay."""
+        self._export_worker = worker
+        self.transfer_overlay.cancel_requested.connect(worker.cancel)
+        worker.progress.connect(
+            lambda done, total: self.transfer_overlay.set_detail(
+                f"{done} de {total} registros" if total else f"{done} registros"
+            )
+        )
+
+        def cleanup():
+            self.transfer_overlay.cancel_requested.disconnect(worker.cancel)
+            self.transfer_overlay.hide_loading()
+            if self._export_worker is worker:
+                self._export_worker = None
+            worker.deleteLater()
+
+        def handle_finished(*result):
+            cleanup()
+            on_finished(*result)
+
+        def handle_error(e):
+            cleanup()
+            LoggerService().log_error(error_message, e)
+            self._show_export_error(f"{error_message}: {e}")
+
+        worker.finished.connect(handle_finished)
+        worker.error.connect(handle_error)
+        worker.cancelled.connect(cleanup)
+
+        self.transfer_overlay.show_loading("Exportando...", cancellable=True)
+        worker.start()
 
     def _export_pdf(self):
-        if self.table.rowCount() == 0:
+        if self.table_model.rowCount() == 0:
             self._show_export_error()
             return
             
@@ -1439,9 +1658,7 @@ class GenericGridView(QWidget):
             if not file_path.endswith('.pdf'):
                 file_path += '.pdf'
 
-            self.loading_overlay.show_loading()
-            
-            def fetch_pdf():
+            def build_params():
                 # Obtenemos los filtros actuales para que el PDF coincida con lo que ve el usuario (opcional pero recomendado)
                 params = {}
                 search_param = self.config.get("buscador", {}).get("param_api")
@@ -1451,19 +1668,13 @@ class GenericGridView(QWidget):
                 # Agregamos filtros de columnas si es necesario
                 # Por ahora, si el backend lo soporta, enviamos los mismos params que el listado
                 
-                return self.api.get_raw(endpoint, params=params)
-
-            def on_finished(content):
-                self.loading_overlay.hide_loading()
-                self._handle_pdf_export_result(content, file_path)
-
-            worker = ApiWorker(fetch_pdf, parent=self)
-            worker.finished.connect(on_finished)
-            worker.error.connect(lambda e: (
-                self.loading_overlay.hide_loading(),
-                self._show_export_error(f"Error en la descarga del PDF: {e}")
-            ))
-            worker.start()
+                return params
+
+            self._start_download(
+                endpoint, file_path, params=build_params(),
+                on_saved=self._finalize_pdf_download,
+                error_message="Error en la descarga del PDF",
+            )
             
         else:
             # Lógica Legada: Generación Local vía HTML
@@ -1474,43 +1685,7 @@ class GenericGridView(QWidget):
             if not file_path.endswith('.pdf'):
                 file_path += '.pdf'
                 
-            try:
-                doc_html = f"<h1>{self.config.get('titulo', 'Reporte')}</h1>"
-                doc_html += f"<p>Generado el: {QDateTime.currentDateTime().toString('dd/MM/yyyy HH:mm')}</p>"
-                doc_html += "<table><thead><tr>"
-                
-                # Encabezados y Columnas
-                visible_cols = []
-                for col in range(self.table.columnCount()):
-                    if self.table.isColumnHidden(col):
-                        continue
-                    header_item = self.table.horizontalHeaderItem(col)
-                    label = header_item.text() if header_item else ""
-                    if label == "Acciones":
-                        continue
-                    
-                    doc_html += f"<th>{label}</th>"
-                    visible_cols.append(col)
-                    
-                doc_html += "</tr></thead><tbody>"
-                
-                # Filas
-                for row in range(self.table.rowCount()):
-                    doc_html += "<tr>"
-                    for col in visible_cols:
-                        item = self.table.item(row, col)
-                        text = item.text() if item else ""
-                        doc_html += f"<td>{text}</td>"
-                    doc_html += "</tr>"
-                    
-                doc_html += "</tbody></table></body></html>"
-                
-                # Usar el convertidor común
-                self._convert_html_to_pdf(doc_html, file_path)
-                
-            except Exception as e:
-                LoggerService().log_error("Error exportando a PDF local", e)
-                self._show_export_error(f"Error al generar PDF local: {str(e)}")
+            self._start_local_pdf_export(file_path)
 
     def _execute_delete(self, action_config, record_id):
         confirm_config = action_config.get("confirmacion", {})
@@ -1530,8 +1705,7 @@ class GenericGridView(QWidget):
                 self.api.delete(endpoint)
                 
                 LoggerService().log_event(f"Usuario eliminó registro ID: {record_id} en {self.config['id']}")
-                self._invalidate_rat_catalog_cache_if_needed()
-                self._reload_all()
+                self._reload_after_mutation()
             except Exception as e:
                 LoggerService().log_error(f"Error eliminando ID: {record_id}", e)
                 AlertDialog(
@@ -1551,8 +1725,7 @@ class GenericGridView(QWidget):
             # Modo creación generalmente no implica argumento ID
             dialog = DialogClass(self)
             if dialog.exec():
-                self._invalidate_rat_catalog_cache_if_needed()
-                self._reload_all()
+                self._reload_after_mutation()
 
     def _execute_action(self, action_config, record_id):
         action_type = action_config.get("tipo")
@@ -1574,8 +1747,7 @@ class GenericGridView(QWidget):
                     
                 dialog = DialogClass(self, **kwargs)
                 if dialog.exec():
-                    self._invalidate_rat_catalog_cache_if_needed()
-                    self._reload_all()
+                    self._reload_after_mutation()
             else:
                 print(f"Unknown dialog class: {dialog_class_name}")
 
@@ -1601,28 +1773,7 @@ class GenericGridView(QWidget):
             if not file_path.endswith('.csv'):
                 file_path += '.csv'
 
-            self.loading_overlay.show_loading()
-
-            def fetch_csv_row():
-                return self.api.get_raw(url)
-
-            def on_csv_finished(content):
-                self.loading_overlay.hide_loading()
-                try:
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
-                except Exception as e:
-                    LoggerService().log_error("Error guardando CSV único", e)
-                    self._show_export_error(f"Error al guardar el archivo: {str(e)}")
-
-            worker = ApiWorker(fetch_csv_row, parent=self)
-            worker.finished.connect(on_csv_finished)
-            worker.error.connect(lambda e: (
-                self.loading_overlay.hide_loading(),
-                self._show_export_error(f"Error en la descarga del CSV: {e}")
-            ))
-            self.worker = worker
-            worker.start()
+            self._start_download(url, file_path, error_message="Error en la descarga del CSV")
             return
 
         # Fallback: construir CSV desde endpoint de detalle
@@ -1658,76 +1809,8 @@ class GenericGridView(QWidget):
         worker.start()
 
     def _enrich_data(self, data, config_path):
-        # Cargar Configuración del Formulario
-        with open(config_path, 'r', encoding='utf-8') as f:
-            form_config = json.load(f)
-            
-        # Construir Mapa de Campos
-        field_map = {}
-        for section in form_config.get("sections", []):
-            for field in section.get("fields", []):
-                field_map[field["key"]] = field
-                
-        enriched = data.copy()
-        
-        # Procesar cada campo
-        for key, value in data.items():
-            if value is None:
-                continue
-                
-            field_cfg = field_map.get(key)
-            if not field_cfg:
-                continue
-                
-            ftype = field_cfg.get("type")
-            
-            # Opciones Estáticas (ej. BoolYesNo)
-            if ftype == "combo_static":
-                options = field_cfg.get("options", [])
-                # Manejar comparación booleana vs string
-                for opt in options:
-                    # Comparación laxa
-                    if str(opt["id"]) == str(value):
-                        enriched[key] = opt["nombre"]
-                        break
-                        
-            # Combos Dinámicos
-            elif ftype == "combo":
-                source = field_cfg.get("source")
-                cache_key = field_cfg.get("cache_key")
-                
-                # Manejo de combos dependientes
-                # Si la fuente tiene {value}, podríamos intentar resolver o saltar.
-                # Para catálogos estándar (Estado, Tipo, etc) funciona adecuadamente.
-                
-                if source and "{" not in source:     
-                    try:
-                        # Busqueda síncrona (segura ya que estamos en hilo worker)
-                        options = self.catalogo_service.get_catalogo(source, cache_key)
-                        if options:
-                            # Buscar por ID
-                            # Manejar formato estándar de ID
-                            found = False
-                            # Soporte selección múltiple (lista de IDs)
-                            if isinstance(value, list):
-                                names = []
-                                for v in value:
-                                    for opt in options:
-                                        if str(opt["id"]) == str(v):
-                                            names.append(opt["nombre"])
-                                            break
-                                enriched[key] = ", ".join(names)
-                                found = True
-                            else:
-                                for opt in options:
-                                    if str(opt["id"]) == str(value):
-                                        enriched[key] = opt["nombre"]
-                                        found = True
-                                        break
-                    except Exception as e:
-                        print(f"Error resolving catalog {source}: {e}")
-                        
-        return enriched
+        # Tablas id -> nombre compiladas y compartidas (ver CatalogLookupService)
+        return CatalogLookupService().enrich(data, config_path)
 
     def _save_single_row_csv(self, data, record_id):
         self.loading_overlay.hide_loading()
@@ -1796,7 +1879,7 @@ class GenericGridView(QWidget):
         
         # We reload everything to ensure the backend's 'list' joins and formatting 
         # are correctly applied to the new record (fixing the "---" issues)
-        self._reload_all()
+        self._reload_after_mutation()
         
         module_name = self.config.get("titulo", "registro")
         LoggerService().log_event(f"{module_name} duplicado exitosamente: {original_id}")
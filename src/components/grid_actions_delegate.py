@@ -0,0 +1,138 @@
+from PySide6.QtCore import Qt, QEvent, QRect, QSize, Signal
+from PySide6.QtGui import QColor, QIcon
+from PySide6.QtWidgets import QStyledItemDelegate, QToolTip
+
+from utils import icon
+
+
+class GridActionsDelegate(QStyledItemDelegate):
+    """
+    Pinta los botones de acción de la grilla genérica en la columna "Acciones"
+    y resuelve hover, tooltip y clic por posición, sin crear widgets por fila.
+
+    El estado de cada acción (visible / habilitada / tooltip) lo entrega el
+    modelo con action_states(row), que lo calcula una sola vez por fila.
+    """
+    action_clicked = Signal(object, int, QRect)  # action_config, row, rect del botón (viewport)
+
+    BUTTON_SIZE = 28
+    ICON_SIZE = 16
+    SPACING = 4
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent or view)
+        self.view = view
+        self._icons = {}
+        self._hover = None  # (row, action_index)
+        self._pressed = None
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    # ===============================
+    # Geometría
+    # ===============================
+    def _button_rects(self, cell_rect, count):
+        total = count * self.BUTTON_SIZE + max(0, count - 1) * self.SPACING
+        x = cell_rect.x() + (cell_rect.width() - total) // 2
+        y = cell_rect.y() + (cell_rect.height() - self.BUTTON_SIZE) // 2
+        rects = []
+        for _ in range(count):
+            rects.append(QRect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
+            x += self.BUTTON_SIZE + self.SPACING
+        return rects
+
+    def _hit_test(self, index, pos):
+        states = index.model().action_states(index.row())
+        rects = self._button_rects(self.view.visualRect(index), len(states))
+        for i, (state, rect) in enumerate(zip(states, rects)):
+            if state["visible"] and rect.contains(pos):
+                return i, state, rect
+        return None, None, None
+
+    def _icon(self, path):
+        cached = self._icons.get(path)
+        if cached is None:
+            cached = icon(path)
+            self._icons[path] = cached
+        return cached
+
+    # ===============================
+    # Pintado
+    # ===============================
+    def paint(self, painter, option, index):
+        # Fondo (alternado / selección) según el estilo de la vista
+        super().paint(painter, option, index)
+
+        states = index.model().action_states(index.row())
+        rects = self._button_rects(option.rect, len(states))
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        for i, (state, rect) in enumerate(zip(states, rects)):
+            if not state["visible"]:
+                continue  # Hueco vacío para mantener la alineación por columna
+            if not state["enabled"]:
+                painter.setBrush(QColor("#f1f5f9"))
+                painter.drawRoundedRect(rect, 4, 4)
+            elif self._hover == (index.row(), i):
+                painter.setBrush(QColor(0, 0, 0, 13))
+                painter.drawRoundedRect(rect, 6, 6)
+
+            mode = QIcon.Normal if state["enabled"] else QIcon.Disabled
+            pixmap = self._icon(state["action"]["icono"]).pixmap(QSize(self.ICON_SIZE, self.ICON_SIZE), mode)
+            offset = (self.BUTTON_SIZE - self.ICON_SIZE) // 2
+            painter.drawPixmap(rect.x() + offset, rect.y() + offset, pixmap)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        count = len(index.model().action_states(index.row()))
+        width = count * self.BUTTON_SIZE + max(0, count - 1) * self.SPACING + 12
+        return QSize(width, self.BUTTON_SIZE)
+
+    # ===============================
+    # Interacción
+    # ===============================
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            action_idx, state, _ = self._hit_test(index, event.position().toPoint())
+            self._pressed = (index.row(), action_idx) if state and state["enabled"] else None
+            return state is not None
+        if etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action_idx, state, rect = self._hit_test(index, event.position().toPoint())
+            pressed, self._pressed = self._pressed, None
+            if state and state["enabled"] and pressed == (index.row(), action_idx):
+                self.action_clicked.emit(state["action"], index.row(), rect)
+                return True
+            return state is not None
+        if etype == QEvent.MouseMove:
+            action_idx, state, _ = self._hit_test(index, event.position().toPoint())
+            self._set_hover((index.row(), action_idx) if state and state["enabled"] else None)
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            _, state, _ = self._hit_test(index, event.pos())
+            if state and state.get("tooltip"):
+                QToolTip.showText(event.globalPos(), state["tooltip"], view)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    def eventFilter(self, obj, event):
+        # El hover se limpia al salir del viewport o pasar a otra columna
+        if event.type() == QEvent.Leave:
+            self._set_hover(None)
+        elif event.type() == QEvent.MouseMove:
+            index = self.view.indexAt(event.position().toPoint())
+            if not index.isValid() or self.view.itemDelegateForColumn(index.column()) is not self:
+                self._set_hover(None)
+        return False
+
+    def _set_hover(self, hover):
+        if hover == self._hover:
+            return
+        self._hover = hover
+        self.view.viewport().update()
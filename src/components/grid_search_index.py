@@ -0,0 +1,100 @@
+import unicodedata
+
+NULL_FILTER_VALUE = "—"
+
+
+def normalize_text(value):
+    """Minúsculas y sin tildes, para comparar búsquedas ("Mantención" ~ "mantencion")."""
+    text = str(value or "").lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def filter_value(value):
+    """Valor tal como se muestra y compara en los filtros de cabecera."""
+    return str(value if value is not None else NULL_FILTER_VALUE)
+
+
+def item_matches(item, query, fields, column_filters):
+    """
+    Mismas reglas que GridSearchIndex.search + filter_rows evaluadas sobre una
+    sola fila, para filtrar datos que no están cargados en la grilla.
+    """
+    for field, expected in column_filters.items():
+        if expected is not None and filter_value(item.get(field)) != str(expected):
+            return False
+    needle = normalize_text((query or "").strip())
+    if not needle:
+        return True
+    for field in fields:
+        value = item.get(field)
+        if value is not None and needle in normalize_text(filter_value(value)):
+            return True
+    return False
+
+
+class GridSearchIndex:
+    """
+    Índice de búsqueda de las filas cargadas en la grilla, construido una vez
+    por conjunto de datos. Por cada columna guarda los valores distintos con
+    la lista de filas que los contienen (posting list) y su forma normalizada,
+    de modo que buscar o filtrar recorre valores distintos y cruza conjuntos
+    de filas en vez de volver a recorrer y formatear cada fila.
+    """
+
+    def __init__(self, items, fields):
+        self.row_count = len(items)
+        self._postings = {}    # field -> {valor de filtro: set(filas)}
+        self._normalized = {}  # field -> {valor de filtro: texto normalizado}
+        self._search_cache = {}
+
+        for field in fields:
+            postings = {}
+            for row, item in enumerate(items):
+                postings.setdefault(filter_value(item.get(field)), set()).add(row)
+            self._postings[field] = postings
+            # Los nulos no participan en la búsqueda de texto (como str(None or ""))
+            self._normalized[field] = {
+                value: normalize_text(value)
+                for value in postings
+                if value != NULL_FILTER_VALUE
+            }
+
+    def all_rows(self):
+        return set(range(self.row_count))
+
+    def search(self, query, fields):
+        """Filas donde alguno de los campos contiene el texto (sin tildes ni mayúsculas)."""
+        needle = normalize_text(query.strip())
+        if not needle:
+            return self.all_rows()
+
+        cache_key = (needle, tuple(fields))
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        rows = set()
+        for field in fields:
+            postings = self._postings.get(field, {})
+            for value, normalized in self._normalized.get(field, {}).items():
+                if needle in normalized:
+                    rows |= postings[value]
+        self._search_cache[cache_key] = rows
+        return rows
+
+    def filter_rows(self, column_filters, rows=None):
+        """Intersección de las filas que cumplen cada filtro de cabecera {campo: valor}."""
+        result = self.all_rows() if rows is None else set(rows)
+        for field, expected in column_filters.items():
+            if expected is None:
+                continue
+            result &= self._postings.get(field, {}).get(str(expected), set())
+            if not result:
+                break
+        return result
+
+    def distinct_values(self, field):
+        """[(valor, cantidad)] ordenados, para el menú de filtro de la cabecera."""
+        postings = self._postings.get(field, {})
+        return sorted((value, len(rows)) for value, rows in postings.items())
@@ -0,0 +1,330 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+
+class GridTableModel(QAbstractTableModel):
+    """
+    Modelo de la grilla genérica. Guarda las filas (dicts de la API) una sola
+    vez y formatea cada celda recién cuando la vista la pide en data(), de modo
+    que solo se procesan las filas visibles.
+    """
+
+    ACTIONS_LABEL = "Acciones"
+
+    def __init__(self, columns, formatter, null_value="—", has_actions=False, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.formatter = formatter
+        self.null_value = null_value
+        self.has_actions = has_actions
+        self._items = []
+        self._filtered_fields = set()
+        self._action_resolver = None
+        self._action_states = {}
+
+    # ===============================
+    # Datos
+    # ===============================
+    def set_items(self, items):
+        self.beginResetModel()
+        self._items = list(items)
+        self._action_states = {}
+        self.endResetModel()
+
+    def update_items(self, items, key_field):
+        """
+        Reemplaza las filas emitiendo solo los cambios mínimos: compara por
+        key_field, quita las filas que ya no están, inserta las nuevas y
+        notifica dataChanged solo en las que cambiaron. Las filas intactas
+        conservan su estado (acciones, selección, scroll). Si no hay llave,
+        hay llaves repetidas o cambió el orden relativo, se resetea el modelo.
+        """
+        items = list(items)
+        if not key_field or not self._items:
+            self.set_items(items)
+            return
+
+        old_keys = [str(item.get(key_field)) for item in self._items]
+        new_keys = [str(item.get(key_field)) for item in items]
+        new_key_set = set(new_keys)
+        if len(set(old_keys)) != len(old_keys) or len(new_key_set) != len(new_keys):
+            self.set_items(items)
+            return
+
+        old_key_set = set(old_keys)
+        kept_old_order = [key for key in old_keys if key in new_key_set]
+        kept_new_order = [key for key in new_keys if key in old_key_set]
+        if kept_old_order != kept_new_order:
+            self.set_items(items)
+            return
+
+        states_by_key = {old_keys[row]: states for row, states in self._action_states.items()}
+
+        # 1. Filas eliminadas (de abajo hacia arriba, agrupando tramos contiguos)
+        row = len(self._items) - 1
+        while row >= 0:
+            if old_keys[row] in new_key_set:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and old_keys[row] not in new_key_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            del self._items[row + 1:end + 1]
+            del old_keys[row + 1:end + 1]
+            self.endRemoveRows()
+
+        # 2. Inserciones y cambios, recorriendo el orden nuevo
+        last_column = self.columnCount() - 1
+        new_states = {}
+        row = 0
+        while row < len(items):
+            if row < len(old_keys) and old_keys[row] == new_keys[row]:
+                if self._items[row] != items[row]:
+                    self._items[row] = items[row]
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+                elif new_keys[row] in states_by_key:
+                    new_states[row] = states_by_key[new_keys[row]]
+                row += 1
+                continue
+            start = row
+            while row < len(items) and new_keys[row] not in old_key_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), start, row - 1)
+            self._items[start:start] = items[start:row]
+            old_keys[start:start] = new_keys[start:row]
+            self.endInsertRows()
+
+        self._action_states = new_states
+
+    def items(self):
+        return self._items
+
+    def item_at(self, row):
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def patch_rows(self, changed, deleted, key_field):
+        """
+        Aplica un delta sin resetear el modelo: reemplaza en su lugar las filas
+        de changed ({str(id): fila}) y quita las de deleted (set de str(id)).
+        """
+        last_column = self.columnCount() - 1
+        for row, item in enumerate(self._items):
+            new_item = changed.get(str(item.get(key_field)))
+            if new_item is not None:
+                self._items[row] = new_item
+                self._action_states.pop(row, None)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        removed = False
+        for row in reversed(range(len(self._items))):
+            if str(self._items[row].get(key_field)) in deleted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._items[row]
+                self.endRemoveRows()
+                removed = True
+        if removed:
+            # El caché de acciones está indexado por fila
+            self._action_states = {}
+
+    def set_action_resolver(self, resolver):
+        """resolver(item) -> [{action, visible, enabled, tooltip}] para la columna de acciones."""
+        self._action_resolver = resolver
+        self._action_states = {}
+
+    def action_states(self, row):
+        # Visibilidad y permisos se calculan una vez por fila y se reutilizan al repintar
+        states = self._action_states.get(row)
+        if states is None:
+            item = self.item_at(row)
+            states = self._action_resolver(item) if item is not None and self._action_resolver else []
+            self._action_states[row] = states
+        return states
+
+    def is_actions_column(self, column):
+        return self.has_actions and column == len(self.columns)
+
+    def display_text(self, row, column):
+        """Texto formateado de una celda de datos (para exportaciones locales)."""
+        item = self.item_at(row)
+        if item is None or column >= len(self.columns):
+            return ""
+        col_config = self.columns[column]
+        return self.formatter(col_config, item.get(col_config["campo_api"]), self.null_value)
+
+    def header_label(self, column):
+        if self.is_actions_column(column):
+            return self.ACTIONS_LABEL
+        if 0 <= column < len(self.columns):
+            return self.columns[column]["etiqueta"]
+        return ""
+
+    def set_filtered_fields(self, fields):
+        fields = set(fields)
+        if fields == self._filtered_fields:
+            return
+        self._filtered_fields = fields
+        if self.columns:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.columns) - 1)
+
+    # ===============================
+    # QAbstractTableModel
+    # ===============================
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns) + (1 if self.has_actions else 0)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if self.is_actions_column(column):
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.display_text(index.row(), column)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return super().headerData(section, orientation, role)
+        label = self.header_label(section)
+        if section < len(self.columns):
+            field = self.columns[section]["campo_api"]
+            suffix = "  ●" if field in self._filtered_fields else "  ▼"
+            return f"{label}{suffix}"
+        return label
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class VirtualGridTableModel(GridTableModel):
+    """
+    Modelo para el modo de scroll virtual: representa el resultado completo del
+    servidor (total de filas) pero solo retiene en memoria una ventana acotada
+    de páginas. Cuando la vista pide una fila de una página no cargada se emite
+    page_requested; las páginas más lejanas a la zona visible se descartan.
+    """
+    page_requested = Signal(int)
+
+    LOADING_TEXT = "Cargando…"
+
+    def __init__(self, columns, formatter, block_size, max_pages, null_value="—", has_actions=False, parent=None):
+        super().__init__(columns, formatter, null_value=null_value, has_actions=has_actions, parent=parent)
+        self.block_size = max(1, block_size)
+        self.max_pages = max(2, max_pages)
+        self._total = 0
+        self._pages = {}        # página (1..n) -> lista de filas
+        self._requested = set()
+        self._focus_page = 1
+
+    # ===============================
+    # Datos
+    # ===============================
+    def reset(self, total, first_page_items):
+        self.beginResetModel()
+        self._total = max(int(total or 0), len(first_page_items))
+        self._pages = {1: list(first_page_items)} if first_page_items else {}
+        self._requested = set()
+        self._action_states = {}
+        self._focus_page = 1
+        self.endResetModel()
+
+    def set_items(self, items):
+        self.reset(len(items), items)
+
+    def update_items(self, items, key_field):
+        # Las filas de las demás páginas no están en memoria: no hay con qué comparar
+        self.set_items(items)
+
+    def set_page(self, page, items):
+        self._requested.discard(page)
+        self._pages[page] = list(items)
+        self._drop_action_states(page)
+        self._evict_far_pages()
+        self._emit_page_changed(page)
+
+    def page_failed(self, page):
+        # Se podrá volver a pedir cuando la fila se pinte de nuevo
+        self._requested.discard(page)
+
+    def items(self):
+        rows = []
+        for page in sorted(self._pages):
+            rows.extend(self._pages[page])
+        return rows
+
+    def loaded_pages(self):
+        return sorted(self._pages)
+
+    def page_for_row(self, row):
+        return row // self.block_size + 1
+
+    def item_at(self, row):
+        if not 0 <= row < self._total:
+            return None
+        page = self.page_for_row(row)
+        self._focus_page = page
+        items = self._pages.get(page)
+        if items is None:
+            self._request(page)
+            return None
+        offset = row - (page - 1) * self.block_size
+        return items[offset] if offset < len(items) else None
+
+    def _request(self, page):
+        if page in self._requested:
+            return
+        self._requested.add(page)
+        self.page_requested.emit(page)
+
+    def _evict_far_pages(self):
+        while len(self._pages) > self.max_pages:
+            farthest = max(self._pages, key=lambda p: abs(p - self._focus_page))
+            del self._pages[farthest]
+            self._drop_action_states(farthest)
+            self._emit_page_changed(farthest)
+
+    def _page_rows(self, page):
+        first = (page - 1) * self.block_size
+        last = min(self._total, first + self.block_size) - 1
+        return first, last
+
+    def _drop_action_states(self, page):
+        first, last = self._page_rows(page)
+        for row in range(first, last + 1):
+            self._action_states.pop(row, None)
+
+    def _emit_page_changed(self, page):
+        first, last = self._page_rows(page)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+    # ===============================
+    # QAbstractTableModel
+    # ===============================
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._total
+
+    def display_text(self, row, column):
+        if column >= len(self.columns):
+            return ""
+        item = self.item_at(row)
+        if item is None:
+            return self.LOADING_TEXT
+        col_config = self.columns[column]
+        return self.formatter(col_config, item.get(col_config["campo_api"]), self.null_value)
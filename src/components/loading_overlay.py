@@ -1,8 +1,10 @@
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QPainter, QColor, QPen
 
 class LoadingOverlay(QWidget):
+    cancel_requested = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, False) # Block inputs
@@ -10,24 +12,70 @@ class LoadingOverlay(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         
         self.angle = 0
+        self.message = "Cargando..."
+        self.detail = ""
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.rotate)
+
+        # Botón de cancelar (solo visible en operaciones cancelables, ej. descargas)
+        self.cancel_btn = QPushButton("Cancelar", self)
+        self.cancel_btn.setCursor(Qt.PointingHandCursor)
+        self.cancel_btn.setFixedSize(110, 32)
+        self.cancel_btn.clicked.connect(self._on_cancel_clicked)
+        self.cancel_btn.hide()
         self.hide()
 
     def rotate(self):
         self.angle = (self.angle + 10) % 360
         self.update()
 
-    def show_loading(self):
+    def show_loading(self, message="Cargando...", cancellable=False):
+        self.message = message
+        self.detail = ""
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setVisible(cancellable)
         self.resize(self.parent().size())
+        self._place_cancel_button()
         self.show()
         self.raise_()
         self.timer.start(50)
 
+    def set_detail(self, text):
+        """Texto secundario bajo el mensaje (avance de la operación)."""
+        self.detail = text
+        self.update()
+
+    def set_progress(self, received, total=0):
+        """Muestra los bytes recibidos y, si se conoce el total, el porcentaje."""
+        text = self._format_bytes(received)
+        if total:
+            percent = min(100, int(received * 100 / total))
+            text = f"{text} de {self._format_bytes(total)} ({percent}%)"
+        self.set_detail(text)
+
     def hide_loading(self):
         self.timer.stop()
+        self.cancel_btn.hide()
         self.hide()
 
+    def _on_cancel_clicked(self):
+        self.cancel_btn.setEnabled(False)
+        self.detail = "Cancelando..."
+        self.update()
+        self.cancel_requested.emit()
+
+    def _place_cancel_button(self):
+        self.cancel_btn.move(
+            (self.width() - self.cancel_btn.width()) // 2,
+            self.height() // 2 + 80,
+        )
+
+    @staticmethod
+    def _format_bytes(size):
+        if size < 1024 * 1024:
+            return f"{size / 1024:.0f} KB"
+        return f"{size / (1024 * 1024):.1f} MB"
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -56,10 +104,16 @@ class LoadingOverlay(QWidget):
         font.setBold(True)
         painter.setFont(font)
         # Position text below the spinner (which is roughly -20 to 20)
-        painter.drawText(-100, 30, 200, 30, Qt.AlignCenter, "Cargando...")
+        painter.drawText(-100, 30, 200, 30, Qt.AlignCenter, self.message)
         
+        if self.detail:
+            font.setBold(False)
+            painter.setFont(font)
+            painter.drawText(-150, 55, 300, 24, Qt.AlignCenter, self.detail)
+
         painter.end()
 
     def resizeEvent(self, event):
         self.resize(self.parent().size())
+        self._place_cancel_button()
         super().resizeEvent(event)
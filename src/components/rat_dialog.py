@@ -6,6 +6,7 @@ import json
 
 # Ajusta el import según tu estructura real
 from src.core.api_client import ApiClient
+from src.services.config_registry import ConfigRegistry, iter_form_fields
 
 class RatDialog(GenericFormDialog):
     RAT_CATALOGO_CACHE_KEY = "catalogo_rat_id"
@@ -113,24 +114,20 @@ class RatDialog(GenericFormDialog):
                 self._current_extension = None
 
     def _expand_form(self, config_path):
+        start_index = len(self.config["sections"])
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                ext_config = json.load(f)
+            # 🚨 SIEMPRE saltar la primera (Identificación). La config combinada
+            # (RAT + extensión) se compila una vez y se comparte entre diálogos.
+            extended = ConfigRegistry().form_with_extension(self.config_path, config_path, skip=1)
         except Exception:
             return
 
-        sections = ext_config.get("sections", [])
-        if not sections:
-            return
-
-        # 🚨 SIEMPRE saltar la primera (Identificación)
-        new_sections = sections[1:]
+        new_sections = extended.sections[start_index:]
 
         if not new_sections:
             return
 
-        start_index = len(self.config["sections"])
-        self.config["sections"].extend(new_sections)
+        self._set_compiled_config(extended)
 
         if self.is_edit:
             # Mantiene activo el re-aplicado de datos mientras cargan combos dinámicos.
@@ -144,17 +141,9 @@ class RatDialog(GenericFormDialog):
             if "Gobierno de Datos" in section_title:
                 section_title = f"{abs_index + 1}. Gobierno de Datos"
 
-            content_widget = self._build_section_form(section)
             self.sidebar.add_step(section_title)
-
-            page = self._wrap_step_content(
-                content_widget,
-                section_title,
-                section.get("description", ""),
-                abs_index,
-                len(self.config["sections"]),
-            )
-            self.stack.addWidget(page)
+            # La sección se construye al mostrar su paso o en segundo plano
+            self._add_section_page(abs_index, section, section_title)
             self._load_new_combos(section)
 
         if start_index > 0:
@@ -170,10 +159,14 @@ class RatDialog(GenericFormDialog):
         # Sin esto, los campos con 'visible_when' en las extensiones (Institucional/IA) no funcionan.
         self._setup_visibility_connections()
         self._setup_direct_checkable_visibility()
-        
+
+    def _on_section_built(self, index, keys):
+        super()._on_section_built(index, keys)
         # --- NEW: Pre-fill and Lock fields in "Gobierno de Datos" for NEW records ---
         if not self.record_id:
             self._prefill_gobierno_datos()
+        if self.rat_estado in ["ENVIADO", "APROBADO", "RECHAZADO"]:
+            self._lock_form()
 
     def _prefill_gobierno_datos(self):
         """Pre-completa campos de Gobierno de Datos y los bloquea."""
@@ -207,23 +200,20 @@ class RatDialog(GenericFormDialog):
             pass
 
     def _shrink_form(self):
-        if len(self.config["sections"]) <= 1: return
-        while len(self.config["sections"]) > 1:
-            section = self.config["sections"].pop()
-            for field in section.get("fields", []):
+        base_config = ConfigRegistry().form(self.config_path)
+        removed = self.config["sections"][len(base_config.sections):]
+        if not removed: return
+        # Vuelve a la config base: sus grafos ya no incluyen los campos de la extensión
+        self._set_compiled_config(base_config)
+        for section in reversed(removed):
+            for field in iter_form_fields(section.get("fields", [])):
                 key = field["key"]
-                if key in self.inputs: del self.inputs[key]
-                if key in self.dependencies: del self.dependencies[key]
-                if key in self.dependency_configs: del self.dependency_configs[key]
-                if key in self.visibility_map: del self.visibility_map[key]
-                
-                # También limpiar reversos de visibilidad (donde este campo es el objetivo)
-                for src_key, deps in list(self.visibility_map.items()):
-                    self.visibility_map[src_key] = [d for d in deps if d["key"] != key]
-                    if not self.visibility_map[src_key]:
-                        del self.visibility_map[src_key]
+                self.inputs.pop(key, None)
+                self.blocks.pop(key, None)
+                self.labels.pop(key, None)
             
             self.sidebar.remove_last_step()
+            self._lazy_sections.pop(self.stack.count() - 1, None)
             w = self.stack.widget(self.stack.count()-1)
             if w:
                 self.stack.removeWidget(w)
@@ -232,25 +222,17 @@ class RatDialog(GenericFormDialog):
         # No actualizar footer aquí, se hará en el siguiente _expand si corresponde
         self._validate_steps_progress()
 
-    def _iter_section_fields(self, fields):
-        for field in fields or []:
-            if field.get("type") == "group":
-                yield from self._iter_section_fields(field.get("fields", []))
-            else:
-                yield field
-
     def _load_new_combos(self, section):
-        for field in self._iter_section_fields(section.get("fields", [])):
+        # El catálogo se descarga aunque la sección aún no esté construida
+        for field in iter_form_fields(section.get("fields", [])):
             if field.get("type") == "combo" and field.get("source") and not field.get("depends_on"):
-                key = field["key"]
-                if key in self.inputs:
-                    self.pending_loads += 1
-                    self._start_combo_loader(
-                        self.inputs[key],
-                        field["source"],
-                        field.get("cache_key"),
-                        track_pending=True
-                    )
+                self.pending_loads += 1
+                self._start_field_catalog_loader(
+                    field["key"],
+                    field["source"],
+                    field.get("cache_key"),
+                    track_pending=True
+                )
 
     # --- Helpers Footer ---
     def _update_footer_to_next(self, idx): self._rebuild_footer(idx, False)
@@ -710,26 +692,12 @@ class RatDialog(GenericFormDialog):
         }
         return labels.get(estado, str(estado).replace("_", " ") if estado else "—")
 
-    def _iter_required_fields(self, fields):
-        for field in fields or []:
-            if field.get("type") == "group":
-                yield from self._iter_required_fields(field.get("fields", []))
-            elif field.get("required", False):
-                yield field
-
     def _get_missing_required_labels_for_send(self):
         missing = []
-        for idx, section in enumerate(self.config.get("sections", [])):
-            page_widget = self.stack.widget(idx) if idx < self.stack.count() else None
-            for field in self._iter_required_fields(section.get("fields", [])):
-                key = field.get("key")
-                widget = self.inputs.get(key)
-                if not widget:
-                    continue
-                if not page_widget or not widget.isVisibleTo(page_widget):
-                    continue
-                if not self._is_field_filled(widget, field):
-                    missing.append(field.get("label", key))
+        for idx in range(len(self.config.get("sections", []))):
+            for field, filled in self._section_required_status(idx):
+                if not filled:
+                    missing.append(field.get("label", field.get("key")))
         return missing
 
     # --- Helpers Guardado ---
@@ -1121,6 +1089,8 @@ class RatDialog(GenericFormDialog):
 
     def _get_all_form_values(self):
         """Recolector de datos BLINDADO contra 422."""
+        # Se leen los widgets: construir antes las secciones pendientes
+        self._build_all_sections()
         vals = {}
         for k, w in self.inputs.items():
             if isinstance(w, QComboBox):
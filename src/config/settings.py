@@ -4,3 +4,35 @@ from dotenv import load_dotenv
 load_dotenv()
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+
+# Pool de conexiones HTTP compartido por ApiClient
+API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "4"))
+API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "16"))
+API_POOL_BLOCK = os.getenv("API_POOL_BLOCK", "false").lower() in ("1", "true", "yes")
+API_KEEP_ALIVE = os.getenv("API_KEEP_ALIVE", "true").lower() in ("1", "true", "yes")
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "2"))
+API_RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", "0.3"))
+
+# Límites de la cache local de catálogos (LRU)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "500"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Precarga de catálogos tras el login
+CATALOG_PREFETCH_ENABLED = os.getenv("CATALOG_PREFETCH_ENABLED", "true").lower() in ("1", "true", "yes")
+CATALOG_PREFETCH_CONCURRENCY = int(os.getenv("CATALOG_PREFETCH_CONCURRENCY", "4"))
+
+# Espera (ms) para agrupar recargas de grilla disparadas en ráfaga
+GRID_RELOAD_DEBOUNCE_MS = int(os.getenv("GRID_RELOAD_DEBOUNCE_MS", "250"))
+
+# Cache de páginas de grillas (segundos de vida y páginas por grilla)
+GRID_PAGE_CACHE_TTL = int(os.getenv("GRID_PAGE_CACHE_TTL", "30"))
+GRID_PAGE_CACHE_MAX_PAGES = int(os.getenv("GRID_PAGE_CACHE_MAX_PAGES", "20"))
+# Los indicadores de una grilla cambian menos que el listado
+GRID_INDICATORS_CACHE_TTL = int(os.getenv("GRID_INDICATORS_CACHE_TTL", "120"))
+
+# Modo de scroll virtual de grillas: páginas retenidas en memoria por grilla
+GRID_VIRTUAL_MAX_PAGES = int(os.getenv("GRID_VIRTUAL_MAX_PAGES", "8"))
+
+# Exportación CSV local: recorre el listado completo por páginas en segundo plano
+LOCAL_EXPORT_PAGE_SIZE = int(os.getenv("LOCAL_EXPORT_PAGE_SIZE", "100"))
+LOCAL_EXPORT_CONCURRENCY = int(os.getenv("LOCAL_EXPORT_CONCURRENCY", "3"))
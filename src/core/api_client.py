@@ -1,7 +1,18 @@
 import base64
 import json
+import os
+import tempfile
 import requests
 from src.config.settings import API_BASE_URL
+from src.core.http_transport import HttpTransport
+from src.core.single_flight import SingleFlight
+
+# Tamaño de cada bloque escrito a disco en descargas por streaming
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadCancelled(Exception):
+    """La descarga fue cancelada por el usuario antes de completarse."""
 
 
 class ApiClient:
@@ -22,6 +33,11 @@ class ApiClient:
         self.user_id = None
         self.user_name = None
         self.rol_ris = None
+        # Sesión keep-alive compartida por todos los hilos
+        self.transport = HttpTransport()
+        self.session = self.transport.session
+        # GETs idénticos concurrentes comparten una sola llamada HTTP
+        self._get_flight = SingleFlight()
         self._initialized = True
 
     def set_token(self, token: str):
@@ -76,6 +92,12 @@ class ApiClient:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
     
+    def pool_stats(self) -> dict:
+        return self.transport.stats()
+
+    def coalescing_stats(self) -> dict:
+        return self._get_flight.stats()
+
     def _build_url(self, path: str) -> str:
         # 👉 Evita // y permite query params sin problemas
         return f"{self.base_url}/{path.lstrip('/')}"
@@ -85,9 +107,13 @@ class ApiClient:
     # ===============================
     def get(self, path: str, params: dict = None):
         url = self._build_url(path)
+        flight_key = (url, json.dumps(params, sort_keys=True, default=str), self.token)
+        return self._get_flight.do(flight_key, self._do_get, url, path, params)
+
+    def _do_get(self, url: str, path: str, params: dict = None):
         print(f"[API REQUEST] GET {url} | Params: {params}")
         try:
-            response = requests.get(url, headers=self._headers(), params=params)
+            response = self.session.get(url, headers=self._headers(), params=params)
             print(f"[API RESPONSE] {response.status_code} GET {path}")
             response.raise_for_status()
             return response.json()
@@ -95,11 +121,38 @@ class ApiClient:
             print(f"[API ERROR] GET {path}: {str(e)}")
             raise e
 
+    def get_conditional(self, path: str, params: dict = None, etag: str = None, last_modified: str = None):
+        """
+        GET condicional. Devuelve (status_code, data, validators); con 304 data es None
+        y el llamador debe reutilizar el cuerpo que ya tiene en cache.
+        """
+        url = self._build_url(path)
+        headers = self._headers()
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        print(f"[API REQUEST] GET {url} | Params: {params} | Condicional: {bool(etag or last_modified)}")
+        try:
+            response = self.session.get(url, headers=headers, params=params)
+            print(f"[API RESPONSE] {response.status_code} GET {path}")
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            if response.status_code == 304:
+                return 304, None, validators
+            response.raise_for_status()
+            return response.status_code, response.json(), validators
+        except Exception as e:
+            print(f"[API ERROR] GET {path}: {str(e)}")
+            raise e
+
     def get_raw(self, path: str, params: dict = None):
         url = self._build_url(path)
         print(f"[API REQUEST] GET RAW {url}")
         try:
-            response = requests.get(url, headers=self._headers(), params=params)
+            response = self.session.get(url, headers=self._headers(), params=params)
             print(f"[API RESPONSE] {response.status_code} GET RAW {path}")
             response.raise_for_status()
             return response.content
@@ -107,13 +160,57 @@ class ApiClient:
             print(f"[API ERROR] GET RAW {path}: {str(e)}")
             raise e
 
+    def download_to_file(self, path: str, file_path: str, params: dict = None,
+                         progress=None, is_cancelled=None):
+        """
+        Descarga el cuerpo de la respuesta por bloques a un archivo temporal junto
+        a file_path y lo renombra al terminar, sin mantener el archivo en memoria.
+        progress(bytes_leidos, bytes_totales) se llama tras cada bloque (total 0 si
+        el servidor no informa Content-Length); si is_cancelled() devuelve True se
+        aborta con DownloadCancelled y se elimina el temporal.
+        """
+        url = self._build_url(path)
+        print(f"[API REQUEST] GET STREAM {url} | Params: {params}")
+        target_dir = os.path.dirname(os.path.abspath(file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".descarga_", suffix=".part", dir=target_dir)
+        try:
+            with self.session.get(url, headers=self._headers(), params=params, stream=True) as response:
+                print(f"[API RESPONSE] {response.status_code} GET STREAM {path}")
+                response.raise_for_status()
+                total = int(response.headers.get("Content-Length") or 0)
+                received = 0
+                with os.fdopen(fd, "wb") as f:
+                    fd = None
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if is_cancelled and is_cancelled():
+                            raise DownloadCancelled(path)
+                        if not chunk:
+                            continue
+                        f.write(chunk)
+                        received += len(chunk)
+                        if progress:
+                            progress(received, total)
+            os.replace(tmp_path, file_path)
+            return received
+        except DownloadCancelled:
+            print(f"[API] Descarga cancelada: GET {path}")
+            raise
+        except Exception as e:
+            print(f"[API ERROR] GET STREAM {path}: {str(e)}")
+            raise e
+        finally:
+            if fd is not None:
+                os.close(fd)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     # ===============================
     # POST
     # ===============================
     def post(self, path: str, data: dict):
         url = self._build_url(path)
         print(f"[API REQUEST] POST {url} | Data: {data}")
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, json=data, headers=self._headers())
         print(f"[API RESPONSE] {response.status_code} POST {path}")
         try:
             response.raise_for_status()
@@ -135,7 +232,7 @@ class ApiClient:
     def delete(self, path: str):
         url = self._build_url(path)
         print(f"[API REQUEST] DELETE {url}")
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         print(f"[API RESPONSE] {response.status_code} DELETE {path}")
         try:
             response.raise_for_status()
@@ -150,7 +247,7 @@ class ApiClient:
     def put(self, path: str, payload: dict):
         url = self._build_url(path)
         print(f"[API REQUEST] PUT {url} | Payload: {payload}")
-        response = requests.put(url, json=payload, headers=self._headers())
+        response = self.session.put(url, json=payload, headers=self._headers())
         print(f"[API RESPONSE] {response.status_code} PUT {path}")
         try:
             response.raise_for_status()
@@ -165,7 +262,7 @@ class ApiClient:
     def patch(self, path: str, payload: dict):
         url = self._build_url(path)
         print(f"[API REQUEST] PATCH {url} | Payload: {payload}")
-        response = requests.patch(url, json=payload, headers=self._headers())
+        response = self.session.patch(url, json=payload, headers=self._headers())
         print(f"[API RESPONSE] {response.status_code} PATCH {path}")
         try:
             response.raise_for_status()
@@ -0,0 +1,91 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.settings import (
+    API_POOL_CONNECTIONS,
+    API_POOL_MAXSIZE,
+    API_POOL_BLOCK,
+    API_KEEP_ALIVE,
+    API_MAX_RETRIES,
+    API_RETRY_BACKOFF,
+)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter que además de mantener el pool de conexiones keep-alive
+    permite consultar cuántas peticiones reutilizaron una conexión abierta.
+    """
+
+    def pool_stats(self) -> dict:
+        stats = {"pools": 0, "connections": 0, "requests": 0}
+        pools = self.poolmanager.pools
+        with pools.lock:
+            active_pools = [pools[key] for key in pools.keys()]
+
+        for pool in active_pools:
+            stats["pools"] += 1
+            stats["connections"] += getattr(pool, "num_connections", 0)
+            stats["requests"] += getattr(pool, "num_requests", 0)
+        return stats
+
+
+class HttpTransport:
+    """
+    Sesión HTTP única y compartida por todos los hilos (ApiWorker,
+    ComboLoaderRunnable, etc.) para reutilizar conexiones TCP/TLS abiertas.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(HttpTransport, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Solo reintentamos métodos idempotentes ante caídas transitorias del backend
+        retry = Retry(
+            total=API_MAX_RETRIES,
+            backoff_factor=API_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+            raise_on_status=False,
+        )
+        self.adapter = PooledHTTPAdapter(
+            pool_connections=API_POOL_CONNECTIONS,
+            pool_maxsize=API_POOL_MAXSIZE,
+            pool_block=API_POOL_BLOCK,
+            max_retries=retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        if not API_KEEP_ALIVE:
+            self.session.headers["Connection"] = "close"
+
+        self._initialized = True
+
+    def stats(self) -> dict:
+        """
+        Devuelve el uso del pool: peticiones totales, conexiones abiertas y
+        cuántas peticiones fueron atendidas por una conexión ya existente (hits).
+        """
+        stats = self.adapter.pool_stats()
+        reused = max(0, stats["requests"] - stats["connections"])
+        stats["reused"] = reused
+        stats["hit_ratio"] = round(reused / stats["requests"], 3) if stats["requests"] else 0.0
+        return stats
+
+    def close(self):
+        self.session.close()
@@ -9,7 +9,7 @@ class AuthService:
     def login(self, rut: str, password: str) -> dict:
         url = self.api._build_url("/auth/login")
         try:
-            response = requests.post(url, json={"rut": rut, "password": password}, headers=self.api._headers(), timeout=15)
+            response = self.api.session.post(url, json={"rut": rut, "password": password}, headers=self.api._headers(), timeout=15)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.ConnectionError:
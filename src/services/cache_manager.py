@@ -1,82 +1,56 @@
-import json
-import os
-from PySide6.QtCore import QStandardPaths, QDateTime, Qt, QMutex, QMutexLocker
+from src.services.catalogo_cache import CatalogoCache
 
 class CacheManager:
     def __init__(self):
-        self.cache_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
-        self.cache_file = os.path.join(self.cache_dir, "catalog_cache.json")
-        self.ttl_minutes = 24 * 60  # 24 hours
-        self.mutex = QMutex()
+        # Todas las instancias comparten la misma cache en memoria del proceso
+        self.store = CatalogoCache()
+        self.cache_dir = self.store.cache_dir
 
-    def _load_cache(self):
-        if not os.path.exists(self.cache_file):
-            return {}
-        try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Cache load error: {e}")
+    def get(self, key):
+        entry = self.store.get_entry(key)
+        if self.store.is_fresh(entry):
+            return entry.get("data")
+        return None
+
+    def get_stale(self, key):
+        """
+        Devuelve (data, is_fresh). Una entrada vencida pero dentro del margen
+        de gracia se devuelve con is_fresh=False para stale-while-revalidate.
+        """
+        entry = self.store.get_entry(key)
+        if self.store.is_fresh(entry):
+            return entry.get("data"), True
+        if self.store.is_servable_stale(key, entry):
+            return entry.get("data"), False
+        return None, False
+
+    def set(self, key, data, ttl=None, validators=None):
+        """
+        Guarda un valor; ttl en segundos (por defecto según el prefijo de la llave).
+        validators: {"etag", "last_modified"} de la respuesta HTTP, para GET condicional.
+        """
+        self.store.set(key, data, ttl, validators)
+
+    def get_validators(self, key):
+        """Validadores HTTP guardados junto a la entrada (vacío si no hay cuerpo reutilizable)."""
+        entry = self.store.get_entry(key)
+        if not entry:
             return {}
+        return {name: entry[name] for name in ("etag", "last_modified") if entry.get(name)}
 
-    def _save_cache(self, cache_data):
-        try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False)
-        except Exception as e:
-            print(f"Cache save error: {e}")
-
-    def get(self, key):
-        with QMutexLocker(self.mutex):
-            cache = self._load_cache()
-            if key in cache:
-                entry = cache[key]
-                timestamp = entry.get("timestamp")
-                if timestamp:
-                    try:
-                        # Fix: Check if timestamp is ISO string (legacy/buggy cache) or seconds since epoch
-                        if isinstance(timestamp, str) and 'T' in timestamp:
-                            saved_time = QDateTime.fromString(timestamp, Qt.ISODate)
-                        else:
-                            # Handle both int and float timestamps (even if stringified)
-                            saved_time = QDateTime.fromSecsSinceEpoch(int(float(timestamp)))
-                        
-                        if saved_time.isValid() and saved_time.secsTo(QDateTime.currentDateTime()) < self.ttl_minutes * 60:
-                            return entry.get("data")
-                    except Exception as e:
-                        print(f"Cache timestamp error: {e}")
-                        # If timestamp is bad, ignore cache entry
-                        pass
+    def mark_revalidated(self, key, validators=None):
+        """Tras un 304: extiende el TTL de la entrada y devuelve el cuerpo en cache."""
+        entry = self.store.get_entry(key)
+        if not entry:
             return None
-
-    def set(self, key, data):
-        with QMutexLocker(self.mutex):
-            cache = self._load_cache()
-            cache[key] = {
-                "timestamp": QDateTime.currentDateTime().toSecsSinceEpoch(),
-                "data": data
-            }
-            self._save_cache(cache)
+        self.store.touch(key, validators=validators)
+        return entry.get("data")
 
     def clear(self):
-        with QMutexLocker(self.mutex):
-            if os.path.exists(self.cache_file):
-                os.remove(self.cache_file)
+        self.store.clear()
 
     def remove(self, key):
-        with QMutexLocker(self.mutex):
-            cache = self._load_cache()
-            if key in cache:
-                del cache[key]
-                self._save_cache(cache)
+        self.store.remove(key)
 
     def remove_prefix(self, prefix):
-        with QMutexLocker(self.mutex):
-            cache = self._load_cache()
-            keys_to_delete = [k for k in cache.keys() if k.startswith(prefix)]
-            if keys_to_delete:
-                for k in keys_to_delete:
-                    del cache[k]
-                self._save_cache(cache)
+        self.store.remove_prefix(prefix)
@@ -0,0 +1,246 @@
+import json
+import marshal
+import os
+import sqlite3
+import threading
+import zlib
+
+# Namespace por prefijo de llave (el primer prefijo que coincide gana)
+NAMESPACE_PREFIXES = [
+    ("usuarios_list_", "usuarios"),
+    ("usuarios_permissions", "permisos"),
+    ("catalogo_inventario_", "inventario"),
+    ("indicadores_", "indicadores"),
+]
+DEFAULT_NAMESPACE = "catalogos"
+
+# Payloads sobre este tamaño se comprimen
+COMPRESS_THRESHOLD = 8 * 1024
+
+_FORMAT_MARSHAL = b"M"
+_FORMAT_MARSHAL_ZLIB = b"Z"
+
+
+def namespace_for_key(key):
+    for prefix, namespace in NAMESPACE_PREFIXES:
+        if key.startswith(prefix):
+            return namespace
+    return DEFAULT_NAMESPACE
+
+
+def encode_payload(data):
+    """Serializa un valor JSON-compatible a un formato binario compacto."""
+    raw = marshal.dumps(data)
+    if len(raw) > COMPRESS_THRESHOLD:
+        return _FORMAT_MARSHAL_ZLIB + zlib.compress(raw, 1)
+    return _FORMAT_MARSHAL + raw
+
+
+def decode_payload(blob):
+    blob = bytes(blob)
+    fmt, body = blob[:1], blob[1:]
+    if fmt == _FORMAT_MARSHAL_ZLIB:
+        return marshal.loads(zlib.decompress(body))
+    if fmt == _FORMAT_MARSHAL:
+        return marshal.loads(body)
+    raise ValueError(f"Formato de payload desconocido: {fmt!r}")
+
+
+class ShardedCacheStore:
+    """
+    Almacenamiento en disco de la cache, con un archivo SQLite por namespace
+    (catálogos, inventario, indicadores, usuarios, permisos).
+
+    La tabla de cada shard está indexada por llave, de modo que se puede leer
+    el índice (metadatos) sin deserializar los datos, y leer un catálogo sin
+    tocar los demás.
+    """
+
+    def __init__(self, base_dir):
+        self.store_dir = os.path.join(base_dir, "cache_store")
+        if not os.path.exists(self.store_dir):
+            os.makedirs(self.store_dir)
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    # ===============================
+    # Conexiones
+    # ===============================
+    def _shard_path(self, namespace):
+        return os.path.join(self.store_dir, f"{namespace}.sqlite3")
+
+    def _connection(self, namespace):
+        conn = self._connections.get(namespace)
+        if conn is None:
+            conn = sqlite3.connect(self._shard_path(namespace), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " timestamp INTEGER NOT NULL,"
+                " ttl INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT)"
+            )
+            # Shards creados antes de guardar validadores HTTP
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE entries ADD COLUMN {column} TEXT")
+            conn.commit()
+            self._connections[namespace] = conn
+        return conn
+
+    def _existing_namespaces(self):
+        namespaces = []
+        for name in os.listdir(self.store_dir):
+            if name.endswith(".sqlite3"):
+                namespaces.append(name[:-len(".sqlite3")])
+        return namespaces
+
+    def is_empty(self):
+        return not self._existing_namespaces()
+
+    # ===============================
+    # Lectura
+    # ===============================
+    def load_index(self):
+        """Devuelve {key: {timestamp, ttl, size, etag, last_modified}} de todos los shards, sin payloads."""
+        index = {}
+        with self._lock:
+            for namespace in self._existing_namespaces():
+                try:
+                    rows = self._connection(namespace).execute(
+                        "SELECT key, timestamp, ttl, size, etag, last_modified FROM entries"
+                    ).fetchall()
+                except sqlite3.DatabaseError as e:
+                    print(f"[CacheStore] Shard '{namespace}' ilegible, se descarta: {e}")
+                    self._drop_shard(namespace)
+                    continue
+                for key, timestamp, ttl, size, etag, last_modified in rows:
+                    meta = {"timestamp": timestamp, "ttl": ttl, "size": size}
+                    if etag:
+                        meta["etag"] = etag
+                    if last_modified:
+                        meta["last_modified"] = last_modified
+                    index[key] = meta
+        return index
+
+    def read(self, key):
+        """Devuelve el dato almacenado para la llave, o None si no existe o está corrupto."""
+        namespace = namespace_for_key(key)
+        with self._lock:
+            row = self._connection(namespace).execute(
+                "SELECT payload FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return decode_payload(row[0])
+        except Exception as e:
+            print(f"[CacheStore] Error decodificando '{key}': {e}")
+            return None
+
+    # ===============================
+    # Escritura
+    # ===============================
+    def write(self, entries, deleted_keys=()):
+        """
+        Persiste en una transacción por shard las entradas modificadas
+        ({key: {timestamp, ttl, size, data, etag, last_modified}}) y elimina
+        las llaves borradas. Una entrada sin "data" solo actualiza metadatos
+        (por ejemplo, tras un 304 que extiende el TTL).
+        """
+        upserts_by_ns = {}
+        touches_by_ns = {}
+        for key, entry in entries.items():
+            namespace = namespace_for_key(key)
+            if "data" not in entry:
+                touches_by_ns.setdefault(namespace, []).append((
+                    int(entry["timestamp"]),
+                    int(entry["ttl"]),
+                    entry.get("etag"),
+                    entry.get("last_modified"),
+                    key,
+                ))
+                continue
+            upserts_by_ns.setdefault(namespace, []).append((
+                key,
+                int(entry["timestamp"]),
+                int(entry["ttl"]),
+                int(entry.get("size", 0)),
+                encode_payload(entry.get("data")),
+                entry.get("etag"),
+                entry.get("last_modified"),
+            ))
+
+        deletes_by_ns = {}
+        for key in deleted_keys:
+            deletes_by_ns.setdefault(namespace_for_key(key), []).append((key,))
+
+        with self._lock:
+            for namespace in set(upserts_by_ns) | set(touches_by_ns) | set(deletes_by_ns):
+                conn = self._connection(namespace)
+                with conn:
+                    if namespace in deletes_by_ns:
+                        conn.executemany("DELETE FROM entries WHERE key = ?", deletes_by_ns[namespace])
+                    if namespace in upserts_by_ns:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO entries"
+                            " (key, timestamp, ttl, size, payload, etag, last_modified)"
+                            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            upserts_by_ns[namespace],
+                        )
+                    if namespace in touches_by_ns:
+                        conn.executemany(
+                            "UPDATE entries SET timestamp = ?, ttl = ?, etag = ?, last_modified = ?"
+                            " WHERE key = ?",
+                            touches_by_ns[namespace],
+                        )
+
+    def clear(self):
+        with self._lock:
+            for namespace in self._existing_namespaces():
+                self._drop_shard(namespace)
+
+    def _drop_shard(self, namespace):
+        conn = self._connections.pop(namespace, None)
+        if conn is not None:
+            conn.close()
+        path = self._shard_path(namespace)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    # ===============================
+    # Migración
+    # ===============================
+    def migrate_from_json(self, json_path, normalize_entry):
+        """
+        Importa una única vez el antiguo catalog_cache.json y lo renombra para
+        no volver a procesarlo. normalize_entry(key, entry) devuelve la entrada
+        normalizada o None para descartarla.
+        """
+        if not os.path.exists(json_path):
+            return 0
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except Exception as e:
+            print(f"[CacheStore] No se pudo leer cache legado: {e}")
+            raw = {}
+
+        entries = {}
+        for key, entry in raw.items():
+            normalized = normalize_entry(key, entry)
+            if normalized is not None:
+                entries[key] = normalized
+
+        if entries:
+            self.write(entries)
+        os.replace(json_path, json_path + ".migrated")
+        print(f"[CacheStore] Migradas {len(entries)} entradas desde {os.path.basename(json_path)}")
+        return len(entries)
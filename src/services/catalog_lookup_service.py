@@ -0,0 +1,169 @@
+import threading
+from collections.abc import Mapping
+
+from src.services.catalogo_service import CatalogoService
+from src.services.config_registry import ConfigRegistry
+
+
+class CatalogLookup:
+    """
+    Tabla id -> nombre de un catálogo, compilada una sola vez. Las llaves se
+    comparan como texto, igual que la comparación laxa str(id) == str(valor).
+    """
+
+    def __init__(self, rows, source=None):
+        self.source = source
+        self.labels = {}
+        self.positions = {}
+        for position, row in enumerate(rows or []):
+            if not isinstance(row, Mapping) or row.get("id") is None:
+                continue
+            key = str(row["id"])
+            if key not in self.labels:
+                self.labels[key] = row.get("nombre", "")
+                self.positions[key] = position
+
+    @classmethod
+    def from_combo(cls, combo):
+        """Tabla sobre los ítems ya cargados en un QComboBox (posición = índice del ítem)."""
+        rows = [
+            {"id": combo.itemData(i), "nombre": combo.itemText(i)}
+            for i in range(combo.count())
+        ]
+        return cls(rows)
+
+    def __contains__(self, value):
+        return str(value) in self.labels
+
+    def label(self, value, default=None):
+        return self.labels.get(str(value), default)
+
+    def position(self, value):
+        return self.positions.get(str(value), -1)
+
+    def map_values(self, values):
+        """Traduce un id o una lista de ids; los desconocidos se devuelven como texto."""
+        if values is None:
+            return None
+        if isinstance(values, list):
+            return [self.labels.get(str(v), str(v)) for v in values]
+        return self.labels.get(str(values), str(values))
+
+    def join_labels(self, values, separator=", "):
+        """Nombres de los ids conocidos de una selección múltiple, unidos."""
+        return separator.join(self.labels[str(v)] for v in values if str(v) in self.labels)
+
+
+class CatalogLookupService:
+    """
+    Resuelve ids de catálogo a nombres con tablas compiladas compartidas por
+    todo el proceso.
+
+    Cada tabla se asocia al objeto de datos del que se compiló; si la entrada
+    de cache del catálogo se reemplaza (revalidación, invalidación, recarga),
+    get_catalogo devuelve otro objeto y la tabla se recompila.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(CatalogLookupService, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.catalogo_service = CatalogoService()
+        self._tables = {}        # (endpoint, cache_key) -> CatalogLookup
+        self._form_fields = {}   # config_path -> (CompiledFormConfig, {key: CatalogLookup estático})
+        self._mutex = threading.Lock()
+        self._initialized = True
+
+    # ===============================
+    # Catálogos
+    # ===============================
+    def lookup(self, endpoint, cache_key=None):
+        """Tabla compilada del catálogo (usa la cache de catálogos; puede bloquear si hay que descargar)."""
+        rows = self.catalogo_service.get_catalogo(endpoint, cache_key) or []
+        table_key = (endpoint, cache_key)
+        with self._mutex:
+            table = self._tables.get(table_key)
+            if table is not None and table.source is rows:
+                return table
+        table = CatalogLookup(rows, source=rows)
+        with self._mutex:
+            self._tables[table_key] = table
+        return table
+
+    # ===============================
+    # Enriquecimiento de registros
+    # ===============================
+    def _form_config(self, config_path):
+        """Mapa de campos del formulario (ConfigRegistry) y tablas de sus combos estáticos."""
+        compiled = ConfigRegistry().form(config_path)
+        with self._mutex:
+            cached = self._form_fields.get(compiled.path)
+            if cached and cached[0] is compiled:
+                return compiled.field_map, cached[1]
+
+        static_tables = {
+            key: CatalogLookup(field.get("options", []))
+            for key, field in compiled.field_map.items()
+            if field.get("type") == "combo_static"
+        }
+        with self._mutex:
+            self._form_fields[compiled.path] = (compiled, static_tables)
+        return compiled.field_map, static_tables
+
+    def _field_tables(self, config_path, keys):
+        """{campo: (tipo, CatalogLookup)} de los campos catalogados presentes en keys."""
+        field_map, static_tables = self._form_config(config_path)
+        tables = {}
+        for key in keys:
+            field_cfg = field_map.get(key)
+            if not field_cfg:
+                continue
+            ftype = field_cfg.get("type")
+            if ftype == "combo_static":
+                tables[key] = (ftype, static_tables[key])
+            elif ftype == "combo":
+                source = field_cfg.get("source")
+                # Los combos dependientes ({value} en la URL) no se pueden resolver aquí
+                if source and "{" not in source:
+                    try:
+                        table = self.lookup(source, field_cfg.get("cache_key"))
+                        if table.labels:
+                            tables[key] = (ftype, table)
+                    except Exception as e:
+                        print(f"Error resolving catalog {source}: {e}")
+        return tables
+
+    def enrich(self, data, config_path):
+        """Copia del registro con los ids de catálogo reemplazados por sus nombres."""
+        return self.enrich_many([data], config_path)[0]
+
+    def enrich_many(self, records, config_path):
+        """Igual que enrich, resolviendo cada catálogo una sola vez para todos los registros."""
+        keys = set()
+        for record in records:
+            keys.update(record.keys())
+        tables = self._field_tables(config_path, keys)
+
+        enriched_records = []
+        for record in records:
+            enriched = record.copy()
+            for key, (ftype, table) in tables.items():
+                value = record.get(key)
+                if value is None:
+                    continue
+                # Soporte selección múltiple (lista de IDs) en combos dinámicos
+                if ftype == "combo" and isinstance(value, list):
+                    enriched[key] = table.join_labels(value)
+                elif value in table:
+                    enriched[key] = table.label(value)
+            enriched_records.append(enriched)
+        return enriched_records
@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from src.config.settings import CATALOG_PREFETCH_ENABLED, CATALOG_PREFETCH_CONCURRENCY
+from src.services.cache_manager import CacheManager
+from src.services.catalogo_service import CatalogoService
+from src.services.inventory_cache_service import InventoryCacheService
+from src.workers.combo_loader import ComboLoaderRunnable
+
+FORMULARIOS_DIR = Path(__file__).resolve().parent.parent / "config" / "formularios"
+
+COMBO_TYPES = ("combo", "radio_combo", "combo_text")
+
+# Llaves que mantiene otro servicio con un formato propio
+EXCLUDED_CACHE_KEYS = {InventoryCacheService.CATALOGO_KEY}
+
+
+def collect_static_catalogs(config_dir=FORMULARIOS_DIR):
+    """
+    Recorre los formularios JSON y devuelve {cache_key: endpoint} de los combos
+    con origen estático (sin depends_on ni parámetros en la URL).
+    """
+    catalogs = {}
+
+    def visit(node):
+        if isinstance(node, dict):
+            source = node.get("source")
+            cache_key = node.get("cache_key")
+            if (
+                node.get("type") in COMBO_TYPES
+                and source and cache_key
+                and not node.get("depends_on")
+                and "{" not in source
+                and cache_key not in EXCLUDED_CACHE_KEYS
+            ):
+                catalogs.setdefault(cache_key, source)
+            for value in node.values():
+                visit(value)
+        elif isinstance(node, list):
+            for value in node:
+                visit(value)
+
+    for path in sorted(Path(config_dir).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                visit(json.load(f))
+        except Exception as e:
+            print(f"[CatalogPrefetch] No se pudo leer {path.name}: {e}")
+    return catalogs
+
+
+class CatalogPrefetchService(QObject):
+    """
+    Precalienta la cache de catálogos de todos los formularios tras el login,
+    con concurrencia acotada, para que abrir un formulario no pague la latencia
+    de cada endpoint. Las entradas aún frescas se omiten.
+    """
+    finished = Signal(dict)  # cache_key -> segundos (None si falló)
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(CatalogPrefetchService, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        super().__init__()
+        self.cache = CacheManager()
+        self.catalogo_service = CatalogoService()
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(max(1, CATALOG_PREFETCH_CONCURRENCY))
+        self._catalogs = None
+        self._timings = {}
+        self._pending = 0
+        self._started_at = 0.0
+        self._state_lock = threading.Lock()
+        self._initialized = True
+
+    def prefetch_all(self):
+        if not CATALOG_PREFETCH_ENABLED:
+            return
+        with self._state_lock:
+            if self._pending:
+                print("[CatalogPrefetch] Precarga ya en curso")
+                return
+
+        if self._catalogs is None:
+            self._catalogs = collect_static_catalogs()
+
+        targets = [
+            (cache_key, endpoint)
+            for cache_key, endpoint in self._catalogs.items()
+            if self.cache.get(cache_key) is None
+        ]
+        skipped = len(self._catalogs) - len(targets)
+        print(f"[CatalogPrefetch] {len(targets)} catálogos por precargar, {skipped} ya frescos")
+        if not targets:
+            return
+
+        with self._state_lock:
+            self._timings = {}
+            self._pending = len(targets)
+            self._started_at = time.perf_counter()
+
+        for cache_key, endpoint in targets:
+            worker = ComboLoaderRunnable(self._fetch_one, endpoint, cache_key)
+            self.thread_pool.start(worker)
+
+    def _fetch_one(self, endpoint, cache_key):
+        start = time.perf_counter()
+        elapsed = None
+        try:
+            # Sin allow_stale: una entrada vencida se descarga aquí, dentro del
+            # pool acotado, en vez de devolverse vieja y revalidarse aparte
+            self.catalogo_service.get_catalogo(endpoint, cache_key, allow_stale=False)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            print(f"[CatalogPrefetch] Error precargando {endpoint}: {e}")
+        finally:
+            self._record(cache_key, endpoint, elapsed)
+
+    def _record(self, cache_key, endpoint, elapsed):
+        with self._state_lock:
+            self._timings[cache_key] = elapsed
+            self._pending -= 1
+            done = self._pending == 0
+            timings = dict(self._timings)
+            total = time.perf_counter() - self._started_at
+
+        if elapsed is not None:
+            print(f"[CatalogPrefetch] {endpoint} en {elapsed * 1000:.0f} ms")
+        if done:
+            print(f"[CatalogPrefetch] Precarga completa: {len(timings)} catálogos en {total:.2f} s")
+            self.finished.emit(timings)
+
+    def timings(self):
+        with self._state_lock:
+            return dict(self._timings)
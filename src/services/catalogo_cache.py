@@ -0,0 +1,328 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from PySide6.QtCore import QStandardPaths, QDateTime, Qt
+
+from src.config.settings import CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+from src.services.cache_store import ShardedCacheStore
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60  # 24 hours
+
+# TTL por prefijo de llave (el primer prefijo que coincide gana)
+TTL_POLICIES = [
+    ("usuarios_list_", 60),  # Páginas de usuarios: cambian seguido y se generan por búsqueda
+]
+
+
+# Tiempo adicional que una entrada vencida se conserva para servirse como
+# "stale" mientras se revalida en segundo plano
+DEFAULT_STALE_GRACE_SECONDS = 7 * 24 * 60 * 60  # 7 days
+STALE_GRACE_POLICIES = [
+    ("usuarios_list_", 0),
+]
+
+
+def ttl_for_key(key):
+    for prefix, ttl in TTL_POLICIES:
+        if key.startswith(prefix):
+            return ttl
+    return DEFAULT_TTL_SECONDS
+
+
+def stale_grace_for_key(key):
+    for prefix, grace in STALE_GRACE_POLICIES:
+        if key.startswith(prefix):
+            return grace
+    return DEFAULT_STALE_GRACE_SECONDS
+
+
+def entry_size(data):
+    """Tamaño aproximado en bytes de un valor serializado."""
+    try:
+        return len(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    except Exception:
+        return 0
+
+
+class CatalogoCache:
+    """
+    Capa de cache en memoria compartida por todo el proceso.
+
+    Al iniciar solo se lee el índice (metadatos) del almacenamiento en disco;
+    cada dato se deserializa la primera vez que se pide y luego se sirve desde
+    memoria. Las escrituras se marcan como pendientes y se vuelcan en segundo
+    plano al shard correspondiente (ver ShardedCacheStore).
+
+    Cada entrada guarda su propio TTL y tamaño. La cache está acotada por
+    cantidad de entradas y bytes totales, desalojando las menos usadas (LRU).
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(CatalogoCache, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.cache_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        # Archivo único de versiones anteriores, se migra una sola vez
+        self.legacy_file = os.path.join(self.cache_dir, "catalog_cache.json")
+        self.store = ShardedCacheStore(self.cache_dir)
+
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self.max_entries = CACHE_MAX_ENTRIES
+        self.max_bytes = CACHE_MAX_BYTES
+        self._loaded = False
+        self._dirty_keys = set()
+        self._deleted_keys = set()
+        self._mutex = threading.RLock()
+
+        # Write-behind: agrupamos escrituras cercanas en un único volcado
+        self.flush_delay = 1.0
+        self._flush_event = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush)
+
+        self._initialized = True
+
+    # ===============================
+    # Carga
+    # ===============================
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        if self.store.is_empty():
+            self.store.migrate_from_json(self.legacy_file, self._normalize_legacy_entry)
+
+        now = time.time()
+        index = self.store.load_index()
+        expired = [
+            k for k, meta in index.items()
+            if now - meta["timestamp"] >= meta["ttl"] + stale_grace_for_key(k)
+        ]
+        for key in expired:
+            del index[key]
+        if expired:
+            print(f"[CatalogoCache] {len(expired)} entradas expiradas descartadas al cargar")
+            self._deleted_keys.update(expired)
+            self._flush_event.set()
+
+        # Orden por antigüedad para reconstruir el LRU de forma aproximada
+        self._entries = OrderedDict(sorted(index.items(), key=lambda kv: kv[1]["timestamp"]))
+        self._total_bytes = sum(e.get("size", 0) for e in self._entries.values())
+        self._loaded = True
+        self._evict_if_needed()
+
+    def _normalize_legacy_entry(self, key, entry):
+        if not isinstance(entry, dict):
+            return None
+        timestamp = self._normalize_timestamp(entry.get("timestamp"))
+        if timestamp is None:
+            return None
+        return {
+            "timestamp": timestamp,
+            "ttl": entry.get("ttl", ttl_for_key(key)),
+            "size": entry.get("size") or entry_size(entry.get("data")),
+            "data": entry.get("data"),
+        }
+
+    def _normalize_timestamp(self, timestamp):
+        """Convierte timestamps legados (ISO o string) a segundos desde epoch."""
+        if timestamp is None:
+            return None
+        try:
+            if isinstance(timestamp, str) and 'T' in timestamp:
+                saved_time = QDateTime.fromString(timestamp, Qt.ISODate)
+                return saved_time.toSecsSinceEpoch() if saved_time.isValid() else None
+            return int(float(timestamp))
+        except Exception as e:
+            print(f"Cache timestamp error: {e}")
+            return None
+
+    # ===============================
+    # Acceso
+    # ===============================
+    def get_entry(self, key):
+        with self._mutex:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if "data" not in entry:
+                # Primera lectura: deserializamos solo este dato desde su shard
+                data = self.store.read(key)
+                if data is None:
+                    self._discard(key)
+                    return None
+                entry["data"] = data
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        if not entry:
+            return False
+        timestamp = entry.get("timestamp")
+        if timestamp is None:
+            return False
+        return time.time() - timestamp < entry.get("ttl", DEFAULT_TTL_SECONDS)
+
+    def is_servable_stale(self, key, entry):
+        """True si la entrada vencida aún está dentro del margen para servirse como stale."""
+        if not entry or entry.get("timestamp") is None:
+            return False
+        max_age = entry.get("ttl", DEFAULT_TTL_SECONDS) + stale_grace_for_key(key)
+        return time.time() - entry["timestamp"] < max_age
+
+    def set(self, key, data, ttl=None, validators=None):
+        size = entry_size(data)
+        with self._mutex:
+            self._ensure_loaded()
+            self._discard(key)
+            entry = {
+                "timestamp": int(time.time()),
+                "ttl": ttl if ttl is not None else ttl_for_key(key),
+                "size": size,
+                "data": data
+            }
+            for name in ("etag", "last_modified"):
+                if validators and validators.get(name):
+                    entry[name] = validators[name]
+            self._entries[key] = entry
+            self._total_bytes += size
+            self._deleted_keys.discard(key)
+            self._dirty_keys.add(key)
+            self._evict_if_needed()
+            self._flush_event.set()
+
+    def touch(self, key, ttl=None, validators=None):
+        """Renueva el timestamp (y opcionalmente TTL y validadores) sin cambiar el dato."""
+        with self._mutex:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry["timestamp"] = int(time.time())
+            if ttl is not None:
+                entry["ttl"] = ttl
+            for name in ("etag", "last_modified"):
+                if validators and validators.get(name):
+                    entry[name] = validators[name]
+            self._entries.move_to_end(key)
+            self._dirty_keys.add(key)
+            self._flush_event.set()
+            return True
+
+    def remove(self, key):
+        with self._mutex:
+            self._ensure_loaded()
+            if self._discard(key):
+                self._flush_event.set()
+
+    def remove_prefix(self, prefix):
+        with self._mutex:
+            self._ensure_loaded()
+            keys_to_delete = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys_to_delete:
+                self._discard(k)
+            if keys_to_delete:
+                self._flush_event.set()
+
+    def stats(self):
+        """Resumen de uso: total de bytes y entradas ordenadas por tamaño."""
+        now = time.time()
+        with self._mutex:
+            self._ensure_loaded()
+            entries = [
+                {
+                    "key": key,
+                    "size": entry.get("size", 0),
+                    "age": int(now - entry.get("timestamp", now)),
+                    "ttl": entry.get("ttl", DEFAULT_TTL_SECONDS),
+                    "in_memory": "data" in entry,
+                }
+                for key, entry in self._entries.items()
+            ]
+            total = self._total_bytes
+        entries.sort(key=lambda e: e["size"], reverse=True)
+        return {"entries": len(entries), "bytes": total, "items": entries}
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._total_bytes -= entry.get("size", 0)
+        self._dirty_keys.discard(key)
+        self._deleted_keys.add(key)
+        return True
+
+    def _evict_if_needed(self):
+        evicted = 0
+        # Nunca desalojamos la última entrada aunque supere el presupuesto por sí sola
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._discard(key)
+            evicted += 1
+        if evicted:
+            print(f"[CatalogoCache] {evicted} entradas desalojadas por LRU")
+
+    def clear(self):
+        with self._flush_lock:
+            with self._mutex:
+                self._entries = OrderedDict()
+                self._total_bytes = 0
+                self._loaded = True
+                self._dirty_keys.clear()
+                self._deleted_keys.clear()
+                self.store.clear()
+                if os.path.exists(self.legacy_file):
+                    os.remove(self.legacy_file)
+
+    # ===============================
+    # Volcado a disco
+    # ===============================
+    def _flush_loop(self):
+        while True:
+            self._flush_event.wait()
+            # Esperamos un poco para agrupar ráfagas de set() (ej. 20 combos de un formulario)
+            time.sleep(self.flush_delay)
+            self._flush_event.clear()
+            self.flush()
+
+    def flush(self):
+        # Serializamos los volcados para que una foto antigua nunca pise a una más nueva
+        with self._flush_lock:
+            with self._mutex:
+                if not self._dirty_keys and not self._deleted_keys:
+                    return
+                changed = {k: dict(self._entries[k]) for k in self._dirty_keys if k in self._entries}
+                deleted = set(self._deleted_keys)
+                self._dirty_keys.clear()
+                self._deleted_keys.clear()
+
+            try:
+                self.store.write(changed, deleted)
+            except Exception as e:
+                print(f"Cache save error: {e}")
+                # Reintentamos en el siguiente ciclo
+                with self._mutex:
+                    self._dirty_keys.update(k for k in changed if k in self._entries)
+                    self._deleted_keys.update(k for k in deleted if k not in self._entries)
+                    self._flush_event.set()
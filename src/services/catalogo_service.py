@@ -1,25 +1,131 @@
+import threading
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
 from src.core.api_client import ApiClient
+from src.core.single_flight import SingleFlight
 from src.services.cache_manager import CacheManager
+from src.workers.combo_loader import ComboLoaderRunnable
+
+# Compartido por todas las instancias: combos que piden el mismo catálogo
+# a la vez esperan una única descarga y una única escritura en cache.
+_catalog_flight = SingleFlight()
+
+
+class CatalogoEvents(QObject):
+    """Notifica a las vistas abiertas cuando un catálogo se revalidó con datos nuevos."""
+    catalogo_updated = Signal(str, object)  # cache_key, data
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(CatalogoEvents, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        super().__init__()
+        self._initialized = True
+
 
 class CatalogoService:
+    # Llaves con una revalidación en segundo plano ya encolada
+    _revalidating = set()
+    _revalidating_lock = threading.Lock()
+
     def __init__(self):
         self.api = ApiClient()
         self.cache = CacheManager()
+        self.events = CatalogoEvents()
+
+    def get_catalogo(self, endpoint, cache_key=None, allow_stale=True):
+        """
+        Devuelve el catálogo desde cache si existe. Con allow_stale, una entrada
+        vencida se devuelve de inmediato y se revalida en segundo plano; si los
+        datos cambian se emite CatalogoEvents.catalogo_updated.
+        """
+        if cache_key:
+            cached_data, is_fresh = self.cache.get_stale(cache_key)
+            if cached_data:
+                if is_fresh:
+                    return cached_data
+                if allow_stale:
+                    self._schedule_revalidation(endpoint, cache_key)
+                    return cached_data
+
+        # If not in cache or no key provided, fetch from API
+        return _catalog_flight.do((endpoint, cache_key), self._fetch_catalogo, endpoint, cache_key)
 
-    def get_catalogo(self, endpoint, cache_key=None):
+    def _fetch_catalogo(self, endpoint, cache_key):
+        # Otro hilo pudo haber completado la descarga mientras esperábamos el turno
         if cache_key:
             cached_data = self.cache.get(cache_key)
             if cached_data:
                 return cached_data
-        
-        # If not in cache or no key provided, fetch from API
-        data = self.api.get(endpoint)
-        
-        if cache_key and data:
-            self.cache.set(cache_key, data)
-            
+
+        data, _ = self._download(endpoint, cache_key)
         return data
 
+    def _download(self, endpoint, cache_key):
+        """
+        Descarga el catálogo con GET condicional si hay validadores guardados.
+        Devuelve (data, changed); con 304 se extiende el TTL y se reutiliza el cuerpo.
+        """
+        validators = self.cache.get_validators(cache_key) if cache_key else {}
+        status, data, new_validators = self.api.get_conditional(
+            endpoint,
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+        )
+        if status == 304:
+            cached_data = self.cache.mark_revalidated(cache_key, new_validators)
+            if cached_data is not None:
+                return cached_data, False
+            # La entrada desapareció entre medio: pedimos el cuerpo completo
+            status, data, new_validators = self.api.get_conditional(endpoint)
+
+        if cache_key and data:
+            self.cache.set(cache_key, data, validators=new_validators)
+        return data, True
+
+    # ===============================
+    # Stale-while-revalidate
+    # ===============================
+    def _schedule_revalidation(self, endpoint, cache_key):
+        with self._revalidating_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+
+        worker = ComboLoaderRunnable(self._revalidate, endpoint, cache_key)
+        QThreadPool.globalInstance().start(worker)
+
+    def _revalidate(self, endpoint, cache_key):
+        try:
+            stale_data, _ = self.cache.get_stale(cache_key)
+            data, changed = _catalog_flight.do(
+                (endpoint, cache_key, "revalidate"), self._download, endpoint, cache_key
+            )
+            if not data:
+                return stale_data
+            if changed and data != stale_data:
+                print(f"[CatalogoService] Catálogo '{cache_key}' revalidado con cambios")
+                self.events.catalogo_updated.emit(cache_key, data)
+            return data
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(cache_key)
+
+    @staticmethod
+    def coalescing_stats():
+        return _catalog_flight.stats()
+
     def clear_cache(self):
         self.cache.clear()
 
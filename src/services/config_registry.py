@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+
+
+class ConfigError(ValueError):
+    """Definición JSON de grilla o formulario inválida."""
+
+
+def iter_form_fields(fields):
+    """Recorre los campos de una sección, entrando en los grupos."""
+    for field in fields or []:
+        if field.get("type") == "group":
+            yield from iter_form_fields(field.get("fields", []))
+        else:
+            yield field
+
+
+def _freeze(value):
+    """Vista de solo lectura de un valor JSON: objetos -> MappingProxyType, listas -> tuplas."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _by_order(items):
+    return tuple(sorted(items or [], key=lambda x: x.get("orden", 0)))
+
+
+class CompiledFormConfig:
+    """
+    Formulario JSON ya parseado y validado, con sus estructuras derivadas.
+    Todo es de solo lectura (MappingProxyType / tuplas) y la misma instancia
+    la comparten todos los diálogos, que la leen directamente sin copiarla.
+    """
+
+    def __init__(self, path, data):
+        if not isinstance(data, dict) or not isinstance(data.get("sections"), (list, tuple)):
+            raise ConfigError(f"{path}: se esperaba un objeto con una lista 'sections'")
+
+        self.path = path
+        self.data = _freeze(data)
+        self.sections = self.data["sections"]
+
+        field_map = {}
+        triggers = {}
+        dependency_configs = {}
+        visibility_graph = {}
+        visibility_rules = {}
+        required_by_section = []
+        for index, section in enumerate(self.sections):
+            required = []
+            for field in iter_form_fields(section.get("fields", [])):
+                key = field.get("key")
+                if not key:
+                    raise ConfigError(f"{path}: campo sin 'key' en la sección {index + 1}")
+                field_map[key] = field
+                if "triggers_reload" in field:
+                    triggers[key] = tuple(field["triggers_reload"])
+                if "depends_on" in field:
+                    dependency_configs[key] = field
+                rule = field.get("visible_when")
+                if rule and rule.get("field"):
+                    visibility_graph.setdefault(rule["field"], []).append(key)
+                    visibility_rules[key] = rule
+                if field.get("required", False):
+                    required.append(key)
+            required_by_section.append(tuple(required))
+
+        self.field_map = MappingProxyType(field_map)                  # key -> config del campo
+        self.triggers = MappingProxyType(triggers)                    # key -> keys que recarga (triggers_reload)
+        self.dependency_configs = MappingProxyType(dependency_configs)  # key -> config de campos con depends_on
+        self.visibility_graph = MappingProxyType(
+            {k: tuple(v) for k, v in visibility_graph.items()}
+        )                                                              # origen -> keys con visible_when
+        self.visibility_rules = MappingProxyType(visibility_rules)    # key -> su regla visible_when
+        self.required_by_section = tuple(required_by_section)         # índice de sección -> keys requeridas
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+
+class CompiledGridConfig:
+    """
+    Grilla JSON ya parseada y validada, con columnas, acciones e indicadores
+    ordenados. Compartida y de solo lectura, igual que CompiledFormConfig.
+    """
+
+    def __init__(self, path, data):
+        if not isinstance(data, dict):
+            raise ConfigError(f"{path}: se esperaba un objeto JSON")
+        for key in ("id", "endpoints", "columnas"):
+            if key not in data:
+                raise ConfigError(f"{path}: falta la llave obligatoria '{key}'")
+        if "listado" not in data["endpoints"]:
+            raise ConfigError(f"{path}: falta 'endpoints.listado'")
+        for col in data["columnas"]:
+            if "campo_api" not in col or "etiqueta" not in col:
+                raise ConfigError(f"{path}: columna sin 'campo_api' o 'etiqueta'")
+
+        self.path = path
+        self.data = _freeze(data)
+        self.columns = _by_order(self.data["columnas"])
+        self.actions = _by_order(self.data.get("acciones"))
+        self.indicators = _by_order(self.data.get("indicadores"))
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+
+class ConfigRegistry:
+    """
+    Registro de configuraciones JSON del proceso. Cada archivo se lee,
+    valida y compila una sola vez; se vuelve a compilar si cambia su mtime.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    # Segundos durante los que se confía en la config compilada sin revisar el mtime
+    MTIME_CHECK_INTERVAL = 2.0
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(ConfigRegistry, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._compiled = {}   # (tipo, ruta absoluta) -> [mtime, config compilada, última revisión]
+        self._extended = {}   # (ruta base, ruta extensión, skip) -> (base, extensión, config combinada)
+        self._mutex = threading.Lock()
+        self._initialized = True
+
+    def form(self, path) -> CompiledFormConfig:
+        return self._get(CompiledFormConfig, path)
+
+    def grid(self, path) -> CompiledGridConfig:
+        return self._get(CompiledGridConfig, path)
+
+    def form_with_extension(self, path, extension_path, skip=1) -> CompiledFormConfig:
+        """
+        Formulario path seguido de las secciones de extension_path (omitiendo
+        sus primeras skip). Se compila una vez por par y se recompila si
+        cambia cualquiera de los dos archivos.
+        """
+        base = self.form(path)
+        extension = self.form(extension_path)
+        cache_key = (base.path, extension.path, skip)
+        with self._mutex:
+            cached = self._extended.get(cache_key)
+            if cached and cached[0] is base and cached[1] is extension:
+                return cached[2]
+
+        data = dict(base.data)
+        data["sections"] = base.sections + extension.sections[skip:]
+        compiled = CompiledFormConfig(f"{base.path}+{os.path.basename(extension.path)}", data)
+        with self._mutex:
+            self._extended[cache_key] = (base, extension, compiled)
+        return compiled
+
+    def _get(self, compiled_cls, path):
+        path = os.path.abspath(str(path))
+        cache_key = (compiled_cls.__name__, path)
+        now = time.monotonic()
+        with self._mutex:
+            cached = self._compiled.get(cache_key)
+            if cached and now - cached[2] < self.MTIME_CHECK_INTERVAL:
+                return cached[1]
+
+        mtime = os.path.getmtime(path)
+        if cached and cached[0] == mtime:
+            with self._mutex:
+                cached[2] = now
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        compiled = compiled_cls(path, data)
+        with self._mutex:
+            self._compiled[cache_key] = [mtime, compiled, now]
+        print(f"[ConfigRegistry] Compilado {os.path.basename(path)}")
+        return compiled
+
+    def clear(self):
+        with self._mutex:
+            self._compiled.clear()
+            self._extended.clear()
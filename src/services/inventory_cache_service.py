@@ -6,6 +6,9 @@ from PySide6.QtCore import QThreadPool, QObject
 
 class InventoryCacheService(QObject):
     _instance = None
+
+    CATALOGO_KEY = "catalogo_inventario_activos"
+    INDICADORES_KEY = "indicadores_activos_local"
     
     def __new__(cls):
         if cls._instance is None:
@@ -32,9 +35,22 @@ class InventoryCacheService(QObject):
 
     def _do_fetch(self):
         try:
-            # 1. Consultar API con size=1000
-            # Usamos get_raw o get básico. ApiClient.get ya lanza excepciones.
-            data = self.api.get("/activos/catalogos", params={"size": 1000})
+            # 1. Consultar API con size=1000, condicional si ya tenemos el catálogo
+            validators = self.cache.get_validators(self.CATALOGO_KEY)
+            status, data, new_validators = self.api.get_conditional(
+                "/activos/catalogos",
+                params={"size": 1000},
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+            )
+            if status == 304:
+                filtered = self.cache.mark_revalidated(self.CATALOGO_KEY, new_validators)
+                if filtered is not None and self.cache.mark_revalidated(self.INDICADORES_KEY) is not None:
+                    print("[InventoryCacheService] Inventario sin cambios (304), se extiende el cache")
+                    return filtered
+                status, data, new_validators = self.api.get_conditional(
+                    "/activos/catalogos", params={"size": 1000}
+                )
             
             # 2. Obtener lista de items (puede venir directo o paginado)
             items = []
@@ -68,8 +84,8 @@ class InventoryCacheService(QObject):
                     })
             
             # 4. Guardar en cache global bajo llaves conocidas
-            self.cache.set("catalogo_inventario_activos", filtered)
-            self.cache.set("indicadores_activos_local", counts)
+            self.cache.set(self.CATALOGO_KEY, filtered, validators=new_validators)
+            self.cache.set(self.INDICADORES_KEY, counts)
             print(f"[InventoryCacheService] Cache actualizado. Total: {counts['total_activos']}, Activos: {counts['activos_count']}, En Mantención: {counts['en_mantencion']}")
             return filtered
         except Exception as e:
@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from src.config.settings import GRID_PAGE_CACHE_TTL, GRID_PAGE_CACHE_MAX_PAGES
+from src.core.api_client import ApiClient
+
+
+class PageCache:
+    """
+    Cache en memoria de páginas de un listado paginado, con vida corta.
+
+    La llave es (endpoint, parámetros), donde los parámetros incluyen filtros,
+    página y tamaño. Se usa desde hilos de trabajo (carga y precarga de
+    páginas vecinas), por lo que todas las operaciones toman un lock.
+    """
+
+    def __init__(self, ttl=GRID_PAGE_CACHE_TTL, max_pages=GRID_PAGE_CACHE_MAX_PAGES):
+        self.api = ApiClient()
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Una precarga iniciada antes de invalidar no debe volver a guardar datos viejos
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint, params):
+        return (endpoint, json.dumps(params or {}, sort_keys=True, default=str))
+
+    def get(self, endpoint, params):
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, data = entry
+            if time.time() - timestamp >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def contains(self, endpoint, params):
+        return self.get(endpoint, params) is not None
+
+    def set(self, endpoint, params, data, generation=None):
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.time(), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_pages:
+                self._entries.popitem(last=False)
+
+    def fetch(self, endpoint, params):
+        """Devuelve la página desde cache o la descarga y la guarda."""
+        data = self.get(endpoint, params)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+
+        with self._lock:
+            self.misses += 1
+            generation = self._generation
+        data = self.api.get(endpoint, params=params)
+        if data is not None:
+            self.set(endpoint, params, data, generation)
+        return data
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self):
+        with self._lock:
+            return {"pages": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,104 @@
+import time
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from src.services.logger_service import LoggerService
+from src.services.permission_service import PermissionService
+from src.workers.combo_loader import ComboLoaderRunnable
+
+
+class SessionBootstrap(QObject):
+    """
+    Carga inicial de la sesión tras el login. /users/me/permisos y /users/me se
+    piden en paralelo fuera del hilo de la GUI; permissions_ready se emite en
+    cuanto los permisos están aplicados, y el perfil se completa después.
+    """
+    permissions_ready = Signal()
+    profile_ready = Signal()
+    finished = Signal(dict)  # paso -> segundos
+
+    def __init__(self, api, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.perm_service = PermissionService()
+        # Pool propio: el global puede tener un solo hilo o estar ocupado con catálogos
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+        self.timings = {}
+        self._token = api.token
+        self._workers = []
+        self._pending = set()
+
+    def start(self):
+        self.perm_service.set_admin_status(self.api.is_admin)
+
+        self._pending = {"perfil"}
+        if not self.api.is_admin:
+            self._pending.add("permisos")
+            self._run("permisos", "/users/me/permisos", self._on_permissions, self._on_permissions_error)
+        self._run("perfil", "/users/me", self._on_profile, self._on_profile_error)
+
+        if self.api.is_admin:
+            # Los administradores no necesitan matriz granular de permisos
+            self.permissions_ready.emit()
+
+    def _run(self, step, path, on_result, on_error):
+        worker = ComboLoaderRunnable(self._timed_get, step, path)
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(on_error)
+        self._workers.append(worker)
+        self.thread_pool.start(worker)
+
+    def _timed_get(self, step, path):
+        start = time.perf_counter()
+        try:
+            return self.api.get(path)
+        finally:
+            self.timings[step] = time.perf_counter() - start
+
+    def _is_current_session(self):
+        # Si el usuario cerró sesión (o entró otro) mientras esperábamos, se ignora
+        return self.api.token == self._token
+
+    # ===============================
+    # Permisos
+    # ===============================
+    def _on_permissions(self, perms_payload):
+        if self._is_current_session():
+            self.perm_service.set_permissions(perms_payload)
+        self._step_done("permisos")
+        self.permissions_ready.emit()
+
+    def _on_permissions_error(self, error):
+        LoggerService().log_error("Error cargando permisos", error)
+        # Continuamos, pero el usuario tendrá permisos vacíos (por seguridad)
+        self._step_done("permisos")
+        self.permissions_ready.emit()
+
+    # ===============================
+    # Perfil
+    # ===============================
+    def _on_profile(self, me_data):
+        if self._is_current_session():
+            # rol_ris controla la visibilidad de módulos como Usuarios / Roles
+            self.api.set_rol_ris(me_data.get("rol_ris") or "")
+            # Guardamos el nombre completo para pre-llenado de formularios
+            full_name = me_data.get("nombre_completo") or f"{me_data.get('nombre', '')} {me_data.get('apellido', '')}".strip()
+            self.api.set_user_name(full_name or "Usuario Actual")
+        self._step_done("perfil")
+        self.profile_ready.emit()
+
+    def _on_profile_error(self, error):
+        if self._is_current_session():
+            self.api.set_rol_ris("")
+            self.api.set_user_name("")
+        self._step_done("perfil")
+        self.profile_ready.emit()
+
+    def _step_done(self, step):
+        elapsed = self.timings.get(step)
+        if elapsed is not None:
+            print(f"[SessionBootstrap] {step} en {elapsed * 1000:.0f} ms")
+        self._pending.discard(step)
+        if not self._pending:
+            self.finished.emit(dict(self.timings))
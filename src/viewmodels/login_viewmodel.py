@@ -24,8 +24,10 @@ class LoginViewModel(QObject):
         self.worker.start()
 
     def _on_login_success(self, result):
-        self.login_success.emit(result)
+        # Primero liberamos el estado de carga: la vista puede seguir mostrando
+        # su propio overlay mientras arranca la sesión
         self.loading_changed.emit(False)
+        self.login_success.emit(result)
 
     def _on_login_error(self, error):
         self.login_error.emit(error)
@@ -14,14 +14,21 @@ class ActivosView(GenericGridView):
 
     def refresh(self):
         """Asegurar que al entrar al módulo se vea el grid y se actualice"""
-        self._reload_all()
+        self._sync_or_reload()
 
     def _on_reload_finished(self, data):
         """Sobrescribimos para inyectar indicadores calculados localmente si la API falla."""
-        # 1. Ejecutar lógica estándar (poblar tabla e indicadores de API)
+        # 1. Ejecutar lógica estándar (poblar tabla)
         super()._on_reload_finished(data)
-        
-        # 2. Suplementar/Corregir con indicadores de la cache local (calculados en InventoryCacheService)
+        # 2. Mientras llegan los indicadores de la API, mostrar los locales
+        self._supplement_local_indicators()
+
+    def _on_indicators_finished(self, data):
+        super()._on_indicators_finished(data)
+        self._supplement_local_indicators()
+
+    def _supplement_local_indicators(self):
+        # Suplementar/Corregir con indicadores de la cache local (calculados en InventoryCacheService)
         local_stats = self.cache.get("indicadores_activos_local")
         if local_stats:
             print(f"[ActivosView] Suplementando indicadores con cache local: {local_stats}")
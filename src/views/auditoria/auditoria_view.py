@@ -121,84 +121,69 @@ class AuditoriaView(GenericGridView):
         self._on_search()
 
     def _reload_all(self):
-        """Sobrescribe la recarga para incluir los parámetros de fecha."""
+        """Sobrescribe la recarga para esperar a que existan los filtros de fecha."""
         if not hasattr(self, 'date_from') or self.date_from is None:
             return
+        super()._reload_all()
 
-        self.loading_overlay.show_loading()
-        
-        page = self.current_page
-        size = 10 # Forzamos 10 elementos por página conforme a lo solicitado
-        base_url = self.config["endpoints"]["listado"]
-        
+    def _build_list_params(self, page):
+        """Parámetros del listado incluyendo el rango de fechas."""
         # Formato ISO requerido
         df = self.date_from.date().toString("yyyy-MM-dd")
         dt = self.date_to.date().toString("yyyy-MM-dd")
 
-        def fetch_task():
-            if not self.permission_service.has_module_access(self.perm_module):
-                return {"listado": {"items": [], "pages": 1}, "indicadores": None}
-            
-            # Parametros en diccionario para mayor seguridad y alineación con la API
-            params = {
-                "fecha_desde": df,
-                "fecha_hasta": dt,
-                "page": page,
-                "size": size # Valor de 10 solicitado
-            }
+        # Parametros en diccionario para mayor seguridad y alineación con la API
+        params = {
+            "fecha_desde": df,
+            "fecha_hasta": dt,
+            "page": page,
+            "size": 10 # Forzamos 10 elementos por página conforme a lo solicitado
+        }
+
+        # Search query inteligente basada en el combo de la Toolbar
+        query_text = self.search_input.text().strip()
+        if query_text:
+            scope = self.column_filter_combo.currentData()
             
-            # Search query inteligente basada en el combo de la Toolbar
-            query_text = self.search_input.text().strip()
-            if query_text:
-                scope = self.column_filter_combo.currentData()
-                
-                # Mapeo de parámetros según backend (OpenAPI)
-                if scope == "__all__":
-                    params["search"] = query_text
-                elif scope == "action":
-                    params["action"] = query_text
-                elif scope == "entity":
-                    params["entity"] = query_text
-                elif scope == "usuario_nombre": # Columna Usuario
-                    # Si es un UUID, lo enviamos directo bajo 'user_id'
-                    if len(query_text) > 30 and "-" in query_text:
-                        params["user_id"] = query_text
+            # Mapeo de parámetros según backend (OpenAPI)
+            if scope == "__all__":
+                params["search"] = query_text
+            elif scope == "action":
+                params["action"] = query_text
+            elif scope == "entity":
+                params["entity"] = query_text
+            elif scope == "usuario_nombre": # Columna Usuario
+                # Si es un UUID, lo enviamos directo bajo 'user_id'
+                if len(query_text) > 30 and "-" in query_text:
+                    params["user_id"] = query_text
+                else:
+                    # Buscamos match en la cache local (vía múltiples campos posibles)
+                    match_id = None
+                    ql = query_text.lower()
+                    for u in self.cached_users:
+                        # Recopilar todos los campos de identidad posibles
+                        posibles_nombres = [
+                            str(u.get("nombre_completo") or "").lower(),
+                            str(u.get("fullname") or "").lower(),
+                            str(u.get("nombre") or "").lower(),
+                            str(u.get("username") or "").lower(),
+                            str(u.get("rut") or "").lower(),
+                            str(u.get("email") or "").lower()
+                        ]
+                        if any(ql in n for n in posibles_nombres if n):
+                            # Priorizar 'id', luego 'backend_id'
+                            match_id = u.get("id") or u.get("backend_id")
+                            break
+                    
+                    if match_id:
+                        params["user_id"] = str(match_id)
+                        print(f"[AUDITORIA] Search match: '{query_text}' -> user_id: {match_id}")
                     else:
-                        # Buscamos match en la cache local (vía múltiples campos posibles)
-                        match_id = None
-                        ql = query_text.lower()
-                        for u in self.cached_users:
-                            # Recopilar todos los campos de identidad posibles
-                            posibles_nombres = [
-                                str(u.get("nombre_completo") or "").lower(),
-                                str(u.get("fullname") or "").lower(),
-                                str(u.get("nombre") or "").lower(),
-                                str(u.get("username") or "").lower(),
-                                str(u.get("rut") or "").lower(),
-                                str(u.get("email") or "").lower()
-                            ]
-                            if any(ql in n for n in posibles_nombres if n):
-                                # Priorizar 'id', luego 'backend_id'
-                                match_id = u.get("id") or u.get("backend_id")
-                                break
-                        
-                        if match_id:
-                            params["user_id"] = str(match_id)
-                            print(f"[AUDITORIA] Search match: '{query_text}' -> user_id: {match_id}")
-                        else:
-                            # Si no hay match ID, enviamos a 'search' para que el backend busque en texto libre
-                            params["search"] = query_text
-                            print(f"[AUDITORIA] No match for: '{query_text}', using fallback search")
-                
-            return {
-                "listado": self.api.get(base_url, params=params),
-                "indicadores": None
-            }
+                        # Si no hay match ID, enviamos a 'search' para que el backend busque en texto libre
+                        params["search"] = query_text
+                        print(f"[AUDITORIA] No match for: '{query_text}', using fallback search")
 
-        self.worker = ApiWorker(fetch_task, parent=self)
-        self.worker.finished.connect(self._on_reload_finished)
-        self.worker.error.connect(self._on_reload_error)
-        self.worker.start()
+        return params
 
     def _on_reload_finished(self, data):
         try:
@@ -11,5 +11,5 @@ class EipdView(GenericGridView):
 
     def refresh(self):
         """Asegurar que al entrar al módulo se vea el grid y se actualice"""
-        self._reload_all()
+        self._sync_or_reload()
 
@@ -17,8 +17,9 @@ from src.components.loading_overlay import LoadingOverlay
 from src.components.user_inactive_dialog import UserInactiveDialog
 from src.services.logger_service import LoggerService
 from src.workers.jwt_utils import decode_jwt
-from src.services.permission_service import PermissionService
+from src.services.session_bootstrap_service import SessionBootstrap
 from src.services.inventory_cache_service import InventoryCacheService
+from src.services.catalog_prefetch_service import CatalogPrefetchService
 
 
 
@@ -215,33 +216,22 @@ class LoginView(QWidget):
         LoggerService().init_session(str(user_id))
         LoggerService().log_event("Inicio de sesión exitoso")
 
-        # 🔐 Inicializar servicios de seguridad
-        perm_service = PermissionService()
-        perm_service.set_admin_status(api.is_admin)
-
-        if not api.is_admin:
-            try:
-                # Si no es admin, obtener matriz granular de permisos
-                perms_payload = api.get("/users/me/permisos")
-                perm_service.set_permissions(perms_payload)
-            except Exception as e:
-                LoggerService().log_error("Error cargando permisos", str(e))
-                # Continuamos, pero el usuario tendrá permisos vacíos (por seguridad)
-
-        # Obtener rol_ris del usuario para controlar visibilidad de módulos como Usuarios / Roles
-        try:
-            me_data = api.get("/users/me")
-            api.set_rol_ris(me_data.get("rol_ris") or "")
-            
-            # Guardamos el nombre completo para pre-llenado de formularios
-            full_name = me_data.get("nombre_completo") or f"{me_data.get('nombre', '')} {me_data.get('apellido', '')}".strip()
-            api.set_user_name(full_name or "Usuario Actual")
-        except Exception:
-            api.set_rol_ris("")
-            api.set_user_name("")
-            
         # 🚀 Refrescar cache de inventario en segundo plano al iniciar sesión
         InventoryCacheService().refresh_inventory_cache()
+        # Precalentar catálogos de formularios mientras el usuario está en Home
+        CatalogPrefetchService().prefetch_all()
+
+        # 🔐 Permisos y perfil en paralelo, fuera del hilo de la GUI
+        self._set_inputs_enabled(False)
+        self.loading_overlay.show_loading()
+        self._bootstrap = SessionBootstrap(api, parent=self)
+        self._bootstrap.permissions_ready.connect(self._show_main_window)
+        self._bootstrap.finished.connect(self._on_bootstrap_finished)
+        self._bootstrap.start()
+
+    def _show_main_window(self):
+        self.loading_overlay.hide_loading()
+        self._set_inputs_enabled(True)
 
         self.main_window = MainWindow()
         self.main_window.logout_signal.connect(self._on_logout)
@@ -249,6 +239,10 @@ class LoginView(QWidget):
 
         self.hide()
 
+    def _on_bootstrap_finished(self, timings: dict):
+        summary = ", ".join(f"{step}={secs * 1000:.0f} ms" for step, secs in timings.items())
+        print(f"[LoginView] Bootstrap de sesión completado: {summary}")
+
     def _on_logout(self):
         """Handler para limpiar la vista al cerrar sesión."""
         self._reset_login_form()
@@ -325,9 +319,7 @@ class LoginView(QWidget):
         self._reset_login_form()
 
     def _on_loading(self, loading: bool):
-        self.login_button.setEnabled(not loading)
-        self.user_input.setEnabled(not loading)
-        self.password_input.setEnabled(not loading)
+        self._set_inputs_enabled(not loading)
 
         if loading:
             self.loading_overlay.show_loading()
@@ -338,6 +330,11 @@ class LoginView(QWidget):
     # Helpers
     # ===============================
 
+    def _set_inputs_enabled(self, enabled: bool):
+        self.login_button.setEnabled(enabled)
+        self.user_input.setEnabled(enabled)
+        self.password_input.setEnabled(enabled)
+
     def _set_input_colors(self, input_widget: QLineEdit):
         palette = input_widget.palette()
         palette.setColor(QPalette.Text, QColor("#111827"))
@@ -7,17 +7,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal
 
 from src.views.sidebar import Sidebar
-from src.views.activos.activos_view import ActivosView
-from src.views.usuarios.usuarios_view import UsuariosView
-from src.views.eipd.eipd_view import EipdView
-from src.views.rat.rat_view import RatView
-from src.views.trazabilidad.trazabilidad_view import TrazabilidadView
-from src.views.dashboard.dashboard_view import DashboardView
-from src.viewmodels.dashboard_viewmodel import DashboardViewModel
-from src.views.seguimiento.seguimiento_riesgos_view import SeguimientoRiesgosView
 from src.services.permission_service import PermissionService
 from src.views.home.home_view import HomeView
-from src.views.auditoria.auditoria_view import AuditoriaView
 
 
 class MainWindow(QMainWindow):
@@ -47,28 +38,32 @@ class MainWindow(QMainWindow):
         # ===============================
         self.stack = QStackedWidget()
 
-        from src.viewmodels.seguimiento_viewmodel import SeguimientoViewModel
-        
         self.home_view = HomeView()
-        self.activos_view = ActivosView()
-        self.rat_view = RatView()
-        self.eipd_view = EipdView()
-        self.seguimiento_view = SeguimientoRiesgosView(SeguimientoViewModel())
-        self.trazabilidad_view = TrazabilidadView()
-        self.usuarios_view = UsuariosView()
-        self.dashboard_view = DashboardView(DashboardViewModel())
-        self.auditoria_view = AuditoriaView()
-
-        # Stack indexes (Matching Sidebar order)
+        self.activos_view = None
+        self.rat_view = None
+        self.eipd_view = None
+        self.seguimiento_view = None
+        self.trazabilidad_view = None
+        self.usuarios_view = None
+        self.dashboard_view = None
+        self.auditoria_view = None
+
+        # Stack indexes (Matching Sidebar order). Cada vista se construye al
+        # navegar a ella por primera vez; hasta entonces ocupa un placeholder.
+        self._view_factories = {
+            1: ("activos_view", self._create_activos_view),
+            2: ("rat_view", self._create_rat_view),
+            3: ("eipd_view", self._create_eipd_view),
+            4: ("seguimiento_view", self._create_seguimiento_view),
+            5: ("trazabilidad_view", self._create_trazabilidad_view),
+            6: ("usuarios_view", self._create_usuarios_view),
+            7: ("dashboard_view", self._create_dashboard_view),
+            8: ("auditoria_view", self._create_auditoria_view),
+        }
+
         self.stack.addWidget(self.home_view)           # 0
-        self.stack.addWidget(self.activos_view)        # 1
-        self.stack.addWidget(self.rat_view)            # 2
-        self.stack.addWidget(self.eipd_view)           # 3
-        self.stack.addWidget(self.seguimiento_view)    # 4
-        self.stack.addWidget(self.trazabilidad_view)   # 5
-        self.stack.addWidget(self.usuarios_view)       # 6
-        self.stack.addWidget(self.dashboard_view)      # 7
-        self.stack.addWidget(self.auditoria_view)      # 8
+        for index in sorted(self._view_factories):     # 1..8
+            self.stack.addWidget(QWidget())
 
         # ===============================
         # Layout
@@ -142,7 +137,59 @@ class MainWindow(QMainWindow):
     # Navigation handler
     # ======================================================
 
+    def _ensure_view(self, stack_index: int):
+        factory = self._view_factories.pop(stack_index, None)
+        if factory is None:
+            return
+        attr_name, create = factory
+        view = create()
+        setattr(self, attr_name, view)
+
+        placeholder = self.stack.widget(stack_index)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(stack_index, view)
+
+    # ======================================================
+    # View factories (imports diferidos: un módulo que no se abre no se carga)
+    # ======================================================
+
+    def _create_activos_view(self):
+        from src.views.activos.activos_view import ActivosView
+        return ActivosView()
+
+    def _create_rat_view(self):
+        from src.views.rat.rat_view import RatView
+        return RatView()
+
+    def _create_eipd_view(self):
+        from src.views.eipd.eipd_view import EipdView
+        return EipdView()
+
+    def _create_seguimiento_view(self):
+        from src.views.seguimiento.seguimiento_riesgos_view import SeguimientoRiesgosView
+        from src.viewmodels.seguimiento_viewmodel import SeguimientoViewModel
+        return SeguimientoRiesgosView(SeguimientoViewModel())
+
+    def _create_trazabilidad_view(self):
+        from src.views.trazabilidad.trazabilidad_view import TrazabilidadView
+        return TrazabilidadView()
+
+    def _create_usuarios_view(self):
+        from src.views.usuarios.usuarios_view import UsuariosView
+        return UsuariosView()
+
+    def _create_dashboard_view(self):
+        from src.views.dashboard.dashboard_view import DashboardView
+        from src.viewmodels.dashboard_viewmodel import DashboardViewModel
+        return DashboardView(DashboardViewModel())
+
+    def _create_auditoria_view(self):
+        from src.views.auditoria.auditoria_view import AuditoriaView
+        return AuditoriaView()
+
     def _navigate(self, stack_index: int, sidebar_index: int):
+        self._ensure_view(stack_index)
         self.stack.setCurrentIndex(stack_index)
         self.sidebar.set_active(sidebar_index)
         
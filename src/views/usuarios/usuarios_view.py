@@ -16,13 +16,18 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, QTimer
+import threading
+import time
+
+from PySide6.QtCore import Qt, QTimer, QThreadPool
 
 from src.components.loading_overlay import LoadingOverlay
 from src.core.api_client import ApiClient
 from src.services.cache_manager import CacheManager
 from src.services.user_service import UserService
 from src.workers.api_worker import ApiWorker
+from src.workers.combo_loader import ComboLoaderRunnable
+from src.config.settings import GRID_PAGE_CACHE_TTL
 from src.services.permission_service import PermissionService
 from src.components.alert_dialog import AlertDialog
 
@@ -35,6 +40,9 @@ class UsuariosView(QWidget):
         self.api = ApiClient()
         self.user_service = UserService()
         self.cache_manager = CacheManager()
+        # Una precarga iniciada antes de una mutación no debe volver a guardar la página vieja
+        self._users_cache_generation = 0
+        self._users_cache_lock = threading.Lock()
         self.permissions_cache_key = "usuarios_permissions_v2"
         self.permissions_overrides = {}
         self.permission_service = PermissionService()
@@ -43,6 +51,7 @@ class UsuariosView(QWidget):
         self.current_page = 1
         self.page_size = 10
         self.has_next = False
+        self._page_meta = None
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.setInterval(500)
@@ -319,67 +328,29 @@ class UsuariosView(QWidget):
                 "total": 0,
             }
 
-            me = self.user_service.get_me()
-            
-            # Intentamos obtener permisos propios, si falla (403) asumimos permisos vacíos.
-            try:
-                me_permissions = self.user_service.get_permissions(str(me.get("id")))
-            except Exception as e:
-                print(f"No se pudieron cargar permisos propios de la nube (Caso usuario no-admin): {e}")
-                # FALLBACK CRÍTICO: Usamos lo que PermissionService ya sabe que tiene el usuario por su sesión
-                local_perms = self.permission_service._user_permissions
-                me_permissions = self._convert_local_perms_to_payload(local_perms)
-
-
-            try:
-                privilegios = self.user_service.list_privilegios()
-                result["privilege_name_by_code"] = {
-                    p.get("codigo", ""): p.get("nombre", "") for p in privilegios
-                }
-                
-                # CARGAMOS EL CATÁLOGO MAESTRO DE IDS DE ACCIÓN
-                try:
-                    master_data = self.user_service.list_modulos_con_acciones()
-                    result["master_action_ids"] = self._map_master_actions(master_data)
-                except Exception as e:
-                    print(f"Error cargando catálogo maestro: {e}")
-                    result["master_action_ids"] = {}
-            except Exception as e:
-                print(f"Error cargando privilegios: {e}")
-                result["privilege_name_by_code"] = {}
-                result["master_action_ids"] = {}
+            # Perfil, permisos propios y catálogos de privilegios: se reutilizan al paginar
+            page_meta = None if force_refresh else self._cached_page_meta()
+            if page_meta is None:
+                page_meta = self._fetch_page_meta()
+                self._page_meta = (time.time(), page_meta)
+            me = page_meta["me"]
+            me_permissions = page_meta["me_permissions"]
+            result["privilege_name_by_code"] = page_meta["privilege_name_by_code"]
+            result["master_action_ids"] = page_meta["master_action_ids"]
 
             users_list = []
             # Cargamos la lista de usuarios si tiene permiso VER el módulo
             if self.permission_service.has_module_access(self.perm_module):
                 try:
-                    search_nombre = None
-                    search_rut = None
-                    search_email = None
-
-                    if current_search_val:
-                        if "@" in current_search_val:
-                            search_email = current_search_val
-                        # Identificamos si el término contiene dígitos para inferir que es un RUT
-                        elif any(char.isdigit() for char in current_search_val):
-                            search_rut = current_search_val
-                        else:
-                            search_nombre = current_search_val
-
                     paged_response = None
-                    cache_key = f"usuarios_list_p{current_page_val}_s{current_size_val}_q{current_search_val}"
+                    cache_key = self._users_page_cache_key(current_page_val, current_size_val, current_search_val)
                     if not force_refresh:
                         paged_response = self.cache_manager.get(cache_key)
                     
                     if not paged_response:
-                        paged_response = self.user_service.list_users(
-                            page=current_page_val,
-                            size=current_size_val,
-                            nombre=search_nombre,
-                            rut=search_rut,
-                            email=search_email
+                        paged_response = self._fetch_users_page(
+                            current_page_val, current_size_val, current_search_val
                         )
-                        self.cache_manager.set(cache_key, paged_response)
                         
                     users_list = paged_response.get("items", [])
                     result["has_next"] = paged_response.get("has_next", False)
@@ -416,6 +387,105 @@ class UsuariosView(QWidget):
         self.worker.error.connect(self._on_data_error)
         self.worker.start()
 
+    def _cached_page_meta(self):
+        if not self._page_meta:
+            return None
+        timestamp, meta = self._page_meta
+        if time.time() - timestamp >= GRID_PAGE_CACHE_TTL:
+            return None
+        return meta
+
+    def _fetch_page_meta(self):
+        meta = {}
+        me = self.user_service.get_me()
+        
+        # Intentamos obtener permisos propios, si falla (403) asumimos permisos vacíos.
+        try:
+            me_permissions = self.user_service.get_permissions(str(me.get("id")))
+        except Exception as e:
+            print(f"No se pudieron cargar permisos propios de la nube (Caso usuario no-admin): {e}")
+            # FALLBACK CRÍTICO: Usamos lo que PermissionService ya sabe que tiene el usuario por su sesión
+            local_perms = self.permission_service._user_permissions
+            me_permissions = self._convert_local_perms_to_payload(local_perms)
+
+
+        try:
+            privilegios = self.user_service.list_privilegios()
+            meta["privilege_name_by_code"] = {
+                p.get("codigo", ""): p.get("nombre", "") for p in privilegios
+            }
+            
+            # CARGAMOS EL CATÁLOGO MAESTRO DE IDS DE ACCIÓN
+            try:
+                master_data = self.user_service.list_modulos_con_acciones()
+                meta["master_action_ids"] = self._map_master_actions(master_data)
+            except Exception as e:
+                print(f"Error cargando catálogo maestro: {e}")
+                meta["master_action_ids"] = {}
+        except Exception as e:
+            print(f"Error cargando privilegios: {e}")
+            meta["privilege_name_by_code"] = {}
+            meta["master_action_ids"] = {}
+
+        meta["me"] = me
+        meta["me_permissions"] = me_permissions
+        return meta
+
+    def _search_filters(self, search_val):
+        """Traduce el texto de búsqueda a (nombre, rut, email) para la API."""
+        search_nombre = None
+        search_rut = None
+        search_email = None
+
+        if search_val:
+            if "@" in search_val:
+                search_email = search_val
+            # Identificamos si el término contiene dígitos para inferir que es un RUT
+            elif any(char.isdigit() for char in search_val):
+                search_rut = search_val
+            else:
+                search_nombre = search_val
+        return search_nombre, search_rut, search_email
+
+    def _users_page_cache_key(self, page, size, search_val):
+        return f"usuarios_list_p{page}_s{size}_q{search_val}"
+
+    def _prefetch_adjacent_pages(self, total_pages):
+        """Deja en cache las páginas vecinas para que paginar no espere a la API."""
+        search_val = self.search.text().strip()
+        for page in (self.current_page + 1, self.current_page - 1):
+            if page < 1 or page > total_pages:
+                continue
+            cache_key = self._users_page_cache_key(page, self.page_size, search_val)
+            if self.cache_manager.get(cache_key):
+                continue
+            worker = ComboLoaderRunnable(
+                self._fetch_users_page, page, self.page_size, search_val, self._users_cache_generation
+            )
+            QThreadPool.globalInstance().start(worker)
+
+    def _fetch_users_page(self, page, size, search_val, generation=None):
+        if generation is None:
+            generation = self._users_cache_generation
+        search_nombre, search_rut, search_email = self._search_filters(search_val)
+        paged_response = self.user_service.list_users(
+            page=page,
+            size=size,
+            nombre=search_nombre,
+            rut=search_rut,
+            email=search_email
+        )
+        with self._users_cache_lock:
+            # Si hubo una mutación mientras se descargaba, la página ya no es válida
+            if generation == self._users_cache_generation:
+                self.cache_manager.set(self._users_page_cache_key(page, size, search_val), paged_response)
+        return paged_response
+
+    def _invalidate_users_pages(self):
+        with self._users_cache_lock:
+            self._users_cache_generation += 1
+            self.cache_manager.remove_prefix("usuarios_list_")
+
     def _on_data_loaded(self, data):
         self.is_loading = False
         self.loading_overlay.hide_loading()
@@ -442,6 +512,9 @@ class UsuariosView(QWidget):
         if hasattr(self, "lbl_page"):
             self.lbl_page.setText(f"Página {self.current_page} de {total_pages}")
 
+        if self.list_users_api_available and total:
+            self._prefetch_adjacent_pages(total_pages)
+
         if not self.users_data:
             self.users_data = [
                 {
@@ -861,7 +934,7 @@ class UsuariosView(QWidget):
             except Exception as e:
                 print(f"Error forzando permiso post-registro: {e}")
 
-            self.cache_manager.remove_prefix("usuarios_list_")
+            self._invalidate_users_pages()
             self._load_backend_data(force_refresh=True)
 
     def _on_toggle_user_status(self, user_index):
@@ -967,7 +1040,7 @@ class UsuariosView(QWidget):
             # Limpiar cache local de este usuario
             user_cache_id = self._user_cache_id({"backend_id": None, "id": None}) # Dummy call to get logic
             # En realidad mejor recargar todo y limpiar la caché completa de la lista
-            self.cache_manager.remove_prefix("usuarios_list_")
+            self._invalidate_users_pages()
             self._load_backend_data(force_refresh=True)
 
     def _on_delete_user_error(self, error):
@@ -987,7 +1060,7 @@ class UsuariosView(QWidget):
             self.current_user_index = user_index
             self._populate_user_list()
             self._update_matrix_for_user(user_index)
-            self.cache_manager.remove_prefix("usuarios_list_")
+            self._invalidate_users_pages()
             
             # 🛡️ REGLA SINGDAP: Al activar un usuario, asegurar VER en USUARIOS
             if is_active:
@@ -0,0 +1,52 @@
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+from src.core.api_client import ApiClient, DownloadCancelled
+
+
+class DownloadWorker(QThread):
+    """
+    Descarga un endpoint directo a disco en segundo plano (ver
+    ApiClient.download_to_file), informando el avance y permitiendo cancelar.
+    """
+    progress = Signal(int, int)   # bytes recibidos, bytes totales (0 si se desconoce)
+    finished = Signal(str)        # ruta del archivo final
+    error = Signal(str)
+    cancelled = Signal()
+
+    # Intervalo mínimo entre avisos de progreso, para no saturar la UI
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, endpoint, file_path, params=None, parent=None):
+        super().__init__(parent)
+        self.endpoint = endpoint
+        self.file_path = file_path
+        self.params = params
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _report(self, received, total):
+        now = time.monotonic()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL or (total and received >= total):
+            self._last_progress = now
+            self.progress.emit(received, total)
+
+    def run(self):
+        try:
+            ApiClient().download_to_file(
+                self.endpoint,
+                self.file_path,
+                params=self.params,
+                progress=self._report,
+                is_cancelled=self._cancel_event.is_set,
+            )
+            self.finished.emit(self.file_path)
+        except DownloadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
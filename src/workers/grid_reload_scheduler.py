@@ -0,0 +1,109 @@
+from functools import partial
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.config.settings import GRID_RELOAD_DEBOUNCE_MS
+from src.workers.api_worker import ApiWorker
+
+
+class GridReloadScheduler(QObject):
+    """
+    Planificador de recargas de una grilla.
+
+    Las solicitudes cercanas se agrupan (debounce) y solo se ejecuta la última.
+    Cada ejecución recibe un número de generación; cuando llega una respuesta
+    de una generación anterior se descarta, de modo que una respuesta lenta
+    nunca pisa datos más nuevos.
+    """
+    result_ready = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, delay_ms=GRID_RELOAD_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.delay_ms = delay_ms
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+        self._pending_task = None
+        self._generation = 0
+        self._workers = {}
+
+        # Estadísticas
+        self.requested = 0
+        self.coalesced = 0   # Solicitudes reemplazadas antes de ejecutarse
+        self.superseded = 0  # Respuestas descartadas por llegar tarde
+        self.applied = 0
+
+    def submit(self, task, immediate=False):
+        """Encola task (callable ejecutado en segundo plano); reemplaza a la pendiente."""
+        self.requested += 1
+        if self._pending_task is not None:
+            self.coalesced += 1
+        self._pending_task = task
+        if immediate:
+            self._timer.stop()
+            self._dispatch()
+        else:
+            self._timer.start(self.delay_ms)
+
+    def cancel(self):
+        """Descarta la solicitud pendiente e ignora las que estén en curso."""
+        self._timer.stop()
+        self._pending_task = None
+        self._generation += 1
+        self._interrupt_running()
+
+    def is_pending(self):
+        return self._pending_task is not None or self._generation in self._workers
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "coalesced": self.coalesced,
+            "superseded": self.superseded,
+            "applied": self.applied,
+            "in_flight": len(self._workers),
+        }
+
+    def _dispatch(self):
+        task, self._pending_task = self._pending_task, None
+        if task is None:
+            return
+
+        self._generation += 1
+        generation = self._generation
+        # Las anteriores siguen hasta terminar su petición HTTP, pero su resultado se ignora
+        self._interrupt_running()
+
+        worker = ApiWorker(task, parent=self)
+        worker.finished.connect(partial(self._on_finished, generation))
+        worker.error.connect(partial(self._on_error, generation))
+        self._workers[generation] = worker
+        worker.start()
+
+    def _interrupt_running(self):
+        for worker in self._workers.values():
+            worker.requestInterruption()
+
+    def _release(self, generation):
+        worker = self._workers.pop(generation, None)
+        if worker is not None:
+            # La señal se emite al final de run(): la espera es prácticamente nula
+            worker.wait()
+            worker.deleteLater()
+
+    def _on_finished(self, generation, data):
+        self._release(generation)
+        if generation != self._generation:
+            self.superseded += 1
+            print(f"[GridReloadScheduler] Respuesta obsoleta descartada (gen {generation} < {self._generation})")
+            return
+        self.applied += 1
+        self.result_ready.emit(data)
+
+    def _on_error(self, generation, error):
+        self._release(generation)
+        if generation != self._generation:
+            self.superseded += 1
+            return
+        self.error.emit(error)
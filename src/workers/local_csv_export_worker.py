@@ -0,0 +1,135 @@
+import csv
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QThread, Signal
+
+from src.core.api_client import ApiClient
+from src.config.settings import LOCAL_EXPORT_PAGE_SIZE, LOCAL_EXPORT_CONCURRENCY
+
+
+class LocalCsvExportWorker(QThread):
+    """
+    Exporta a CSV el listado completo de una grilla sin endpoint de exportación.
+
+    Recorre el endpoint de listado página por página (con los mismos filtros
+    del servidor que la grilla), pidiendo hasta `concurrency` páginas a la vez,
+    y escribe las filas en orden a un archivo temporal que se renombra al
+    terminar. En memoria solo quedan las páginas en vuelo.
+    """
+    progress = Signal(int, int)   # filas escritas, filas totales estimadas (0 si se desconoce)
+    finished = Signal(str, int)   # ruta del archivo, filas escritas
+    error = Signal(str)
+    cancelled = Signal()
+
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, endpoint, params, headers, row_builder, row_filter=None,
+                 page_size=LOCAL_EXPORT_PAGE_SIZE, concurrency=LOCAL_EXPORT_CONCURRENCY,
+                 file_path=None, parent=None):
+        """
+        headers: encabezados del CSV.
+        row_builder(item) -> lista de textos ya formateados (mismas reglas que la grilla).
+        row_filter(item) -> bool para aplicar filtros locales (búsqueda y cabeceras).
+        """
+        super().__init__(parent)
+        self.api = ApiClient()
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+        self.headers = headers
+        self.row_builder = row_builder
+        self.row_filter = row_filter
+        self.page_size = page_size
+        self.concurrency = max(1, concurrency)
+        self.file_path = file_path
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _fetch_page(self, page):
+        if self._cancel_event.is_set():
+            return []
+        response = self.api.get(self.endpoint, params=dict(self.params, page=page, size=self.page_size))
+        if isinstance(response, dict):
+            return response.get("items", [])
+        return response or []
+
+    def _report(self, written, total, force=False):
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(written, total)
+
+    def run(self):
+        start = time.perf_counter()
+        target_dir = os.path.dirname(os.path.abspath(self.file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".exportacion_", suffix=".part", dir=target_dir)
+        try:
+            first = self.api.get(self.endpoint, params=dict(self.params, page=1, size=self.page_size))
+            if isinstance(first, dict):
+                first_items = first.get("items", [])
+                pages = first.get("pages", 1) or 1
+                total = first.get("total") or 0
+            else:
+                first_items = first or []
+                pages = 1
+                total = len(first_items)
+
+            written = 0
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                fd = None
+                writer = csv.writer(f)
+                writer.writerow(self.headers)
+                written += self._write_items(writer, first_items)
+                self._report(written, total, force=True)
+
+                with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                    pending = {}
+                    next_page = 2
+                    for page in range(2, pages + 1):
+                        # Ventana acotada de páginas en vuelo; se escriben en orden
+                        while next_page <= pages and len(pending) < self.concurrency:
+                            pending[next_page] = executor.submit(self._fetch_page, next_page)
+                            next_page += 1
+                        items = pending.pop(page).result()
+                        if self._cancel_event.is_set():
+                            for future in pending.values():
+                                future.cancel()
+                            break
+                        written += self._write_items(writer, items)
+                        self._report(written, total)
+
+            if self._cancel_event.is_set():
+                print(f"[LocalCsvExport] Exportación cancelada tras {written} filas")
+                self.cancelled.emit()
+                return
+
+            os.replace(tmp_path, self.file_path)
+            self._report(written, total, force=True)
+            print(
+                f"[LocalCsvExport] {written} filas ({pages} páginas) exportadas en "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+            self.finished.emit(self.file_path, written)
+        except Exception as e:
+            print(f"[LocalCsvExport] Error exportando {self.endpoint}: {e}")
+            self.error.emit(str(e))
+        finally:
+            if fd is not None:
+                os.close(fd)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _write_items(self, writer, items):
+        count = 0
+        for item in items:
+            if self.row_filter and not self.row_filter(item):
+                continue
+            writer.writerow(self.row_builder(item))
+            count += 1
+        return count
@@ -0,0 +1,123 @@
+import html
+import io
+import os
+import tempfile
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal, QMarginsF
+from PySide6.QtGui import QTextDocument, QPdfWriter, QPageSize, QPageLayout
+
+
+class LocalPdfExportWorker(QThread):
+    """
+    Genera en segundo plano el reporte PDF local de una grilla.
+
+    El HTML se arma en un buffer (io.StringIO) en tiempo lineal, con el texto
+    de cada celda escapado, y se divide en tablas de ROWS_PER_TABLE filas para
+    que el layout del documento no crezca de golpe con grillas grandes. El PDF
+    se pagina con QPdfWriter y se escribe a un temporal que se renombra al final.
+    """
+    progress = Signal(int, int)   # filas procesadas, filas totales
+    finished = Signal(str)
+    error = Signal(str)
+    cancelled = Signal()
+
+    ROWS_PER_TABLE = 500
+    PROGRESS_INTERVAL = 0.1
+
+    STYLE = (
+        "body { font-family: sans-serif; font-size: 8pt; }"
+        "h1 { font-size: 14pt; color: #004B8D; }"
+        "table { border-collapse: collapse; width: 100%; }"
+        "th { background-color: #f1f5f9; font-weight: bold; }"
+        "th, td { border: 1px solid #cbd5e1; padding: 3px; }"
+    )
+
+    def __init__(self, title, subtitle, headers, items, row_builder, file_path, parent=None):
+        """
+        items: filas crudas de la grilla (se formatean aquí, fuera del hilo de UI).
+        row_builder(item) -> lista de textos ya formateados.
+        """
+        super().__init__(parent)
+        self.title = title
+        self.subtitle = subtitle
+        self.headers = headers
+        self.items = items
+        self.row_builder = row_builder
+        self.file_path = file_path
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        start = time.perf_counter()
+        tmp_path = None
+        try:
+            document_html = self._build_html()
+            if document_html is None:
+                self.cancelled.emit()
+                return
+
+            doc = QTextDocument()
+            doc.setHtml(document_html)
+            if self._cancel_event.is_set():
+                self.cancelled.emit()
+                return
+
+            target_dir = os.path.dirname(os.path.abspath(self.file_path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".reporte_", suffix=".part", dir=target_dir)
+            os.close(fd)
+
+            writer = QPdfWriter(tmp_path)
+            writer.setPageSize(QPageSize(QPageSize.A4))
+            writer.setPageOrientation(QPageLayout.Landscape)
+            writer.setPageMargins(QMarginsF(10, 10, 10, 10), QPageLayout.Millimeter)
+            doc.print_(writer)
+            del writer
+
+            os.replace(tmp_path, self.file_path)
+            print(
+                f"[LocalPdfExport] {len(self.items)} filas exportadas en "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+            self.finished.emit(self.file_path)
+        except Exception as e:
+            print(f"[LocalPdfExport] Error generando PDF: {e}")
+            self.error.emit(str(e))
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _build_html(self):
+        """Devuelve el HTML del reporte, o None si se canceló mientras se armaba."""
+        total = len(self.items)
+        header_row = "<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in self.headers) + "</tr>"
+
+        buffer = io.StringIO()
+        buffer.write(f"<html><head><style>{self.STYLE}</style></head><body>")
+        buffer.write(f"<h1>{html.escape(self.title)}</h1>")
+        buffer.write(f"<p>{html.escape(self.subtitle)}</p>")
+
+        for offset in range(0, max(total, 1), self.ROWS_PER_TABLE):
+            if self._cancel_event.is_set():
+                return None
+            buffer.write(f"<table cellspacing='0'><thead>{header_row}</thead><tbody>")
+            for item in self.items[offset:offset + self.ROWS_PER_TABLE]:
+                buffer.write("<tr>")
+                for text in self.row_builder(item):
+                    buffer.write(f"<td>{html.escape(str(text))}</td>")
+                buffer.write("</tr>")
+            buffer.write("</tbody></table>")
+            self._report(min(offset + self.ROWS_PER_TABLE, total), total)
+
+        buffer.write("</body></html>")
+        return buffer.getvalue()
+
+    def _report(self, done, total):
+        now = time.monotonic()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL or done >= total:
+            self._last_progress = now
+            self.progress.emit(done, total)